@@ -0,0 +1,106 @@
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from instrumentation import percentile
+
+FRAME_MS = 1000 / 60  # Stały krok animacji - 60 klatek na sekundę
+MOVE_MS = 200  # Lot karty ze stosu na stos
+FLIP_MS = 160  # Odwrócenie odkrytej karty
+CHAIN_STAGGER_MS = 40  # Odstęp między kolejnymi kartami łańcucha automatycznego kończenia gry
+
+
+def ease_out(t):
+    """Szybki start i łagodne lądowanie"""
+    return 1 - (1 - t) ** 3
+
+
+# Jedna animacja: step(postęp 0..1) wywoływane co klatkę, done() po ostatniej klatce
+class Tween:
+    __slots__ = ('start', 'duration', 'step', 'done')
+
+    def __init__(self, start, duration, step, done):
+        self.start = start
+        self.duration = duration
+        self.step = step
+        self.done = done
+
+
+# Wspólny harmonogram wszystkich animacji planszy - jeden timer o stałym kroku zamiast timera dla każdej karty
+class Animator(QObject):
+    finished = pyqtSignal()  # Wszystkie animacje zakończone
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.enabled = True
+        self.tweens = {}  # Klucz (animowany obiekt) -> Tween; nowa animacja obiektu zastępuje poprzednią
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(round(FRAME_MS))
+        self.timer.timeout.connect(self.tick)
+        self.last_tick = None
+        self.frames = 0  # Narysowane klatki animacji
+        self.dropped_frames = 0  # Klatki pominięte, bo poprzednia trwała dłużej niż krok animacji
+        self.frame_times = deque(maxlen=500)  # Czas pracy jednej klatki [ms]
+
+    def busy(self):
+        return bool(self.tweens)
+
+    def is_running(self, key):
+        return key in self.tweens
+
+    def add(self, key, duration, step, done=None, delay=0):
+        """Zleca animację obiektu key; postęp liczony z zegara, więc opóźniona klatka nie spowalnia ruchu"""
+        self.tweens.pop(key, None)
+        self.tweens[key] = Tween(time.perf_counter() + delay / 1000, duration / 1000, step, done)
+        if not self.timer.isActive():
+            self.last_tick = time.perf_counter()
+            self.timer.start()
+
+    def finish(self, key):
+        """Natychmiastowe zakończenie animacji obiektu (np. przed kolejnym lotem tej samej karty)"""
+        tween = self.tweens.pop(key, None)
+        if tween is not None:
+            self.complete(tween)
+
+    def finish_all(self):
+        """Przeskok wszystkich animacji do końca (nowe rozdanie, zmiana rozmiaru kart, zamknięcie okna)"""
+        tweens, self.tweens = self.tweens, {}
+        for tween in tweens.values():
+            self.complete(tween)
+        self.stop()
+
+    @staticmethod
+    def complete(tween):
+        tween.step(1.0)
+        if tween.done is not None:
+            tween.done()
+
+    def tick(self):
+        now = time.perf_counter()
+        # Przerwa dłuższa niż krok animacji oznacza klatki, których nie zdążono narysować
+        self.dropped_frames += max(0, round((now - self.last_tick) * 1000 / FRAME_MS) - 1)
+        self.last_tick = now
+        self.frames += 1
+        # Kolejność zlecenia zachowana - karty jednego ciągu lądują od spodu
+        for key, tween in list(self.tweens.items()):
+            if now < tween.start:
+                continue  # Karta łańcucha czeka na swoją kolej
+            progress = min(1.0, (now - tween.start) / tween.duration)
+            tween.step(ease_out(progress))
+            if progress >= 1.0 and self.tweens.get(key) is tween:
+                del self.tweens[key]
+                if tween.done is not None:
+                    tween.done()
+        self.frame_times.append((time.perf_counter() - now) * 1000)
+        if not self.tweens:
+            self.stop()
+
+    def stop(self):
+        if self.timer.isActive():
+            self.timer.stop()
+            self.finished.emit()
+
+    def stats(self):
+        return {'frames': self.frames, 'dropped_frames': self.dropped_frames,
+                'frame_ms_p95': percentile(sorted(self.frame_times), 0.95)}
@@ -0,0 +1,366 @@
+import argparse
+import time
+
+import numpy as np
+
+from game_logic import GameLogic, SUIT_COLORS, KING, DRAW_MOVE
+from zobrist import MAX_COLUMN
+
+# Tablice cech kart indeksowane kodem; kod -1 (puste pole) trafia na ostatni element - wartownika
+VALUE = np.array([code % 13 + 1 for code in range(52)] + [0], dtype=np.int8)
+SUIT = np.array([code // 13 for code in range(52)] + [0], dtype=np.int8)
+COLOR = np.array([SUIT_COLORS[code // 13] for code in range(52)] + [0], dtype=np.int8)
+
+# Stała numeracja ruchów - te same numery w silniku wsadowym i w GameLogic (action_id)
+A_DRAW = 0  # Dobranie z talii lub odtworzenie talii
+A_WASTE_FOUNDATION = 1
+A_WASTE_TABLEAU = 2  # + kolumna docelowa
+A_TABLEAU_FOUNDATION = 9  # + kolumna źródłowa
+A_TABLEAU_TABLEAU = 16  # + źródło * 7 + cel
+A_FOUNDATION_TABLEAU = 65  # + stos docelowy * 7 + cel
+ACTIONS = 93
+
+# Priorytety polityki zachłannej (0 - ruch pomijany); przy remisie wygrywa niższy numer ruchu
+P_DRAW, P_WASTE_TABLEAU, P_REVEAL, P_FOUNDATION = 1, 2, 3, 4
+
+
+def action_id(game, move):
+    """Numer ruchu GameLogic w numeracji silnika wsadowego"""
+    source, destination, count = move
+    if source[0] == 'stock':
+        return A_DRAW
+    if source[0] == 'waste':
+        if destination[0] == 'foundation':
+            return A_WASTE_FOUNDATION
+        return A_WASTE_TABLEAU + destination[1]
+    if source[0] == 'foundation':
+        return A_FOUNDATION_TABLEAU + source[1] * 7 + destination[1]
+    if destination[0] == 'foundation':
+        return A_TABLEAU_FOUNDATION + source[1]
+    return A_TABLEAU_TABLEAU + source[1] * 7 + destination[1]
+
+
+def greedy_priority(game, move):
+    """Priorytet ruchu w polityce zachłannej (wersja skalarna dla GameLogic)"""
+    source, destination, count = move
+    if destination[0] == 'foundation':
+        return P_FOUNDATION
+    if source[0] == 'tableau':
+        hidden = game.hidden[source[1]]
+        return P_REVEAL if hidden > 0 and count == len(game.tableau[source[1]]) - hidden else 0
+    if source[0] == 'waste':
+        return P_WASTE_TABLEAU
+    if source[0] == 'stock':
+        return P_DRAW
+    return 0
+
+
+def scalar_playout(seed, policy='greedy', uniforms=None, max_moves=500):
+    """Ta sama rozgrywka na GameLogic - punkt odniesienia dla silnika wsadowego.
+
+    uniforms: liczby losowe z przedziału [0, 1) dla kolejnych ruchów (polityka 'random').
+    Zwraca (wygrana, ruchy, punkty).
+    """
+    game = GameLogic(seed)
+    idle_draws = 0  # Dobrania od ostatniego ruchu innego niż dobranie
+    while game.moves < max_moves and not game.check_win_condition():
+        moves = sorted(((action_id(game, move), move) for move in game.legal_moves()), key=lambda pair: pair[0])
+        if policy == 'random':
+            if not moves:
+                break
+            move = moves[int(uniforms[game.moves] * len(moves))][1]
+        else:
+            cycle = len(game.stock) + len(game.waste) + 1
+            best, move = 0, None
+            for _, candidate in moves:
+                priority = greedy_priority(game, candidate)
+                if candidate == DRAW_MOVE and idle_draws >= cycle:
+                    priority = 0  # Pełny obieg talii bez postępu - gra utknęła
+                if priority > best:
+                    best, move = priority, candidate
+            if move is None:
+                break
+        idle_draws = idle_draws + 1 if move == DRAW_MOVE else 0
+        game.apply_move(move)
+    return game.check_win_condition(), game.moves, game.score
+
+
+# N gier trzymanych w tablicach NumPy - reguły sprawdzane i ruchy wykonywane dla wszystkich gier naraz
+class BatchGames:
+    def __init__(self, seeds):
+        """Rozdania z GameLogic (to samo tasowanie), przepisane do tablic"""
+        self.seeds = np.asarray(list(seeds), dtype=np.int64)
+        n = len(self.seeds)
+        self.n = n
+        self.stock = np.full((n, 52), -1, dtype=np.int8)  # Kody kart, wierzch na pozycji stock_len - 1
+        self.waste = np.full((n, 52), -1, dtype=np.int8)
+        self.tableau = np.full((n, 7, MAX_COLUMN), -1, dtype=np.int8)
+        self.stock_len = np.zeros(n, dtype=np.int16)
+        self.waste_len = np.zeros(n, dtype=np.int16)
+        self.tableau_len = np.zeros((n, 7), dtype=np.int16)
+        # Zakryte karty tworzą zawsze spód kolumny, więc maska odkrycia to pozycja >= hidden
+        self.hidden = np.zeros((n, 7), dtype=np.int16)
+        self.foundation_len = np.zeros((n, 4), dtype=np.int16)  # Stos docelowy = kolor, długość = wartość wierzchu
+        self.score = np.zeros(n, dtype=np.int32)
+        self.moves = np.zeros(n, dtype=np.int32)
+        self.idle_draws = np.zeros(n, dtype=np.int32)
+
+        # Układ rozdania jest zawsze ten sam (kolumna i ma i + 1 kart, i zakrytych), więc wystarczy kolejność kart
+        game = GameLogic(0)
+        stocks, columns = [], []
+        for seed in self.seeds.tolist():
+            game.new_game(seed)
+            stocks.append([card.code for card in game.stock])
+            columns.append([card.code for pile in game.tableau for card in pile])
+        self.stock[:, :24] = np.array(stocks, dtype=np.int8).reshape(n, 24)
+        self.stock_len[:] = 24
+        columns = np.array(columns, dtype=np.int8).reshape(n, 28)
+        start = 0
+        for i in range(7):
+            self.tableau[:, i, :i + 1] = columns[:, start:start + i + 1]
+            start += i + 1
+        self.tableau_len[:] = np.arange(1, 8)
+        self.hidden[:] = np.arange(7)
+
+    # Metody sprawdzania reguł (wektorowo dla wszystkich gier)
+    def won(self):
+        return self.foundation_len.sum(axis=1) == 52
+
+    @staticmethod
+    def valid_for_foundation(foundation_len, codes):
+        """Wektorowy odpowiednik GameLogic.is_valid_for_foundation dla stosu w kolorze karty"""
+        needed = np.take_along_axis(foundation_len, SUIT[codes].astype(np.intp), axis=-1) + 1
+        return (codes >= 0) & (VALUE[codes] == needed)
+
+    @staticmethod
+    def valid_for_tableau(values, colors, top_values, top_colors, empty):
+        """Wektorowy odpowiednik GameLogic.is_valid_for_tableau (tablice dowolnego kształtu)"""
+        return np.where(empty, values == KING, (values == top_values - 1) & (colors != top_colors) & (values > 0))
+
+    def legal_moves(self, rows):
+        """Maska dozwolonych ruchów (len(rows), ACTIONS) i liczba kart dla ruchów między kolumnami"""
+        n = len(rows)
+        legal = np.zeros((n, ACTIONS), dtype=bool)
+        tableau = self.tableau[rows]
+        tableau_len = self.tableau_len[rows]
+        hidden = self.hidden[rows]
+        foundation_len = self.foundation_len[rows]
+        stock_len = self.stock_len[rows]
+        waste_len = self.waste_len[rows]
+
+        tops = np.take_along_axis(tableau, np.maximum(tableau_len - 1, 0)[:, :, None], axis=2)[:, :, 0]
+        tops = np.where(tableau_len > 0, tops, -1)
+        top_values, top_colors = VALUE[tops], COLOR[tops]
+        empty = tableau_len == 0
+
+        legal[:, A_DRAW] = (stock_len > 0) | (waste_len > 0)
+
+        waste = np.where(waste_len > 0, self.waste[rows, np.maximum(waste_len - 1, 0)], -1)
+        legal[:, A_WASTE_FOUNDATION] = self.valid_for_foundation(foundation_len, waste[:, None])[:, 0]
+        legal[:, A_WASTE_TABLEAU:A_WASTE_TABLEAU + 7] = (waste >= 0)[:, None] & self.valid_for_tableau(
+            VALUE[waste][:, None], COLOR[waste][:, None], top_values, top_colors, empty)
+
+        legal[:, A_TABLEAU_FOUNDATION:A_TABLEAU_FOUNDATION + 7] = self.valid_for_foundation(foundation_len, tops)
+
+        # Odkryty ciąg kolumny to kolejne wartości w naprzemiennych kolorach: od bases (najwyższa) do tops
+        bases = np.take_along_axis(tableau, np.minimum(hidden, MAX_COLUMN - 1)[:, :, None], axis=2)[:, :, 0]
+        base_values = VALUE[bases][:, :, None].astype(np.int16)
+        base_colors = COLOR[bases][:, :, None]
+        wanted = np.where(empty, KING, top_values - 1)[:, None, :]  # Wartość karty przyjmowanej przez cel
+        offset = base_values - wanted  # Pozycja tej karty w ciągu źródła (licząc od spodu ciągu)
+        source_colors = base_colors ^ (offset & 1)
+        movable = (~empty)[:, :, None] & (offset >= 0) & (wanted >= top_values[:, :, None]) & (wanted > 0)
+        movable &= empty[:, None, :] | (source_colors != top_colors[:, None, :])
+        movable &= ~np.eye(7, dtype=bool)[None]
+        counts = tableau_len[:, :, None] - hidden[:, :, None] - offset
+        legal[:, A_TABLEAU_TABLEAU:A_TABLEAU_TABLEAU + 49] = movable.reshape(n, 49)
+
+        found_values = foundation_len[:, :, None]
+        found_colors = np.array(SUIT_COLORS, dtype=np.int8)[None, :, None]
+        legal[:, A_FOUNDATION_TABLEAU:] = ((found_values > 0) & self.valid_for_tableau(
+            found_values, found_colors, top_values[:, None, :], top_colors[:, None, :], empty[:, None, :])).reshape(n, 28)
+        return legal, counts.reshape(n, 49)
+
+    def greedy_priorities(self, rows, legal, counts):
+        priority = np.zeros(legal.shape, dtype=np.int8)
+        cycle = self.stock_len[rows].astype(np.int32) + self.waste_len[rows] + 1
+        priority[:, A_DRAW] = np.where(self.idle_draws[rows] < cycle, P_DRAW, 0)
+        priority[:, A_WASTE_FOUNDATION] = P_FOUNDATION
+        priority[:, A_WASTE_TABLEAU:A_WASTE_TABLEAU + 7] = P_WASTE_TABLEAU
+        priority[:, A_TABLEAU_FOUNDATION:A_TABLEAU_FOUNDATION + 7] = P_FOUNDATION
+        hidden = self.hidden[rows]
+        reveal = (hidden > 0)[:, :, None] & (counts.reshape(-1, 7, 7) == (self.tableau_len[rows] - hidden)[:, :, None])
+        priority[:, A_TABLEAU_TABLEAU:A_TABLEAU_TABLEAU + 49] = np.where(reveal.reshape(-1, 49), P_REVEAL, 0)
+        return np.where(legal, priority, 0)
+
+    # Wykonanie wybranych ruchów - każda grupa ruchów jednym przypisaniem na tablicach
+    def apply(self, rows, actions, counts):
+        """Wykonuje actions[k] w grze rows[k] (po jednym ruchu na grę)"""
+        score_delta = np.zeros(len(rows), dtype=np.int32)
+
+        draw = actions == A_DRAW
+        self.idle_draws[rows[draw]] += 1
+        self.idle_draws[rows[~draw]] = 0
+        self.draw(rows[draw])
+
+        pick = (actions == A_WASTE_FOUNDATION) | ((actions >= A_WASTE_TABLEAU) & (actions < A_TABLEAU_FOUNDATION))
+        r = rows[pick]
+        cards = self.waste[r, self.waste_len[r] - 1]
+        self.waste[r, self.waste_len[r] - 1] = -1
+        self.waste_len[r] -= 1
+        to_tableau = actions[pick] != A_WASTE_FOUNDATION
+        self.push_foundation(r[~to_tableau], cards[~to_tableau])
+        self.push_tableau(r[to_tableau], actions[pick][to_tableau] - A_WASTE_TABLEAU, cards[to_tableau])
+        score_delta[pick] += np.where(to_tableau, 5, 10)
+
+        pick = (actions >= A_TABLEAU_FOUNDATION) & (actions < A_TABLEAU_TABLEAU)
+        r = rows[pick]
+        columns = actions[pick] - A_TABLEAU_FOUNDATION
+        cards = self.tableau[r, columns, self.tableau_len[r, columns] - 1]
+        self.push_foundation(r, cards)
+        score_delta[pick] += 10 + 5 * self.pop_tableau(r, columns, 1)
+
+        pick = (actions >= A_TABLEAU_TABLEAU) & (actions < A_FOUNDATION_TABLEAU)
+        r = rows[pick]
+        sources, destinations = np.divmod(actions[pick] - A_TABLEAU_TABLEAU, 7)
+        self.move_run(r, sources, destinations, counts[pick])
+        score_delta[pick] += 5 * self.pop_tableau(r, sources, counts[pick])
+
+        pick = actions >= A_FOUNDATION_TABLEAU
+        r = rows[pick]
+        suits, destinations = np.divmod(actions[pick] - A_FOUNDATION_TABLEAU, 7)
+        self.foundation_len[r, suits] -= 1
+        self.push_tableau(r, destinations, (suits * 13 + self.foundation_len[r, suits]).astype(np.int8))
+        score_delta[pick] -= 15
+
+        self.score[rows] = np.maximum(self.score[rows] + score_delta, 0)
+        self.moves[rows] += 1
+
+    def draw(self, rows):
+        """Dobranie z talii, a przy pustej talii odtworzenie jej z odrzuconych (w odwrotnej kolejności)"""
+        has_stock = self.stock_len[rows] > 0
+        r = rows[has_stock]
+        self.waste[r, self.waste_len[r]] = self.stock[r, self.stock_len[r] - 1]
+        self.stock[r, self.stock_len[r] - 1] = -1
+        self.stock_len[r] -= 1
+        self.waste_len[r] += 1
+
+        r = rows[~has_stock]
+        positions = np.arange(52)
+        lengths = self.waste_len[r][:, None]
+        reversed_waste = np.take_along_axis(self.waste[r], np.maximum(lengths - 1 - positions, 0), axis=1)
+        self.stock[r] = np.where(positions < lengths, reversed_waste, -1)
+        self.stock_len[r] = self.waste_len[r]
+        self.waste[r] = -1
+        self.waste_len[r] = 0
+
+    def push_foundation(self, rows, cards):
+        self.foundation_len[rows, SUIT[cards]] += 1
+
+    def push_tableau(self, rows, columns, cards):
+        self.tableau[rows, columns, self.tableau_len[rows, columns]] = cards
+        self.tableau_len[rows, columns] += 1
+
+    def pop_tableau(self, rows, columns, counts):
+        """Zdejmuje karty z kolumn; zwraca 1 tam, gdzie odkryto zakrytą kartę"""
+        positions = np.arange(MAX_COLUMN)
+        lengths = self.tableau_len[rows, columns] - counts
+        removed = positions[None, :] >= lengths[:, None]
+        self.tableau[rows, columns] = np.where(removed, -1, self.tableau[rows, columns])
+        self.tableau_len[rows, columns] = lengths
+        flipped = (lengths > 0) & (self.hidden[rows, columns] == lengths)
+        self.hidden[rows, columns] -= flipped
+        return flipped.astype(np.int32)
+
+    def move_run(self, rows, sources, destinations, counts):
+        """Kopiuje ciągi kart z wierzchu kolumn źródłowych na kolumny docelowe (bez zdejmowania)"""
+        positions = np.arange(MAX_COLUMN)
+        start = (self.tableau_len[rows, sources] - counts)[:, None] + positions
+        run = np.take_along_axis(self.tableau[rows, sources], np.minimum(start, MAX_COLUMN - 1), axis=1)
+        k, offset = np.nonzero(positions[None, :] < counts[:, None])
+        self.tableau[rows[k], destinations[k], self.tableau_len[rows[k], destinations[k]] + offset] = run[k, offset]
+        self.tableau_len[rows, destinations] += counts
+
+    # Rozgrywki
+    def playout(self, policy='greedy', max_moves=500, rng_seed=0):
+        """Rozgrywa wszystkie gry krok po kroku (jeden ruch w każdej aktywnej grze na krok).
+
+        Polityka 'random' wybiera ruch jednostajnie z dozwolonych (w kolejności numerów ruchów)
+        na podstawie liczb z np.random.default_rng(rng_seed) - po N liczb na krok.
+        Zwraca maskę wygranych gier.
+        """
+        rng = np.random.default_rng(rng_seed)
+        rows = np.nonzero(~self.won())[0]  # Gry jeszcze rozgrywane - tylko one są liczone w kolejnych krokach
+        for _ in range(max_moves):
+            uniforms = rng.random(self.n)[rows] if policy == 'random' else None
+            if not len(rows):
+                break
+            legal, counts = self.legal_moves(rows)
+            if policy == 'random':
+                totals = legal.sum(axis=1)
+                ranks = (uniforms * totals).astype(np.int64)
+                actions = np.argmax(np.cumsum(legal, axis=1) > ranks[:, None], axis=1)
+                playable = totals > 0
+            else:
+                priority = self.greedy_priorities(rows, legal, counts)
+                actions = np.argmax(priority, axis=1)
+                playable = priority[np.arange(len(rows)), actions] > 0
+            run_counts = counts[np.arange(len(rows)), np.clip(actions - A_TABLEAU_TABLEAU, 0, 48)]
+            rows, actions, run_counts = rows[playable], actions[playable], run_counts[playable]
+            self.apply(rows, actions, run_counts.astype(np.int16))
+            rows = rows[self.foundation_len[rows].sum(axis=1) < 52]
+        return self.won()
+
+
+def random_uniforms(rng_seed, n, max_moves):
+    """Liczby losowe użyte przez BatchGames.playout('random') - kolumna n to kolejne ruchy gry n"""
+    return np.random.default_rng(rng_seed).random((max_moves, n))
+
+
+def verify(seeds, policy, max_moves, rng_seed=0):
+    """Porównuje wyniki silnika wsadowego z GameLogic; zwraca listę ziaren z różnicami"""
+    seeds = list(seeds)
+    batch = BatchGames(seeds)
+    won = batch.playout(policy, max_moves, rng_seed)
+    uniforms = random_uniforms(rng_seed, len(seeds), max_moves) if policy == 'random' else None
+    mismatches = []
+    for k, seed in enumerate(seeds):
+        column = uniforms[:, k] if uniforms is not None else None
+        expected = scalar_playout(seed, policy, column, max_moves)
+        if expected != (bool(won[k]), int(batch.moves[k]), int(batch.score[k])):
+            mismatches.append(seed)
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wsadowe rozgrywki w NumPy: porównanie z GameLogic i pomiar gier/s")
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--start', type=int, default=0, help="pierwsze ziarno")
+    parser.add_argument('--policy', choices=['greedy', 'random'], default='greedy')
+    parser.add_argument('--max-moves', type=int, default=500)
+    parser.add_argument('--verify', type=int, default=200, help="liczba gier sprawdzanych z GameLogic")
+    args = parser.parse_args()
+
+    seeds = range(args.start, args.start + args.games)
+    start = time.perf_counter()
+    batch = BatchGames(seeds)
+    won = batch.playout(args.policy, args.max_moves)
+    batch_time = time.perf_counter() - start
+
+    scalar_seeds = seeds[:args.verify]
+    uniforms = random_uniforms(0, len(scalar_seeds), args.max_moves) if args.policy == 'random' else None
+    start = time.perf_counter()
+    for k, seed in enumerate(scalar_seeds):
+        scalar_playout(seed, args.policy, uniforms[:, k] if uniforms is not None else None, args.max_moves)
+    scalar_time = time.perf_counter() - start
+
+    mismatches = verify(scalar_seeds, args.policy, args.max_moves)
+    print(f"Polityka: {args.policy}, gry: {args.games}, wygrane: {int(won.sum())} ({won.mean():.1%})")
+    print(f"  NumPy (wsadowo):  {args.games / batch_time:10,.0f} gier/s")
+    print(f"  GameLogic (pętla): {len(scalar_seeds) / scalar_time:10,.0f} gier/s")
+    print(f"  Zgodność z GameLogic: {len(scalar_seeds) - len(mismatches)}/{len(scalar_seeds)}"
+          + (f" (różnice: {mismatches[:10]})" if mismatches else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Skrypty pomiarowe uruchamiane z katalogu głównego projektu, np. `python -m benchmarks.bench_undo`"""
@@ -0,0 +1,139 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Pomiar bez wyświetlania okna
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEventLoop
+
+from benchmarks.common import make_window, report
+from instrumentation import percentile
+
+
+# Sumy z mierzonych animacji (ruchy przygotowujące pozycję nie są liczone)
+class Measurement:
+    def __init__(self):
+        self.moves = 0
+        self.elapsed = 0.0
+        self.frames = 0
+        self.dropped_frames = 0
+        self.frame_times = []
+
+
+def wait_for_animations(app, window, measurement=None):
+    """Pętla zdarzeń (z rysowaniem) do wylądowania ostatniej karty"""
+    animator = window.animator
+    frames, dropped = animator.frames, animator.dropped_frames
+    animator.frame_times.clear()
+    start = time.perf_counter()
+    app.processEvents()  # Odświeżenie planszy zlecone przez ruch - dopiero ono uruchamia animacje
+    if animator.busy():
+        loop = QEventLoop()
+        animator.finished.connect(loop.quit)
+        loop.exec_()
+        animator.finished.disconnect(loop.quit)
+    if measurement is not None:
+        measurement.moves += 1
+        measurement.elapsed += time.perf_counter() - start
+        measurement.frames += animator.frames - frames
+        measurement.dropped_frames += animator.dropped_frames - dropped
+        measurement.frame_times.extend(animator.frame_times)
+
+
+def source_of(game, move):
+    """Opis źródła ruchu tak, jak przy przeciąganiu (kolumna: indeks pierwszej przenoszonej karty)"""
+    (source_type, source_idx), _, count = move
+    if source_type == 'tableau':
+        return source_type, source_idx, len(game.tableau[source_idx]) - count
+    return source_type, source_idx
+
+
+def stack_moves(app, window, count, rng, measurement):
+    """Przeniesienia ciągów co najmniej dwóch kart między kolumnami"""
+    while measurement.moves < count:
+        window.start_new_game()
+        app.processEvents()
+        for _ in range(300):
+            moves = window.game.legal_moves()
+            stacks = [m for m in moves if m[0][0] == 'tableau' and m[1][0] == 'tableau' and m[2] >= 2]
+            if stacks:
+                move = rng.choice(stacks)
+                window.handle_drop(source_of(window.game, move), move[1])
+                wait_for_animations(app, window, measurement)
+                break
+            non_stock = [m for m in moves if m[0][0] != 'stock']
+            if non_stock and rng.random() < 0.7:
+                move = rng.choice(non_stock)
+                window.handle_drop(source_of(window.game, move), move[1])
+            else:
+                window.handle_stock_click()
+            wait_for_animations(app, window)
+
+
+def auto_complete_chains(app, window, count, measurement):
+    """Ruch rozstrzygający partię i łańcuch automatycznego kończenia gry (solver szuka rozwiązywalnych rozdań).
+
+    Zwraca liczbę kart, które poleciały w łańcuchach.
+    """
+    from solver import KlondikeSolver
+    chain_cards = 0
+    seed = 0
+    while measurement.moves < count:
+        seed += 1
+        window.start_new_game()
+        window.game.new_game(seed, rules=window.rules)
+        result = KlondikeSolver(max_nodes=20000).solve(window.game.clone())
+        if not result.won:
+            continue
+        game = window.game.clone()
+        for k, move in enumerate(result.moves):
+            game.apply_move(move)
+            if game.can_auto_complete():
+                break
+        last = result.moves[k]
+        if last[0][0] == 'stock':
+            continue
+        for move in result.moves[:k]:
+            window.game.apply_move(move)
+        window.update_board_from_logic()
+        app.processEvents()
+        before = sum(map(len, window.game.foundations))
+        window.handle_drop(source_of(window.game, last), last[1])
+        chain_cards += sum(map(len, window.game.foundations)) - before
+        wait_for_animations(app, window, measurement)
+    return chain_cards
+
+
+def main():
+    from main_window import BOARD_VIEWS
+    parser = argparse.ArgumentParser(description="Płynność animacji ruchów: klatki, pominięte klatki i czas pracy klatki")
+    parser.add_argument('--board', choices=BOARD_VIEWS, default='widgets')
+    parser.add_argument('--stacks', type=int, default=20, help="liczba przeniesień ciągów kart")
+    parser.add_argument('--chains', type=int, default=3, help="liczba łańcuchów automatycznego kończenia gry")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    window = make_window(args.board)
+
+    stacks = Measurement()
+    stack_moves(app, window, args.stacks, random.Random(args.seed), stacks)
+    chains = Measurement()
+    chain_cards = auto_complete_chains(app, window, args.chains, chains)
+
+    for title, m, note in [("Przeniesienia ciągów kart", stacks, ""),
+                           ("Automatyczne kończenie gry", chains, f"  ({chain_cards} kart w łańcuchach)")]:
+        rows = [("ruchy", f"{m.moves:8d}{note}"),
+                ("czas animacji", f"{m.elapsed:8.2f} s"),
+                ("klatki / s", f"{m.frames / m.elapsed if m.elapsed else 0:8.1f}"),
+                ("pominięte klatki", f"{m.dropped_frames:8d}  ({m.dropped_frames / max(m.frames + m.dropped_frames, 1):.1%})"),
+                ("praca klatki p95", f"{percentile(sorted(m.frame_times), 0.95):8.3f} ms")]
+        report(f"{title} (plansza '{args.board}')", rows)
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
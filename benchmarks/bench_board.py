@@ -0,0 +1,78 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Pomiar bez wyświetlania okna
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.common import make_window, random_action, report
+from instrumentation import percentile
+
+
+def resident_memory_mb():
+    """Pamięć rezydentna procesu (tylko Linux - None na innych systemach)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        return None
+
+
+def measure(board_view, moves, seed):
+    app = QApplication(sys.argv[:1])
+    window = make_window(board_view)
+    window.game.new_game(seed)
+    window.update_board_from_logic()
+
+    rng = random.Random(seed)
+    update_times = []
+    paint_times = []
+    for _ in range(moves):
+        random_action(window.game, rng)
+        start = time.perf_counter()
+        window.update_board_from_logic()
+        update_times.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        window.main_game_widget.grab()  # Pełne narysowanie widoku gry (wszystkie karty i pola)
+        paint_times.append((time.perf_counter() - start) * 1000)
+    app.processEvents()
+
+    update_times.sort()
+    paint_times.sort()
+    memory = resident_memory_mb()
+    rows = [
+        ("odświeżenie p50", f"{percentile(update_times, 0.5):8.3f} ms"),
+        ("odświeżenie p95", f"{percentile(update_times, 0.95):8.3f} ms"),
+        ("rysowanie p50", f"{percentile(paint_times, 0.5):8.3f} ms"),
+        ("rysowanie p95", f"{percentile(paint_times, 0.95):8.3f} ms"),
+        ("widżety", f"{len(QApplication.allWidgets()):8d}"),
+        ("elementy sceny", f"{len(window.scene_board.scene().items()) if window.scene_board else 0:8d}"),
+        ("pamięć (RSS)", f"{memory:8.1f} MB" if memory is not None else "     brak"),
+    ]
+    report(f"Plansza '{board_view}': {moves} ruchów", rows)
+    window.close()
+
+
+def main():
+    from main_window import BOARD_VIEWS
+    parser = argparse.ArgumentParser(description="Porównanie planszy z widżetów i planszy na scenie: odświeżanie, rysowanie, pamięć")
+    parser.add_argument('--board', choices=BOARD_VIEWS, default=None, help="tylko jeden sposób rysowania (domyślnie oba)")
+    parser.add_argument('--moves', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if args.board is not None:
+        measure(args.board, args.moves, args.seed)
+        return
+    # Każda plansza w osobnym procesie - pamięć jednej nie zawyża wyniku drugiej
+    for board_view in BOARD_VIEWS:
+        subprocess.run([sys.executable, '-m', 'benchmarks.bench_board', '--board', board_view,
+                        '--moves', str(args.moves), '--seed', str(args.seed)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Pomiar bez wyświetlania okna
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.common import make_window, random_action, report
+from instrumentation import percentile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Czas odświeżenia planszy po każdym ruchu (MainWindow.update_board_from_logic)")
+    parser.add_argument('--moves', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = make_window()
+
+    rng = random.Random(args.seed)
+    frame_times = []
+    for _ in range(args.moves):
+        random_action(window.game, rng)
+        start = time.perf_counter()
+        window.update_board_from_logic()
+        frame_times.append((time.perf_counter() - start) * 1000)
+    app.processEvents()
+
+    frame_times.sort()
+    report(f"Odświeżenia planszy: {args.moves}", [
+        ("mediana", f"{percentile(frame_times, 0.5):8.3f} ms"),
+        ("p95", f"{percentile(frame_times, 0.95):8.3f} ms"),
+        ("maksimum", f"{max(frame_times):8.3f} ms"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
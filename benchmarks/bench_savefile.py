@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from game_logic import GameLogic
+from savefile import ArchiveWriter, iter_archive
+from benchmarks.common import random_action, report
+
+
+# Dawny sposób: stan gry jako słownik (jak w GameLogic.save_state) zapisany w JSON, jedna gra na linię
+def naive_state(game):
+    return {
+        'seed': game.seed,
+        'stock': [card.card_data for card in game.stock],
+        'waste': [card.card_data for card in game.waste],
+        'foundations': [[card.card_data for card in pile] for pile in game.foundations],
+        'tableau': [[(card.suit, card.rank, card.face_up) for card in pile] for pile in game.tableau],
+        'score': game.score,
+        'moves': game.moves,
+    }
+
+
+def played_games(count, moves):
+    """Rozdania o kolejnych ziarnach rozegrane losowo do zadanej liczby akcji"""
+    games = []
+    for seed in range(count):
+        game = GameLogic(seed)
+        rng = random.Random(seed)
+        for _ in range(moves):
+            random_action(game, rng)
+        games.append(game)
+    return games
+
+
+def run_archive(games, path, mode):
+    """Zapis i odczyt (z odtworzeniem gry) archiwum binarnego; zwraca (zapis/s, odczyt/s, bajty na grę)"""
+    start = time.perf_counter()
+    with ArchiveWriter(path, mode) as writer:
+        for game in games:
+            writer.write(game)
+    write_time = time.perf_counter() - start
+    start = time.perf_counter()
+    restored = sum(1 for record in iter_archive(path) if record.restore())
+    read_time = time.perf_counter() - start
+    assert restored == len(games)
+    return len(games) / write_time, len(games) / read_time, os.path.getsize(path) / len(games)
+
+
+def run_json(games, path):
+    """To samo dla słowników stanu w JSON Lines"""
+    start = time.perf_counter()
+    with open(path, 'w', encoding='utf-8') as f:
+        for game in games:
+            f.write(json.dumps(naive_state(game)) + '\n')
+    write_time = time.perf_counter() - start
+    start = time.perf_counter()
+    with open(path, encoding='utf-8') as f:
+        restored = sum(1 for line in f if json.loads(line))
+    read_time = time.perf_counter() - start
+    assert restored == len(games)
+    return len(games) / write_time, len(games) / read_time, os.path.getsize(path) / len(games)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zapis i odczyt wielu gier: log odtworzeniowy vs migawka vs JSON")
+    parser.add_argument('--games', type=int, default=500)
+    parser.add_argument('--moves', type=int, default=150, help="liczba losowych akcji w każdej grze")
+    args = parser.parse_args()
+
+    games = played_games(args.games, args.moves)
+    with tempfile.TemporaryDirectory() as directory:
+        results = {
+            "log ruchów (.psj)": run_archive(games, os.path.join(directory, 'replay.psj'), 'replay'),
+            "migawka (.psj)": run_archive(games, os.path.join(directory, 'snapshot.psj'), 'snapshot'),
+            "słowniki stanu (.jsonl)": run_json(games, os.path.join(directory, 'games.jsonl')),
+        }
+
+    report(f"Gry: {args.games}, akcje na grę: {args.moves}", [
+        (name, f"zapis {write:10,.0f} gier/s   odczyt {read:10,.0f} gier/s   {size:8.1f} B/grę")
+        for name, (write, read, size) in results.items()])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import copy
+import random
+import time
+import tracemalloc
+
+from game_logic import GameLogic
+from benchmarks.common import random_action, report
+
+
+# Dawna ścieżka: pełna kopia stanu przed każdym ruchem (dawne GameLogic.save_state)
+def deepcopy_snapshot(game):
+    return {
+        'stock': copy.deepcopy(game.stock),
+        'waste': copy.deepcopy(game.waste),
+        'foundations': copy.deepcopy(game.foundations),
+        'tableau': copy.deepcopy(game.tableau),
+        'score': game.score,
+        'moves': game.moves,
+    }
+
+
+def run_journal(moves, seed):
+    """Ruchy z dziennikiem różnic; zwraca (czas na ruch, pamięć historii)"""
+    rng = random.Random(seed)
+    game = GameLogic(seed)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for _ in range(moves):
+        random_action(game, rng)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return elapsed / moves, memory
+
+
+def run_deepcopy(moves, seed):
+    """Te same ruchy z pełną kopią stanu zapisywaną przed każdym z nich"""
+    rng = random.Random(seed)
+    game = GameLogic(seed)
+    history = []
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for _ in range(moves):
+        history.append(deepcopy_snapshot(game))
+        random_action(game, rng)
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return elapsed / moves, memory
+
+
+def run_undo(moves, seed):
+    """Średni koszt odwrócenia pojedynczego wpisu dziennika"""
+    rng = random.Random(seed)
+    game = GameLogic(seed)
+    elapsed = 0.0
+    count = 0
+    for _ in range(moves):
+        if not random_action(game, rng):
+            continue
+        start = time.perf_counter()
+        game.revert(game.history.pop())
+        elapsed += time.perf_counter() - start
+        count += 1
+        random_action(game, rng)
+    return elapsed / max(count, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Koszt zapisu historii ruchów: dziennik różnic vs deepcopy")
+    parser.add_argument('--moves', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    journal_move, journal_mem = run_journal(args.moves, args.seed)
+    copy_move, copy_mem = run_deepcopy(args.moves, args.seed)
+    journal_undo = run_undo(args.moves, args.seed)
+
+    report(f"Ruchy: {args.moves}", [
+        ("dziennik - czas na ruch", f"{journal_move * 1e6:8.2f} µs"),
+        ("deepcopy - czas na ruch", f"{copy_move * 1e6:8.2f} µs"),
+        ("dziennik - pamięć historii", f"{journal_mem / 1024:8.1f} KiB"),
+        ("deepcopy - pamięć historii", f"{copy_mem / 1024:8.1f} KiB"),
+        ("dziennik - cofnięcie", f"{journal_undo * 1e6:8.2f} µs"),
+    ])
+
+
+if __name__ == "__main__":
+    main()
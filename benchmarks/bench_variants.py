@@ -0,0 +1,55 @@
+import argparse
+import random
+import time
+
+from game_logic import GameLogic
+from rules import VARIANTS
+from simulator import greedy_playout
+from benchmarks.common import report
+
+
+def random_playouts(rules, seeds, max_moves):
+    """Losowe rozgrywki na legal_moves(); zwraca (gry/s, ruchy/s)"""
+    moves = 0
+    start = time.perf_counter()
+    for seed in seeds:
+        game = GameLogic(seed, rules)
+        rng = random.Random(seed)
+        while game.moves < max_moves and not game.check_win_condition():
+            legal = game.legal_moves()
+            if not legal:
+                break
+            game.apply_move(rng.choice(legal))
+        moves += game.moves
+    elapsed = time.perf_counter() - start
+    return len(seeds) / elapsed, moves / elapsed
+
+
+def greedy_playouts(rules, seeds):
+    """Rozgrywki zachłanne (simulator.greedy_playout); zwraca (gry/s, odsetek wygranych)"""
+    wins = 0
+    start = time.perf_counter()
+    for seed in seeds:
+        wins += greedy_playout(GameLogic(seed, rules))
+    elapsed = time.perf_counter() - start
+    return len(seeds) / elapsed, wins / len(seeds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Przepustowość rozgrywek dla każdego wariantu zasad")
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--max-moves', type=int, default=300, help="limit ruchów losowej rozgrywki")
+    args = parser.parse_args()
+
+    seeds = range(args.games)
+    rows = []
+    for rules in VARIANTS:
+        random_games, random_moves = random_playouts(rules, seeds, args.max_moves)
+        greedy_games, win_rate = greedy_playouts(rules, seeds)
+        rows.append((rules.name, f"losowe {random_games:8,.0f} gier/s {random_moves:10,.0f} ruchów/s   "
+                                 f"zachłanne {greedy_games:7,.0f} gier/s  wygrane {win_rate:6.1%}"))
+    report(f"Gry na wariant: {args.games}", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import random
+
+BENCH_WINDOW_SIZE = (1200, 850)  # Karty 100 x 145 niezależnie od rozmiaru ekranu
+BENCH_APP_NAME = "Pasjans Klondike (pomiar)"  # Katalog danych pomiarów - autozapis i statystyki gracza nietknięte
+
+
+# Wspólne pomocnicze funkcje dla benchmarków
+def random_action(game, rng=random):
+    """Wykonuje losowy dozwolony ruch (lub dobranie z talii); zwraca True jeśli stan się zmienił"""
+    if rng.random() < 0.3:
+        return game.draw_from_stock()
+
+    sources = [('waste', 0)] if game.waste else []
+    sources += [('tableau', i) for i in range(7) if game.tableau[i]]
+    sources += [('foundation', i) for i in range(4) if game.foundations[i]]
+    if not sources:
+        return game.draw_from_stock()
+
+    source = rng.choice(sources)
+    pile = game.pile(*source)
+    if source[0] == 'tableau':
+        start = rng.choice([j for j, card in enumerate(pile) if card.face_up])
+    else:
+        start = len(pile) - 1
+    card_stack = pile[start:]
+
+    for i in range(4):
+        if game.attempt_move(card_stack, source, ('foundation', i)):
+            return True
+    for i in range(7):
+        if game.attempt_move(card_stack, source, ('tableau', i)):
+            return True
+    return game.draw_from_stock()
+
+
+def make_window(board_view='widgets'):
+    """Okno gry gotowe do pomiaru: grafiki wczytane, rozmiar BENCH_WINDOW_SIZE, pierwsze rozdanie narysowane.
+
+    QApplication musi już istnieć; dane aplikacji trafiają do katalogu BENCH_APP_NAME, a autozapis jest wyłączony.
+    """
+    from PyQt5.QtWidgets import QApplication
+    from main_window import MainWindow
+    app = QApplication.instance()
+    app.setApplicationName(BENCH_APP_NAME)
+    window = MainWindow(board_view=board_view)
+    window.show_stuck_message = lambda: None  # Okna dialogowe zatrzymałyby pomiar
+    window.show_win_message = lambda: None
+    window.autosave = lambda: None  # Zapis pliku po ruchu nie wchodzi do czasu odświeżenia
+    window.asset_loader.wait()
+    app.processEvents()
+    window.resize(*BENCH_WINDOW_SIZE)
+    window.apply_layout()
+    window.show()
+    window.show_game_and_start()
+    app.processEvents()  # Pierwsze rozdanie rysuje planista odświeżania w pętli zdarzeń - poza pomiarem
+    return window
+
+
+def report(title, rows):
+    """Wypisuje wyniki w formie prostej tabeli"""
+    print(f"\n{title}")
+    width = max(len(name) for name, _ in rows)
+    for name, value in rows:
+        print(f"  {name:<{width}}  {value}")
@@ -0,0 +1,267 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')  # Pomiar renderowania bez wyświetlania okna
+
+from game_logic import GameLogic
+from simulator import greedy_playout
+from benchmarks.common import make_window, random_action, report
+
+SEEDS = range(20)  # Stałe rozdania - wyniki porównywalne między commitami
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Rejestruje funkcję pomiarową; funkcja zwraca (liczba operacji, czas w sekundach)"""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def positions(moves_per_seed=40):
+    """Pozycje ze środka gry: po kilkudziesięciu losowych ruchach na stałych ziarnach"""
+    result = []
+    for seed in SEEDS:
+        game = GameLogic(seed)
+        rng = random.Random(seed)
+        for _ in range(moves_per_seed):
+            game.apply_move(rng.choice(game.legal_moves()))
+        result.append(game)
+    return result
+
+
+@benchmark('new_game')
+def bench_new_game():
+    game = GameLogic(0)
+    start = time.perf_counter()
+    for seed in range(2000):
+        game.new_game(seed)
+    return 2000, time.perf_counter() - start
+
+
+@benchmark('move_and_undo')
+def bench_move_and_undo():
+    """Ruch zapisany w dzienniku i jego cofnięcie (następca save_state/undo)"""
+    games = positions()
+    ops = 0
+    start = time.perf_counter()
+    for game in games:
+        for move in game.legal_moves():
+            game.apply_move(move)
+            game.revert(game.history.pop())
+            ops += 1
+    return ops, time.perf_counter() - start
+
+
+@benchmark('attempt_move')
+def bench_attempt_move():
+    """attempt_move dla każdej pary źródło-cel (większość prób jest odrzucana)"""
+    games = positions()
+    destinations = [('foundation', i) for i in range(4)] + [('tableau', i) for i in range(7)]
+    ops = 0
+    start = time.perf_counter()
+    for game in games:
+        sources = [('waste', 0)] if game.waste else []
+        sources += [('tableau', i) for i in range(7) if game.tableau[i]]
+        for source in sources:
+            card_stack = game.pile(*source)[-1:]
+            for destination in destinations:
+                if game.attempt_move(card_stack, source, destination):
+                    game.revert(game.history.pop())
+                ops += 1
+    return ops, time.perf_counter() - start
+
+
+@benchmark('legal_moves')
+def bench_legal_moves():
+    games = positions()
+    start = time.perf_counter()
+    for _ in range(50):
+        for game in games:
+            game.legal_moves()
+    return 50 * len(games), time.perf_counter() - start
+
+
+@benchmark('draw_cycle')
+def bench_draw_cycle():
+    """Przewijanie talii w kółko, razem z odtwarzaniem jej ze stosu odrzuconych"""
+    game = GameLogic(0)
+    start = time.perf_counter()
+    for _ in range(20000):
+        game.draw_from_stock()
+    return 20000, time.perf_counter() - start
+
+
+@benchmark('random_playout')
+def bench_random_playout():
+    """Pełne losowe rozgrywki (do 300 ruchów) - wynik w przeliczeniu na jedną grę"""
+    start = time.perf_counter()
+    for seed in SEEDS:
+        game = GameLogic(seed)
+        rng = random.Random(seed)
+        while game.moves < 300 and not game.check_win_condition():
+            game.apply_move(rng.choice(game.legal_moves()))
+    return len(SEEDS), time.perf_counter() - start
+
+
+@benchmark('greedy_playout')
+def bench_greedy_playout():
+    start = time.perf_counter()
+    for seed in SEEDS:
+        greedy_playout(GameLogic(seed))
+    return len(SEEDS), time.perf_counter() - start
+
+
+@benchmark('batch_greedy_playout')
+def bench_batch_greedy_playout():
+    """Zachłanne rozgrywki silnika NumPy (polityka z batch_engine) - wynik w przeliczeniu na jedną grę"""
+    from batch_engine import BatchGames
+    start = time.perf_counter()
+    BatchGames(range(2000)).playout('greedy')
+    return 2000, time.perf_counter() - start
+
+
+@benchmark('render_update')
+def bench_render_update():
+    """MainWindow.update_board_from_logic po losowych ruchach (platforma offscreen)"""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)  # Referencja utrzymuje aplikację przy życiu
+    window = make_window()
+    elapsed = 0.0
+    ops = 0
+    for seed in SEEDS[:5]:
+        window.game.new_game(seed)
+        window.update_board_from_logic()
+        rng = random.Random(seed)
+        for _ in range(60):
+            random_action(window.game, rng)
+            start = time.perf_counter()
+            window.update_board_from_logic()
+            elapsed += time.perf_counter() - start
+            ops += 1
+    window.close()
+    return ops, elapsed
+
+
+@benchmark('resize_relayout')
+def bench_resize_relayout():
+    """Zmiana rozmiaru okna z przeskalowaniem kart: MainWindow.apply_layout i odświeżenie planszy (platforma offscreen)"""
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = make_window()
+    window.game.new_game(SEEDS[0])
+    rng = random.Random(SEEDS[0])
+    for _ in range(30):
+        random_action(window.game, rng)
+    window.update_board_from_logic()
+    elapsed = 0.0
+    ops = 0
+    for _ in range(5):
+        for size in [(1200, 850), (1500, 1060), (900, 640), (1800, 1275)]:
+            window.resize(*size)
+            start = time.perf_counter()
+            window.apply_layout()
+            app.processEvents()  # Odświeżenie planszy zlecone planiście
+            elapsed += time.perf_counter() - start
+            ops += 1
+    window.resize_timer.stop()
+    window.close()
+    return ops, elapsed
+
+
+@benchmark('stats_record')
+def bench_stats_record():
+    """Zapis wyniku partii z aktualizacją zestawień (stats_store.write_result, WAL) - czas pracy wątku zapisu"""
+    import tempfile
+    from stats_store import GameResult, open_database, write_result, WON, LOST
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        connection = open_database(os.path.join(directory, 'stats.sqlite'))
+        aggregates = {}
+        start = time.perf_counter()
+        for seed in range(500):
+            result = GameResult('klondike', seed, WON if rng.random() < 0.3 else LOST, rng.randrange(60, 900),
+                                rng.randrange(0, 700), rng.randrange(1, 200), rng.randrange(4))
+            aggregates.update(write_result(connection, aggregates, result))
+        elapsed = time.perf_counter() - start
+        connection.close()
+    return 500, elapsed
+
+
+def measure(func, repeat):
+    """Uruchamia pomiar kilka razy; zwraca czasy na operację w mikrosekundach"""
+    per_op = []
+    ops = 0
+    for _ in range(repeat):
+        ops, elapsed = func()
+        per_op.append(elapsed / ops * 1e6)
+    return {'ops': ops, 'best_us': min(per_op), 'median_us': statistics.median(per_op),
+            'ops_per_second': 1e6 / min(per_op)}
+
+
+def current_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'local'
+
+
+def compare(results, baseline_path, threshold):
+    """Porównanie z zapisanymi wynikami; zwraca listę benchmarków wolniejszych o ponad próg"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['benchmarks']
+    rows, regressions = [], []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result['best_us'] / baseline[name]['best_us']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  <-- wolniej'
+            regressions.append(name)
+        rows.append((name, f"{ratio:6.2f}x czasu bazowego{flag}"))
+    report(f"Porównanie z {baseline_path}", rows)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarki logiki gry i renderowania planszy")
+    parser.add_argument('names', nargs='*', help="wybrane benchmarki (domyślnie wszystkie)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="plik JSON z wynikami (domyślnie benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', help="plik JSON z wcześniejszymi wynikami")
+    parser.add_argument('--threshold', type=float, default=0.10, help="dopuszczalne spowolnienie (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    names = args.names or list(BENCHMARKS)
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name], args.repeat)
+
+    report("Wyniki (najlepszy czas na operację)", [
+        (name, f"{r['best_us']:12.2f} µs   {r['ops_per_second']:14,.0f} op/s") for name, r in results.items()])
+
+    commit = current_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'commit': commit, 'python': platform.python_version(), 'machine': platform.machine(),
+                   'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'benchmarks': results}, f, indent=2)
+    print(f"\nZapisano: {output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
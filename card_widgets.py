@@ -1,8 +1,71 @@
 import os
-import ast
+import struct
 from PyQt5.QtWidgets import QLabel, QWidget
-from PyQt5.QtCore import Qt, QMimeData, pyqtSignal
-from PyQt5.QtGui import QPixmap, QDrag
+from PyQt5.QtCore import Qt, QMimeData, QByteArray, QRect, pyqtSignal
+from PyQt5.QtGui import QDrag, QPainter, QColor, QPen
+from textures import texture_cache, card_size_bucket, CARD_SIZE
+from instrumentation import profiler
+
+CARD_MIME_TYPE = 'application/x-pasjans-card'  # Przeciągana karta - inne dane (np. tekst z innych programów) są odrzucane
+# Opis źródła przeciągania: PID procesu, rodzaj stosu, numer stosu, indeks karty w kolumnie
+SOURCE_FORMAT = struct.Struct('<IBBB')
+SOURCE_TYPES = ('stock', 'waste', 'foundation', 'tableau')
+SOURCE_TYPE_IDS = {name: n for n, name in enumerate(SOURCE_TYPES)}
+LEGAL_DROP_COLOR = '#7CFC00'
+ILLEGAL_DROP_COLOR = '#ff4040'
+
+
+def encode_source(source):
+    """Źródło przeciągania ('tableau', kolumna, karta) / (stos, numer) -> bajty o stałej długości"""
+    card_idx = source[2] if len(source) > 2 else 0
+    return SOURCE_FORMAT.pack(os.getpid(), SOURCE_TYPE_IDS[source[0]], source[1], card_idx)
+
+
+def decode_source(mime_data):
+    """Odczyt źródła z danych przeciągania; None, gdy to nie jest karta przeciągana w tym procesie"""
+    if not mime_data.hasFormat(CARD_MIME_TYPE):
+        return None
+    data = bytes(mime_data.data(CARD_MIME_TYPE))
+    if len(data) != SOURCE_FORMAT.size:
+        return None
+    pid, type_id, pile_idx, card_idx = SOURCE_FORMAT.unpack(data)
+    if pid != os.getpid() or type_id >= len(SOURCE_TYPES):
+        return None
+    source_type = SOURCE_TYPES[type_id]
+    return (source_type, pile_idx, card_idx) if source_type == 'tableau' else (source_type, pile_idx)
+
+
+def card_size_for_window(width, height):
+    """Rozmiar karty dopasowany do okna (1200 x 850 -> karta 100 x 145), zaokrąglony do kubełka rozmiaru"""
+    return card_size_bucket(min(width / 12, height / 8.5))
+
+
+# Wymiary planszy zależne od rozmiaru karty - przeliczane tylko przy zmianie kubełka rozmiaru
+class CardMetrics:
+    def __init__(self, size=CARD_SIZE):
+        self.resize(size)
+
+    def resize(self, size):
+        self.width, self.height = size
+        scale = self.width / CARD_SIZE[0]
+        self.margin = round(10 * scale)  # Odstęp karty od krawędzi kolumny
+        self.stack_offset = round(30 * scale)  # Przesunięcie kolejnych kart w kolumnie
+        self.fan_offset = round(20 * scale)  # Rozłożone karty na stosie odrzuconych (dobieranie po 3)
+        self.column_width = self.width + 2 * self.margin
+        self.column_height = round(600 * scale)
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def card_rect(self, index, count=1):
+        """Położenie karty (lub ciągu count kart) o danym indeksie w kolumnie"""
+        return QRect(self.margin, self.margin + index * self.stack_offset,
+                     self.width, self.height + (count - 1) * self.stack_offset)
+
+
+card_metrics = CardMetrics()  # Wspólne wymiary dla wszystkich widżetów planszy
+
 
 # Klasa reprezentująca widżet pojedynczej karty z funkcją przeciągania i podwójnego kliknięcia
 class CardWidget(QLabel):
@@ -14,15 +77,28 @@ class CardWidget(QLabel):
         self.source = source
         self.is_draggable = draggable
         self.setup_card_appearance()
+        profiler.widget_created(self)
 
     # Konfiguracja podstawowego wyglądu i zachowania karty
     def setup_card_appearance(self):
-        self.setFixedSize(100, 145)
+        self.setFixedSize(*card_metrics.size)
         self.setScaledContents(True)
         self.setAttribute(Qt.WA_DeleteOnClose)
-        self.setStyleSheet("border-radius: 5px; border: 1px solid black;")
+        self.load_texture()  # Ramka karty pochodzi z arkusza stylów aplikacji (selektor CardWidget)
+
+    # Nowy rozmiar karty - tekstura z pamięci podręcznej w nowym kubełku rozmiaru
+    def apply_metrics(self):
+        self.setFixedSize(*card_metrics.size)
         self.load_texture()
 
+    # Aktualizacja trwałego widżetu - tekstura zmieniana tylko przy zmianie karty lub strony
+    def update_card(self, card_data, source, draggable):
+        self.source = source
+        self.is_draggable = draggable
+        if card_data != self.card_data:
+            self.card_data = card_data
+            self.load_texture()
+
     # Obsługa zdarzeń myszy dla przeciągania karty
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton and self.is_draggable:
@@ -45,30 +121,23 @@ class CardWidget(QLabel):
         
         drag = QDrag(self)
         mime_data = QMimeData()
-        mime_data.setText(repr(self.source))
+        mime_data.setData(CARD_MIME_TYPE, QByteArray(encode_source(self.source)))
         drag.setMimeData(mime_data)
         
         pix = self.pixmap()
         if pix and not pix.isNull():
-            drag.setPixmap(pix.scaled(100, 145, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            drag.setPixmap(pix)  # Tekstura z pamięci podręcznej ma już rozmiar karty
             drag.setHotSpot(event.pos())
             drag.exec_(Qt.MoveAction)
 
-    # Ładowanie obrazka karty z pliku
+    # Ustawienie obrazka karty ze wspólnej pamięci podręcznej tekstur
     def load_texture(self):
-        card_type, card_value = self.card_data
-        if card_type == 'tył_karty':
-            texture_path = "resources/cards/tył_karty.png"
-        else:
-            texture_path = f"resources/cards/{card_type}_{card_value}.png"
-        
-        if os.path.exists(texture_path):
-            pixmap = QPixmap(texture_path)
-            if not pixmap.isNull():
-                self.setPixmap(pixmap.scaled(100, 145, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                return
-        
-        self.set_fallback_style(card_type, card_value)
+        pixmap = texture_cache.get(self.card_data)
+        if pixmap is not None:
+            self.setPixmap(pixmap)
+            return
+
+        self.set_fallback_style(*self.card_data)
 
     # Awaryjny styl gdy nie znaleziono obrazka karty
     def set_fallback_style(self, card_type, card_value):
@@ -82,83 +151,158 @@ class CardWidget(QLabel):
         self.setAlignment(Qt.AlignCenter)
 
 
+# Wspólna obsługa upuszczania kart: walidacja celu już przy wejściu przeciąganej karty i podświetlenie
+class DropTarget(QWidget):
+    card_dropped = pyqtSignal(tuple, QWidget)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        # Sprawdzenie ruchu (źródło, cel) -> bool bez jego wykonania; ustawia okno gry.
+        # Bez niej obszar nie przyjmuje kart (talia, stos odrzuconych).
+        self.validator = None
+        self.pile = None  # Opis stosu w GameLogic, np. ('foundation', 2)
+        self.drag_source = None
+        self.drag_legal = False
+        self.drop_frame = None  # Ramka legalności ruchu (tworzona przy pierwszym przeciąganiu)
+
+    # Obsługa przeciągania nad obszarem - źródło odczytane i ruch sprawdzony raz, przy wejściu
+    def dragEnterEvent(self, event):
+        source = decode_source(event.mimeData())
+        if source is None or self.validator is None:
+            event.ignore()
+            return
+        self.drag_source = source
+        self.drag_legal = self.validator(source, self.pile)
+        self.show_drop_frame()
+        # Zaakceptowane także przy niedozwolonym ruchu - tylko wtedy przychodzi dragLeaveEvent, który zdejmie ramkę
+        event.acceptProposedAction()
+
+    def dragMoveEvent(self, event):
+        if self.drag_legal:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dragLeaveEvent(self, event):
+        self.hide_drop_frame()
+
+    # Obsługa upuszczenia karty
+    def dropEvent(self, event):
+        self.hide_drop_frame()
+        if not self.drag_legal:
+            event.ignore()
+            return
+        self.card_dropped.emit(self.drag_source, self)
+        event.acceptProposedAction()
+
+    def drop_rect(self):
+        """Obszar podświetlany podczas przeciągania"""
+        return self.rect()
+
+    def show_drop_frame(self):
+        if self.drop_frame is None:
+            self.drop_frame = HighlightFrame(LEGAL_DROP_COLOR, self)
+        self.drop_frame.color = QColor(LEGAL_DROP_COLOR if self.drag_legal else ILLEGAL_DROP_COLOR)
+        self.drop_frame.show_on(self, self.drop_rect())
+        self.drop_frame.update()
+
+    def hide_drop_frame(self):
+        if self.drop_frame is not None:
+            self.drop_frame.hide()
+
+
 # Klasa reprezentująca obszar do upuszczania kart (stosy docelowe)
-class DropPlaceholder(QWidget):
+class DropPlaceholder(DropTarget):
     clicked = pyqtSignal()
-    card_dropped = pyqtSignal(tuple, QWidget)
 
     def __init__(self, label="", parent=None):
         super().__init__(parent)
         self.setup_drop_area(label)
+        profiler.widget_created(self)
 
     # Konfiguracja wyglądu obszaru drop
     def setup_drop_area(self, label):
-        self.setAcceptDrops(True)
-        self.setFixedSize(100, 145)
         self.setObjectName("DropPlaceholder")
-        self.setStyleSheet("""
-            background-color: rgba(255, 255, 255, 0.4); 
-            border: 2px dashed rgba(0, 0, 0, 0.4); 
-            border-radius: 8px;
-        """)
         
         self.label = QLabel(label, self)
+        self.label.setObjectName("PlaceholderLabel")  # Wygląd z arkusza stylów aplikacji
         self.label.setAlignment(Qt.AlignCenter)
-        self.setStyleSheet("""
-            background-color: rgba(255, 255, 255, 0.4); 
-            border: 2px dashed rgba(0, 0, 0, 0.4); 
-            border-radius: 8px;
-        """)
-        self.label.setGeometry(0, 0, 100, 145)
+        self.apply_metrics()
+
+    def apply_metrics(self, fan=1):
+        """Rozmiar pola dla bieżącego rozmiaru karty (fan - liczba rozłożonych kart stosu odrzuconych)"""
+        self.setFixedSize(card_metrics.width + (fan - 1) * card_metrics.fan_offset, card_metrics.height)
+        self.label.setGeometry(0, 0, card_metrics.width, card_metrics.height)
         
     # Obsługa zdarzenia kliknięcia
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.clicked.emit()
 
-    # Obsługa zdarzenia przeciągania nad obszarem
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasText(): 
-            event.acceptProposedAction()
-
-    # Obsługa upuszczenia karty
-    def dropEvent(self, event):
-        source_info = ast.literal_eval(event.mimeData().text())
-        self.card_dropped.emit(source_info, self)
-        event.acceptProposedAction()
-
 
 # Klasa reprezentująca kolumnę roboczą (specjalny obszar drop)
-class CardColumnWidget(QWidget):
-    card_dropped = pyqtSignal(tuple, QWidget)
-
+class CardColumnWidget(DropTarget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_column()
         self.cards = []
+        profiler.widget_created(self)
 
     # Konfiguracja wyglądu kolumny
     def setup_column(self):
-        self.setAcceptDrops(True)
-        self.setMinimumSize(120, 600)
-        self.setStyleSheet("background-color: transparent;")
-        
         self.placeholder = QLabel(self)
-        self.placeholder.setGeometry(10, 10, 100, 145)
-        self.placeholder.setStyleSheet("""
-            background-color: rgba(255, 255, 255, 0.4); 
-            border: 2px dashed rgba(0, 0, 0, 0.4); 
-            border-radius: 8px;
-        """)
+        self.placeholder.setObjectName("ColumnPlaceholder")
         self.placeholder.hide()
+        self.apply_metrics()
 
-    # Obsługa przeciągania nad kolumną
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasText(): 
-            event.acceptProposedAction()
+    def apply_metrics(self):
+        self.setMinimumSize(card_metrics.column_width, card_metrics.column_height)
+        self.placeholder.setGeometry(card_metrics.card_rect(0))
 
-    # Obsługa upuszczenia karty w kolumnie
-    def dropEvent(self, event):
-        source_info = ast.literal_eval(event.mimeData().text())
-        self.card_dropped.emit(source_info, self)
-        event.acceptProposedAction()
\ No newline at end of file
+    def drop_rect(self):
+        """Miejsce wierzchniej karty kolumny"""
+        return card_metrics.card_rect(max(len(self.cards) - 1, 0))
+
+
+# Tło okna rysowane z wczytanego w tle obrazka (zamiast border-image w arkuszu stylów)
+class BackgroundWidget(QWidget):
+    fallback_color = QColor(31, 95, 47)  # Zielony stół, zanim obrazek zostanie wczytany
+    first_painted = pyqtSignal()  # Emitowany raz - po pierwszym narysowaniu (pomiar startu aplikacji)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.painted = False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if texture_cache.background is not None:
+            painter.drawPixmap(self.rect(), texture_cache.background)
+        else:
+            painter.fillRect(self.rect(), self.fallback_color)
+        if not self.painted:
+            self.painted = True
+            self.first_painted.emit()
+
+
+# Ramka podpowiedzi rysowana nad kartą, kolumną lub stosem (nie przechwytuje myszy)
+class HighlightFrame(QWidget):
+    def __init__(self, color, parent=None):
+        super().__init__(parent)
+        self.color = QColor(color)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.hide()
+
+    # Pokazanie ramki na podanym widżecie (domyślnie na całym jego obszarze)
+    def show_on(self, widget, rect=None):
+        if self.parentWidget() is not widget:
+            self.setParent(widget)
+        self.setGeometry(rect if rect is not None else widget.rect())
+        self.raise_()
+        self.show()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.color, 4))
+        painter.drawRoundedRect(self.rect().adjusted(2, 2, -2, -2), 8, 8)
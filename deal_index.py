@@ -0,0 +1,168 @@
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+import time
+from multiprocessing import Pool
+
+from game_logic import GameLogic
+from rules import RULES, VARIANTS
+from simulator import greedy_playout
+from solver import KlondikeSolver
+
+MAGIC = b'PSD1'  # Nagłówek pliku indeksu rozdań
+INDEX_PATH = "resources/deals_{}.idx"  # Indeks dla wariantu zasad (nazwa z rules.RULES)
+
+EASY, MEDIUM, HARD, UNSOLVED = range(4)  # Poziomy trudności rozdania
+DIFFICULTIES = ('easy', 'medium', 'hard', 'unsolved')
+MEDIUM_NODES = 2000  # Wygrana znaleziona w tylu węzłach solvera (bez gry zachłannej) - rozdanie średnie
+
+LOST, WON, UNKNOWN = range(3)  # Wynik solvera zapisany w rekordzie
+STATUS_IDS = {'lost': LOST, 'won': WON, 'unknown': UNKNOWN}
+
+# Nagłówek: pierwsze ziarno, liczba rozdań, indeks wariantu zasad, limit węzłów solvera, liczba rozdań każdego poziomu
+HEADER = struct.Struct('<qIBI4I')
+# Rekord rozdania (ziarno = pierwsze ziarno + numer rekordu): wynik, trudność, długość rozwiązania, węzły solvera
+RECORD = struct.Struct('<BBHI')
+OFFSET = struct.Struct('<I')  # Listy rozdań każdego poziomu: numer rekordu (ziarno - pierwsze ziarno)
+
+
+def rate_seed(seed, rules='klondike', max_nodes=20000):
+    """Ocena jednego rozdania: (wynik solvera, trudność, liczba ruchów rozwiązania, węzły solvera)"""
+    result = KlondikeSolver(max_nodes=max_nodes).solve(GameLogic(seed, RULES[rules]))
+    status = STATUS_IDS[result.status]
+    greedy = GameLogic(seed, RULES[rules])
+    solutions = [len(result.moves)] if result.won else []
+    if greedy_playout(greedy):
+        difficulty = EASY  # Wystarczy zawsze grać najbardziej oczywisty ruch
+        status = WON
+        solutions.append(greedy.moves)
+    elif result.won:
+        difficulty = MEDIUM if result.nodes <= MEDIUM_NODES else HARD
+    else:
+        difficulty = UNSOLVED  # Brak rozwiązania lub przekroczony limit węzłów
+    moves = min(min(solutions), 0xFFFF) if solutions else 0  # Najkrótsze ze znalezionych rozwiązań
+    return status, difficulty, moves, result.nodes
+
+
+def rate_chunk(args):
+    """Zadanie dla procesu roboczego: (numer pierwszego rekordu, spakowane rekordy kolejnych ziaren)"""
+    first, seeds, rules, max_nodes = args
+    return first, b''.join(RECORD.pack(*rate_seed(seed, rules, max_nodes)) for seed in seeds)
+
+
+def build_index(path, start=0, count=1000, rules='klondike', workers=None, chunk_size=16, max_nodes=20000):
+    """Ocenia rozdania start..start+count-1 w puli procesów i zapisuje indeks; zwraca liczbę rozdań każdego poziomu"""
+    records = bytearray(count * RECORD.size)
+    chunks = [(i, range(start + i, start + min(i + chunk_size, count)), rules, max_nodes)
+              for i in range(0, count, chunk_size)]
+    with Pool(workers or os.cpu_count()) as pool:
+        for first, data in pool.imap_unordered(rate_chunk, chunks):
+            records[first * RECORD.size:first * RECORD.size + len(data)] = data
+
+    levels = [[] for _ in DIFFICULTIES]
+    for n in range(count):
+        levels[records[n * RECORD.size + 1]].append(n)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER.pack(start, count, VARIANTS.index(RULES[rules]), max_nodes, *map(len, levels)))
+        f.write(records)
+        for level in levels:
+            f.write(b''.join(OFFSET.pack(n) for n in level))
+    os.replace(temp_path, path)
+    return [len(level) for level in levels]
+
+
+# Indeks rozdań czytany przez mmap - wyszukanie ziarna i losowanie rozdania danej trudności w O(1)
+class DealIndex:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: to nie jest indeks rozdań")
+        self.start, self.count, rules_idx, self.max_nodes, *counts = HEADER.unpack_from(self.data, len(MAGIC))
+        self.rules = VARIANTS[rules_idx]
+        self.records_offset = len(MAGIC) + HEADER.size
+        # Początek listy rozdań każdego poziomu trudności
+        self.level_counts = counts
+        self.level_offsets = []
+        offset = self.records_offset + self.count * RECORD.size
+        for level_count in counts:
+            self.level_offsets.append(offset)
+            offset += level_count * OFFSET.size
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, seed):
+        return self.start <= seed < self.start + self.count
+
+    def rating(self, seed):
+        """(wynik solvera, trudność, długość rozwiązania, węzły solvera) dla ziarna z indeksu"""
+        if seed not in self:
+            raise KeyError(seed)
+        return RECORD.unpack_from(self.data, self.records_offset + (seed - self.start) * RECORD.size)
+
+    def pick(self, difficulty, rng=random):
+        """Losowe ziarno rozdania o podanej trudności; None, gdy w indeksie nie ma takich rozdań"""
+        level_count = self.level_counts[difficulty]
+        if not level_count:
+            return None
+        n, = OFFSET.unpack_from(self.data, self.level_offsets[difficulty] + rng.randrange(level_count) * OFFSET.size)
+        return self.start + n
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_index(rules):
+    """Indeks rozdań dla wariantu zasad albo None, gdy nie został zbudowany"""
+    path = INDEX_PATH.format(rules.name)
+    if not os.path.exists(path):
+        return None
+    try:
+        index = DealIndex(path)
+    except (OSError, ValueError) as e:
+        print(f"Nie udało się wczytać indeksu rozdań: {e}")
+        return None
+    if index.rules is not rules:
+        index.close()
+        return None
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Budowa indeksu trudności rozdań (solver i gra zachłanna na wszystkich rdzeniach)")
+    parser.add_argument('--start', type=int, default=0, help="pierwsze ziarno")
+    parser.add_argument('--count', type=int, default=1000, help="liczba rozdań")
+    parser.add_argument('--rules', choices=list(RULES), default='klondike', help="wariant zasad")
+    parser.add_argument('--workers', type=int, default=None, help="liczba procesów (domyślnie wszystkie rdzenie)")
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--max-nodes', type=int, default=20000, help="limit węzłów solvera na rozdanie")
+    parser.add_argument('--output', default=None, help=f"plik indeksu (domyślnie {INDEX_PATH.format('<zasady>')})")
+    args = parser.parse_args()
+
+    output = args.output or INDEX_PATH.format(args.rules)
+    start = time.perf_counter()
+    counts = build_index(output, args.start, args.count, args.rules, args.workers, args.chunk_size, args.max_nodes)
+    elapsed = time.perf_counter() - start
+    summary = {name: n for name, n in zip(DIFFICULTIES, counts)}
+    summary['output'] = output
+    summary['size_bytes'] = os.path.getsize(output)
+    summary['wall_time'] = round(elapsed, 3)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
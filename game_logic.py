@@ -1,25 +1,87 @@
 import random
-import copy
+from collections import deque
+
+from rules import KLONDIKE
+from zobrist import (STOCK_KEYS, WASTE_KEYS, FOUNDATION_KEYS, TABLEAU_KEYS, COLUMN_SALTS, PASSES_KEYS, MAX_PASSES, MASK64,
+                     mix64)
+
+# Tablice nazw kart (indeks koloru * 13 + wartość - 1 daje kod karty 0..51)
+SUITS = ['wino', 'serce', 'diament', 'żołędź']  # Kolory kart
+RANKS = ['A'] + [str(n) for n in range(2, 11)] + ['J', 'Q', 'K']  # Wartości kart
+SUIT_COLORS = [0, 1, 1, 0]  # 0 - czarny, 1 - czerwony (dla każdego koloru z SUITS)
+COLOR_NAMES = ['black', 'red']
+KING = 13
+UNDO_LIMIT = 3  # Liczba cofnięć dostępna w jednej grze
+
+# Opisy stosów używane w ruchach (źródło, cel, liczba kart)
+STOCK = ('stock', 0)
+WASTE = ('waste', 0)
+TABLEAU_PILES = [('tableau', i) for i in range(7)]
+FOUNDATION_PILES = [('foundation', i) for i in range(4)]
+DRAW_MOVE = (STOCK, WASTE, 1)  # Dobranie z talii (1 lub 3 karty według zasad) lub odtworzenie talii, gdy jest pusta
+EMPTY_COLUMN_SLOTS = (KING * 2, KING * 2 + 1)  # Pusta kolumna przyjmuje króla w każdym kolorze
+
+
+# Kompaktowa reprezentacja karty - wszystkie pola potrzebne regułom są policzone z góry
+class Card:
+    __slots__ = ('code', 'suit_idx', 'value', 'color', 'slot', 'face_up')
+
+    def __init__(self, code, face_up=False):
+        self.code = code  # Kod karty 0..51
+        self.suit_idx = code // 13  # Indeks koloru w SUITS (i stosu docelowego)
+        self.value = code % 13 + 1  # Wartość liczbowa 1 (as) .. 13 (król)
+        self.color = SUIT_COLORS[self.suit_idx]  # 0 - czarny, 1 - czerwony
+        self.slot = self.value * 2 + self.color  # Klucz w indeksie ruchów GameLogic.needs
+        self.face_up = face_up
+
+    # Adapter nazw dla interfejsu (tekstury kart)
+    @property
+    def suit(self):
+        return SUITS[self.suit_idx]
+
+    @property
+    def rank(self):
+        return RANKS[self.value - 1]
+
+    @property
+    def card_data(self):
+        """Para (kolor, wartość) używana do wyboru tekstury"""
+        return SUITS[self.suit_idx], RANKS[self.value - 1]
+
+    def __repr__(self):
+        return f"Card({self.suit!r}, {self.rank!r}, face_up={self.face_up})"
+
 
 # Główna klasa odpowiedzialna za logikę gry w pasjansa
 class GameLogic:
-    def __init__(self):
+    def __init__(self, seed=None, rules=KLONDIKE):
         """Inicjalizacja podstawowych parametrów gry"""
-        self.suits = ['wino', 'serce', 'diament', 'żołędź']  # Kolory kart
-        self.ranks = ['A'] + [str(n) for n in range(2, 11)] + ['J', 'Q', 'K']  # Wartości kart
+        self.suits = SUITS  # Kolory kart
+        self.ranks = RANKS  # Wartości kart
         self.rank_values = {rank: i for i, rank in enumerate(self.ranks, 1)}  # Wartości numeryczne kart
-        self.card_colors = {  # Przypisanie kolorów do typów kart
-            'wino': 'black', 'żołędź': 'black',
-            'serce': 'red', 'diament': 'red'
-        }
-        self.foundation_suits = ['wino', 'serce', 'diament', 'żołędź']  # Kolory dla stosów docelowych
-        self.new_game()  # Rozpoczęcie nowej gry
+        self.card_colors = {s: COLOR_NAMES[c] for s, c in zip(SUITS, SUIT_COLORS)}  # Przypisanie kolorów do typów kart
+        self.foundation_suits = SUITS  # Kolory dla stosów docelowych (indeks stosu == suit_idx karty)
+        self.deck = [Card(code) for code in range(52)]  # Karty tworzone raz i używane w kolejnych rozdaniach
+        self.rng = random.Random()  # Własny generator - rozdanie zależy tylko od ziarna
+        self.apply_rules(rules)
+        self.new_game(seed)  # Rozpoczęcie nowej gry
 
     # Metoda inicjalizująca nową grę
-    def new_game(self):
-        """Przygotowanie talii i rozdanie kart"""
-        full_deck = [{'suit': s, 'rank': r, 'face_up': False} for s in self.suits for r in self.ranks]
-        random.shuffle(full_deck)  # Tasowanie kart
+    def new_game(self, seed=None, rules=None):
+        """Przygotowanie talii i rozdanie kart (to samo ziarno daje zawsze to samo rozdanie).
+
+        rules: wariant zasad (rules.Rules) - bez podania zostaje wariant poprzedniej gry.
+        """
+        if rules is not None:
+            self.apply_rules(rules)
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.seed = seed  # Ziarno bieżącego rozdania
+        full_deck = self.deck[:]
+        for card in full_deck:
+            card.face_up = False
+        self.rng.seed(seed)
+        self.rng.shuffle(full_deck)  # Tasowanie kart
 
         # Inicjalizacja podstawowych obszarów gry
         self.stock = full_deck  # Nieodkryta talia
@@ -32,138 +94,391 @@ class GameLogic:
             for j in range(i + 1):
                 card = self.stock.pop()
                 if j == i:  # Ostatnia karta w kolumnie jest odkryta
-                    card['face_up'] = True
+                    card.face_up = True
                 self.tableau[i].append(card)
+        self.reset_move_index()
+        self.reset_hash()
 
         # Inicjalizacja statystyk gry
-        self.score = 0
+        self.score = self.scoring.start
+        self.passes_left = self.rules.recycles  # Pozostałe odtworzenia talii
         self.moves = 0
-        self.history = []  # Historia stanów gry (dla funkcji cofnij)
-        self.undo_count = 3  # Limit cofnięć
+        self.undo_count = UNDO_LIMIT  # Limit cofnięć
+        # Dziennik ruchów (dla funkcji cofnij) - tylko tyle wpisów, ile można jeszcze cofnąć
+        self.history = deque(maxlen=self.undo_count)
+        self.move_log = []  # Wszystkie ruchy od rozdania (bez cofniętych) - ziarno + log odtwarzają grę
+
+    def apply_rules(self, rules):
+        """Ustala wariant zasad - funkcja dobierania i tabela punktów są wybierane tylko tutaj"""
+        self.rules = rules
+        self.scoring = rules.scoring
+        self.draw_from_stock = self.draw_one if rules.draw_count == 1 else self.draw_many
 
     # Metody zarządzania stanem gry
-    def save_state(self):
-        """Zapisywanie aktualnego stanu gry"""
-        state = {
-            'stock': copy.deepcopy(self.stock),
-            'waste': copy.deepcopy(self.waste),
-            'foundations': copy.deepcopy(self.foundations),
-            'tableau': copy.deepcopy(self.tableau),
-            'score': self.score,
-            'moves': self.moves,
-        }
-        self.history.append(state)
+    def clone(self):
+        """Niezależna kopia stanu gry (własne obiekty kart, wspólne tablice nazw)"""
+        other = GameLogic.__new__(GameLogic)
+        other.__dict__.update(self.__dict__)
+        other.rng = random.Random()
+        other.deck = [Card(card.code, card.face_up) for card in self.deck]
+        deck = other.deck
+        other.stock = [deck[card.code] for card in self.stock]
+        other.waste = [deck[card.code] for card in self.waste]
+        other.foundations = [[deck[card.code] for card in pile] for pile in self.foundations]
+        other.tableau = [[deck[card.code] for card in pile] for pile in self.tableau]
+        other.history = deque(self.history, maxlen=self.history.maxlen)
+        other.move_log = self.move_log[:]
+        other.needs = [set(columns) for columns in self.needs]
+        other.column_slots = self.column_slots[:]
+        other.hidden = self.hidden[:]
+        other.column_hashes = self.column_hashes[:]
+        other.apply_rules(self.rules)  # Metoda dobierania musi być związana z kopią, nie z oryginałem
+        return other
+
+    def pile(self, pile_type, pile_idx=0):
+        """Zwraca listę kart stosu o podanym typie i indeksie"""
+        if pile_type == 'tableau': return self.tableau[pile_idx]
+        if pile_type == 'foundation': return self.foundations[pile_idx]
+        if pile_type == 'waste': return self.waste
+        return self.stock
+
+    # Indeks ruchów: dla każdej karty (wartość, kolor) zbiór kolumn, które ją przyjmą
+    def reset_move_index(self):
+        """Buduje indeks ruchów od zera (po rozdaniu)"""
+        self.needs = [set() for _ in range(KING * 2 + 2)]  # Card.slot -> kolumny przyjmujące taką kartę
+        self.column_slots = [() for _ in range(7)]  # Klucze, pod którymi zapisana jest każda kolumna
+        self.hidden = [0] * 7  # Liczba zakrytych kart w każdej kolumnie
+        for i, pile in enumerate(self.tableau):
+            self.hidden[i] = sum(1 for card in pile if not card.face_up)
+            self.index_column(i)
+
+    def index_column(self, column_idx):
+        """Aktualizuje indeks po zmianie wierzchniej karty jednej kolumny"""
+        needs = self.needs
+        for slot in self.column_slots[column_idx]:
+            needs[slot].discard(column_idx)
+        pile = self.tableau[column_idx]
+        if not pile:
+            slots = EMPTY_COLUMN_SLOTS
+        else:
+            top = pile[-1]
+            # Na kartę można położyć kartę o jeden niższą w przeciwnym kolorze
+            slots = ((top.value - 1) * 2 + 1 - top.color,) if top.face_up and top.value > 1 else ()
+        for slot in slots:
+            needs[slot].add(column_idx)
+        self.column_slots[column_idx] = slots
+
+    # Hasz Zobrista pozycji: część wspólna (talia, odrzucone, stosy docelowe) i osobno każda kolumna
+    def reset_hash(self):
+        """Liczy hasz pozycji od zera (po rozdaniu)"""
+        self.rest_hash = 0
+        self.column_hashes = [0] * 7
+        self.toggle_hash('stock', 0, self.stock, 0)
+        self.toggle_hash('waste', 0, self.waste, 0)
+        for i, pile in enumerate(self.foundations):
+            self.toggle_hash('foundation', i, pile, 0)
+        for i, pile in enumerate(self.tableau):
+            self.toggle_hash('tableau', i, pile, 0)
+
+    def toggle_hash(self, pile_type, pile_idx, pile, start):
+        """Dodaje lub usuwa (XOR) z haszu klucze kart pile[start:] w ich obecnym stanie"""
+        h = 0
+        if pile_type == 'tableau':
+            for pos in range(start, len(pile)):
+                card = pile[pos]
+                h ^= TABLEAU_KEYS[pos][card.code * 2 + card.face_up]
+            self.column_hashes[pile_idx] ^= h
+            return
+        if pile_type == 'foundation':
+            for pos in range(start, len(pile)):
+                h ^= FOUNDATION_KEYS[pile[pos].code]
+        else:
+            keys = STOCK_KEYS if pile_type == 'stock' else WASTE_KEYS
+            for pos in range(start, len(pile)):
+                h ^= keys[pos][pile[pos].code]
+        self.rest_hash ^= h
+
+    def passes_key(self):
+        """Klucz pozostałych odtworzeń talii - ta sama pozycja z mniejszą liczbą przejść jest słabsza"""
+        return PASSES_KEYS[self.passes_left] if self.passes_left < MAX_PASSES else 0
+
+    def position_hash(self):
+        """Hasz dokładnej pozycji (kolejność kolumn ma znaczenie)"""
+        h = self.rest_hash ^ self.passes_key()
+        for i, column_hash in enumerate(self.column_hashes):
+            h ^= mix64(column_hash ^ COLUMN_SALTS[i])
+        return h
+
+    def canonical_hash(self):
+        """Hasz pozycji z wymiennymi kolumnami roboczymi - klucz do tablic transpozycji i pamięci podręcznych"""
+        total = 0
+        for column_hash in self.column_hashes:
+            total += mix64(column_hash)
+        return self.rest_hash ^ self.passes_key() ^ (total & MASK64)
+
+    def canonical_state(self):
+        """Dokładna postać kanoniczna pozycji (krotka) - kolumny robocze posortowane"""
+        columns = sorted((hidden,) + tuple(card.code for card in pile)
+                         for hidden, pile in zip(self.hidden, self.tableau))
+        return (tuple(card.code for card in self.stock),
+                tuple(card.code for card in self.waste),
+                tuple(len(pile) for pile in self.foundations),
+                tuple(columns),
+                self.passes_left)
+
+    def legal_moves(self):
+        """Wszystkie dozwolone ruchy w formacie (źródło, cel, liczba kart)"""
+        moves = []
+        needs = self.needs
+        foundations = self.foundations
+        if self.stock or (self.waste and self.passes_left > 0):
+            moves.append(DRAW_MOVE)
+
+        if self.waste:
+            card = self.waste[-1]
+            if card.value == len(foundations[card.suit_idx]) + 1:
+                moves.append((WASTE, FOUNDATION_PILES[card.suit_idx], 1))
+            for d in needs[card.slot]:
+                moves.append((WASTE, TABLEAU_PILES[d], 1))
+
+        for i, pile in enumerate(self.tableau):
+            if not pile:
+                continue
+            source = TABLEAU_PILES[i]
+            top = pile[-1]
+            if top.value == len(foundations[top.suit_idx]) + 1:
+                moves.append((source, FOUNDATION_PILES[top.suit_idx], 1))
+            # Każda odkryta karta może przenieść ciąg kart leżących na niej
+            size = len(pile)
+            for j in range(self.hidden[i], size):
+                for d in needs[pile[j].slot]:
+                    if d != i:
+                        moves.append((source, TABLEAU_PILES[d], size - j))
+
+        for f, pile in enumerate(foundations):
+            if pile:
+                for d in needs[pile[-1].slot]:
+                    moves.append((FOUNDATION_PILES[f], TABLEAU_PILES[d], 1))
+        return moves
+
+    def apply_move(self, move):
+        """Wykonuje ruch zwrócony przez legal_moves() (bez ponownej walidacji)"""
+        source, destination, count = move
+        if source[0] == 'stock':
+            return self.draw_from_stock()
+        self.perform_move(self.pile(*source)[-count:], source, destination)
+        return True
 
     def undo(self):
         """Cofanie ostatniego ruchu"""
         if not self.history or self.undo_count <= 0:
             return False
-        
+
         self.undo_count -= 1
-        last_state = self.history.pop()
-        # Przywracanie poprzedniego stanu
-        self.stock = last_state['stock']
-        self.waste = last_state['waste']
-        self.foundations = last_state['foundations']
-        self.tableau = last_state['tableau']
-        self.score = last_state['score']
-        self.moves = last_state['moves']
+        self.revert(self.history.pop())
+        # Po zmniejszeniu limitu starsze wpisy i tak nie mogłyby zostać użyte
+        self.history = deque(self.history, maxlen=self.undo_count)
         return True
 
-    # Metody obsługi ruchów w grze
-    def draw_from_stock(self):
+    def revert(self, delta):
+        """Odwraca pojedynczy wpis dziennika (bez sprawdzania limitu cofnięć)"""
+        source, destination, count, flipped, score_before = delta
+        source_type, source_idx = source
+        dest_type = destination[0]
+
+        if source_type == 'stock':  # Cofnięcie dobrania kart
+            self.toggle_hash('waste', 0, self.waste, len(self.waste) - count)
+            for _ in range(count):
+                card = self.waste.pop()
+                card.face_up = False
+                self.stock.append(card)
+            self.toggle_hash('stock', 0, self.stock, len(self.stock) - count)
+        elif dest_type == 'stock':  # Cofnięcie odtworzenia talii ze stosu odrzuconych
+            self.toggle_hash('stock', 0, self.stock, 0)
+            self.waste.extend(reversed(self.stock))
+            for card in self.waste:
+                card.face_up = True
+            self.stock.clear()
+            self.toggle_hash('waste', 0, self.waste, 0)
+            self.passes_left += 1
+        else:
+            dest_pile = self.pile(*destination)
+            self.toggle_hash(dest_type, destination[1], dest_pile, len(dest_pile) - count)
+            cards = dest_pile[-count:]
+            del dest_pile[-count:]
+            source_pile = self.pile(source_type, source_idx)
+            if flipped:  # Ponowne zakrycie karty odkrytej przez ruch
+                top = len(source_pile) - 1
+                self.toggle_hash(source_type, source_idx, source_pile, top)
+                source_pile[-1].face_up = False
+                self.toggle_hash(source_type, source_idx, source_pile, top)
+                self.hidden[source_idx] += 1
+            size = len(source_pile)
+            source_pile.extend(cards)
+            self.toggle_hash(source_type, source_idx, source_pile, size)
+            if source_type == 'tableau':
+                self.index_column(source_idx)
+            if dest_type == 'tableau':
+                self.index_column(destination[1])
+
+        self.score = score_before
+        self.moves -= 1
+        self.move_log.pop()
+
+    # Metody obsługi ruchów w grze (draw_from_stock to draw_one lub draw_many, zależnie od zasad)
+    def recycle_waste(self):
+        """Odtworzenie pustej talii ze stosu odrzuconych (o ile zasady pozwalają na kolejne przejście)"""
+        if not self.waste or self.passes_left <= 0:
+            return False
+        self.history.append((WASTE, STOCK, len(self.waste), False, self.score))
+        self.toggle_hash('waste', 0, self.waste, 0)
+        self.stock.extend(reversed(self.waste))
+        for card in self.stock:
+            card.face_up = False
+        self.waste.clear()
+        self.toggle_hash('stock', 0, self.stock, 0)
+        self.passes_left -= 1
+        self.moves += 1
+        self.move_log.append(DRAW_MOVE)
+        return True
+
+    def draw_one(self):
         """Dobieranie karty z talii"""
-        self.save_state()
-        
         if not self.stock:  # Jeśli talia pusta, odtwórz ją z odrzuconych
-            if not self.waste: 
-                self.history.pop()
-                return False
-            self.stock = self.waste[::-1]
-            for card in self.stock:
-                card['face_up'] = False
-            self.waste = []
-            self.moves += 1
-            return True
-        
+            return self.recycle_waste()
+
         # Standardowe dobranie karty
+        self.history.append((STOCK, WASTE, 1, False, self.score))
+        self.toggle_hash('stock', 0, self.stock, len(self.stock) - 1)
         card = self.stock.pop()
-        card['face_up'] = True
+        card.face_up = True
         self.waste.append(card)
+        self.toggle_hash('waste', 0, self.waste, len(self.waste) - 1)
         self.moves += 1
+        self.move_log.append(DRAW_MOVE)
+        return True
+
+    def draw_many(self):
+        """Dobieranie kilku kart naraz (Draw-3) - na wierzchu stosu odrzuconych ląduje ostatnia z nich"""
+        if not self.stock:
+            return self.recycle_waste()
+
+        count = min(self.rules.draw_count, len(self.stock))
+        self.history.append((STOCK, WASTE, count, False, self.score))
+        self.toggle_hash('stock', 0, self.stock, len(self.stock) - count)
+        for _ in range(count):
+            card = self.stock.pop()
+            card.face_up = True
+            self.waste.append(card)
+        self.toggle_hash('waste', 0, self.waste, len(self.waste) - count)
+        self.moves += 1
+        self.move_log.append(DRAW_MOVE)
         return True
 
     # Metody walidacji i wykonywania ruchów
     def attempt_move(self, card_stack, source, destination):
         """Próba wykonania ruchu z walidacją"""
-        source_type, source_idx = source
-        dest_type, dest_idx = destination
-
-        is_valid = False
-        if dest_type == 'foundation':  # Ruch na stos docelowy
-            if len(card_stack) == 1:
-                is_valid = self.is_valid_for_foundation(card_stack[0], dest_idx)
-        elif dest_type == 'tableau':  # Ruch na kolumnę roboczą
-            is_valid = self.is_valid_for_tableau(card_stack[0], dest_idx)
-
-        if is_valid:
-            self.save_state()
+        if self.is_valid_move(card_stack, destination):
             self.perform_move(card_stack, source, destination)
             return True
         return False
 
+    def is_valid_move(self, card_stack, destination):
+        """Walidacja ruchu bez jego wykonania (np. podświetlenie celu podczas przeciągania)"""
+        dest_type, dest_idx = destination
+        if dest_type == 'foundation':  # Ruch na stos docelowy
+            return len(card_stack) == 1 and self.is_valid_for_foundation(card_stack[0], dest_idx)
+        if dest_type == 'tableau':  # Ruch na kolumnę roboczą
+            return self.is_valid_for_tableau(card_stack[0], dest_idx)
+        return False
+
     def perform_move(self, card_stack, source, destination):
         """Fizyczne wykonanie ruchu i aktualizacja punktacji"""
         source_type, source_idx = source
         dest_type, dest_idx = destination
+        score_before = self.score
+        scoring = self.scoring
+        flipped = False
 
-        # Usuwanie kart ze źródła
+        # Usuwanie kart ze źródła (razem z ich kluczami w haszu pozycji)
+        source_pile = self.pile(source_type, source_idx)
+        self.toggle_hash(source_type, source_idx, source_pile, len(source_pile) - len(card_stack))
         if source_type == 'waste': self.waste.pop()
         elif source_type == 'foundation': 
             self.foundations[source_idx].pop()
-            self.score -= 15  # Kara za cofnięcie ze stosu docelowego
+            self.score += scoring.from_foundation  # Kara za cofnięcie ze stosu docelowego
         elif source_type == 'tableau':
-            num_to_move = len(card_stack)
-            self.tableau[source_idx] = self.tableau[source_idx][:-num_to_move]
+            pile = self.tableau[source_idx]
+            del pile[-len(card_stack):]  # Usuwanie w miejscu, bez kopiowania kolumny
             # Odkrywanie nowej karty w kolumnie jeśli potrzeba
-            if self.tableau[source_idx] and not self.tableau[source_idx][-1]['face_up']:
-                self.tableau[source_idx][-1]['face_up'] = True
-                self.score += 5  # Nagroda za odkrycie karty
+            if pile and not pile[-1].face_up:
+                self.toggle_hash('tableau', source_idx, pile, len(pile) - 1)
+                pile[-1].face_up = True
+                self.toggle_hash('tableau', source_idx, pile, len(pile) - 1)
+                flipped = True
+                self.hidden[source_idx] -= 1
+                self.score += scoring.flip  # Nagroda za odkrycie karty
+            self.index_column(source_idx)
 
         # Dodawanie kart do celu
+        dest_pile = self.pile(dest_type, dest_idx)
+        dest_size = len(dest_pile)
         if dest_type == 'foundation': 
             self.foundations[dest_idx].extend(card_stack)
-            self.score += 10  # Nagroda za ruch na stos docelowy
+            self.score += scoring.to_foundation  # Nagroda za ruch na stos docelowy
         elif dest_type == 'tableau': 
             self.tableau[dest_idx].extend(card_stack)
+            self.index_column(dest_idx)
             if source_type == 'waste':
-                self.score += 5  # Nagroda za ruch z odrzuconych
+                self.score += scoring.waste_to_tableau  # Nagroda za ruch z odrzuconych
         
+        self.toggle_hash(dest_type, dest_idx, dest_pile, dest_size)
+
         self.moves += 1
-        if self.score < 0:  # Zabezpieczenie przed ujemną punktacją
-            self.score = 0
+        if self.score < scoring.minimum:  # Zabezpieczenie przed ujemną punktacją (poza Vegas)
+            self.score = scoring.minimum
+        # Wpis dziennika: tylko to, co zmienił ruch (przeniesione karty, odkrycie, punkty)
+        self.history.append((source, destination, len(card_stack), flipped, score_before))
+        self.move_log.append((source, destination, len(card_stack)))
 
     # Metody walidacyjne
     def is_valid_for_foundation(self, card, foundation_index):
         """Sprawdza czy karta może być położona na stos docelowy"""
-        foundation_pile = self.foundations[foundation_index]
-        expected_suit = self.foundation_suits[foundation_index]
-        if not foundation_pile:  # Pusty stos - tylko as
-            return card['rank'] == 'A' and card['suit'] == expected_suit
-        top_card = foundation_pile[-1]
-        return (card['suit'] == expected_suit and
-                self.rank_values[card['rank']] == self.rank_values[top_card['rank']] + 1)
+        # Stos docelowy zawiera karty swojego koloru od asa, więc jego długość to wartość wierzchniej karty
+        return (card.suit_idx == foundation_index and
+                card.value == len(self.foundations[foundation_index]) + 1)
 
     def is_valid_for_tableau(self, card, tableau_index):
         """Sprawdza czy karta może być położona na kolumnę roboczą"""
         tableau_pile = self.tableau[tableau_index]
         if not tableau_pile:  # Pusta kolumna - tylko król
-            return card['rank'] == 'K'
+            return card.value == KING
         top_card = tableau_pile[-1]
-        if not top_card['face_up']: return False  # Nie można kłaść na zakrytą kartę
-        return (self.card_colors[card['suit']] != self.card_colors[top_card['suit']] and
-                self.rank_values[card['rank']] == self.rank_values[top_card['rank']] - 1)
+        if not top_card.face_up: return False  # Nie można kłaść na zakrytą kartę
+        return card.color != top_card.color and card.value == top_card.value - 1
 
     def check_win_condition(self):
         """Sprawdza warunek zwycięstwa (wszystkie stosy pełne)"""
-        return all(len(f) == 13 for f in self.foundations)
\ No newline at end of file
+        return all(len(f) == 13 for f in self.foundations)
+
+    # Automatyczne dokończenie rozstrzygniętej partii
+    def can_auto_complete(self):
+        """Talia i odrzucone puste, a w kolumnach same odkryte karty - partii nie da się już przegrać"""
+        return not self.stock and not self.waste and not any(self.hidden) and not self.check_win_condition()
+
+    def auto_complete(self):
+        """Przenosi wszystkie karty z kolumn na stosy docelowe w jednym przebiegu.
+
+        Odkryte karty w kolumnie leżą malejąco, więc przy przenoszeniu w kolejności wartości
+        każda karta jest już na wierzchu swojej kolumny, a jej stos docelowy czeka dokładnie na nią.
+        Zwraca listę wykonanych ruchów (pusta, gdy pozycja nie jest jeszcze rozstrzygnięta).
+        """
+        if not self.can_auto_complete():
+            return []
+        order = sorted((card.value, i) for i, pile in enumerate(self.tableau) for card in pile)
+        moves = []
+        for _, i in order:
+            card = self.tableau[i][-1]
+            self.perform_move([card], TABLEAU_PILES[i], FOUNDATION_PILES[card.suit_idx])
+            moves.append((TABLEAU_PILES[i], FOUNDATION_PILES[card.suit_idx], 1))
+        return moves
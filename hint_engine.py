@@ -0,0 +1,120 @@
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import GameLogic
+from savefile import encode_snapshot, restore_snapshot, RECORD_HEADER
+from rules import RULES
+from solver import KlondikeSolver
+
+HINT_BUDGET = 0.2  # Domyślny budżet czasu na podpowiedź [s]
+MAX_PLAYOUTS = 64  # Górny limit rozgrywek na jeden ruch (przy dużym budżecie)
+PLAYOUT_MOVES = 300  # Limit ruchów jednej rozgrywki
+EXPLORE = 0.25  # Szansa, że w danym kroku ruchy są tasowane zamiast brane w kolejności solvera
+MAX_WORKERS = 4  # Górny limit procesów roboczych (każdy to osobny interpreter z własną pamięcią)
+
+
+def playout(game, rng, solver, max_moves=PLAYOUT_MOVES):
+    """Zachłanna rozgrywka z losowymi odstępstwami; zwraca liczbę kart na stosach docelowych"""
+    seen = {game.canonical_hash()}
+    for _ in range(max_moves):
+        if game.check_win_condition():
+            break
+        moves = solver.candidate_moves(game)
+        if rng.random() < EXPLORE:
+            rng.shuffle(moves)
+        for move in moves:
+            game.apply_move(move)
+            key = game.canonical_hash()
+            if key not in seen:
+                seen.add(key)
+                break
+            game.revert(game.history.pop())
+        else:  # Każdy ruch prowadzi do znanej pozycji
+            break
+    return sum(len(pile) for pile in game.foundations)
+
+
+def evaluate_move(task):
+    """Zadanie dla procesu roboczego: rozgrywki po jednym ruchu aż do limitu lub terminu.
+
+    Zwraca (ruch, suma wyników, liczba rozgrywek, liczba wygranych).
+    """
+    snapshot, seed, rules_name, move, deadline, max_playouts, rng_seed = task
+    start = restore_snapshot(seed, 0, snapshot, RULES[rules_name])
+    start.history = deque()
+    start.apply_move(move)
+    solver = KlondikeSolver()
+    rng = random.Random(rng_seed)
+    total = count = wins = 0
+    while count < max_playouts and time.time() < deadline:
+        game = start.clone()
+        result = playout(game, rng, solver)
+        total += result
+        count += 1
+        wins += result == 52
+    return move, total, count, wins
+
+
+def make_tasks(game, deadline, max_playouts=MAX_PLAYOUTS):
+    """Zadania dla wszystkich sensownych ruchów (kolejność solvera - najlepsze najpierw)"""
+    snapshot = encode_snapshot(game)[RECORD_HEADER.size:]
+    moves = KlondikeSolver().candidate_moves(game)
+    return [(snapshot, game.seed, game.rules.name, move, deadline, max_playouts, i) for i, move in enumerate(moves)]
+
+
+def choose_move(results):
+    """Ruch z najwyższym średnim wynikiem; remis (i brak rozgrywek) rozstrzyga kolejność solvera"""
+    best, best_value = None, -1.0
+    for move, total, count, wins in results:
+        value = total / count if count else -0.5
+        if best is None or value > best_value:
+            best, best_value = move, value
+    return best
+
+
+def best_move(game, budget=HINT_BUDGET, executor=None):
+    """Podpowiedź synchroniczna (np. z wiersza poleceń); zwraca (ruch lub None, łączna liczba rozgrywek)"""
+    tasks = make_tasks(game, time.time() + budget)
+    if executor is None:
+        results = [evaluate_move(task) for task in tasks]
+    else:
+        results = list(executor.map(evaluate_move, tasks))
+    return choose_move(results), sum(result[2] for result in results)
+
+
+def default_workers():
+    return min(os.cpu_count() or 1, MAX_WORKERS)
+
+
+def create_pool(workers=None):
+    """Pula procesów do rozgrywek (spawn - bez kopiowania stanu wątków interfejsu).
+
+    Moduł nie importuje PyQt5 - procesy robocze wczytują tylko logikę gry i solver.
+    """
+    return ProcessPoolExecutor(max_workers=workers or default_workers(),
+                               mp_context=multiprocessing.get_context('spawn'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Podpowiedź ruchu metodą Monte Carlo dla wybranego rozdania")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budget', type=float, default=HINT_BUDGET, help="budżet czasu w sekundach")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    game = GameLogic(args.seed)
+    with create_pool(args.workers) as pool:
+        pool.submit(time.sleep, 0).result()  # Procesy gotowe przed pomiarem
+        start = time.perf_counter()
+        move, playouts = best_move(game, args.budget, pool)
+        elapsed = time.perf_counter() - start
+    print(f"Ruch: {move}\nRozgrywki: {playouts}, czas: {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
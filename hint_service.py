@@ -0,0 +1,108 @@
+import time
+from concurrent.futures.process import BrokenProcessPool
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from hint_engine import HINT_BUDGET, create_pool, default_workers, evaluate_move, make_tasks, choose_move
+from zobrist import PositionCache
+
+POOL_STARTUP = 0.5  # Dodatkowy czas pierwszej podpowiedzi na uruchomienie procesów roboczych [s]
+
+
+# Podpowiedzi liczone w puli procesów - wynik przychodzi sygnałem, interfejs nigdy nie czeka
+class HintService(QObject):
+    hint_ready = pyqtSignal(object)  # Najlepszy ruch (źródło, cel, liczba kart) lub None
+    task_finished = pyqtSignal(int, object)  # (numer zlecenia, wynik jednego zadania)
+
+    def __init__(self, budget=HINT_BUDGET, workers=None, parent=None):
+        super().__init__(parent)
+        self.budget = budget
+        self.workers = workers or default_workers()
+        self.pool = None  # Tworzona przy pierwszej podpowiedzi - gracz, który o nią nie prosi, nie płaci za procesy
+        self.generation = 0
+        self.pending = []
+        self.results = []
+        self.key = None
+        self.fallback = None
+        self.order = {}
+        self.cache = PositionCache(256)  # Dokładny hasz pozycji -> ruch (kolumny w ruchu mają znaczenie)
+        self.deadline_timer = QTimer(self)
+        self.deadline_timer.setSingleShot(True)
+        self.deadline_timer.timeout.connect(self.finish)
+        self.task_finished.connect(self.on_task_finished)
+
+    def warm_up(self):
+        """Uruchomienie procesów roboczych (przy pierwszej podpowiedzi)"""
+        if self.pool is None:
+            self.pool = create_pool(self.workers)
+            for _ in range(self.workers):
+                self.pool.submit(time.sleep, 0)
+
+    def request(self, game):
+        """Zleca podpowiedź dla bieżącej pozycji; wynik w sygnale hint_ready"""
+        self.cancel()
+        key = game.position_hash()
+        if key in self.cache:
+            self.hint_ready.emit(self.cache.get(key))
+            return
+        budget = self.budget if self.pool is not None else self.budget + POOL_STARTUP  # Zimna pula: czas na start procesów
+        self.warm_up()
+        generation = self.generation
+        self.key = key
+        self.results = []
+        tasks = make_tasks(game, time.time() + budget)
+        if not tasks:
+            self.hint_ready.emit(None)
+            return
+        self.fallback = tasks[0][3]
+        self.order = {task[3]: i for i, task in enumerate(tasks)}
+        try:
+            for task in tasks:
+                future = self.pool.submit(evaluate_move, task)
+                future.add_done_callback(lambda f: self.deliver(generation, f))
+                self.pending.append(future)
+        except BrokenProcessPool:
+            # Proces roboczy zginął - nowa pula przy następnej podpowiedzi, teraz ruch według solvera
+            self.pool.shutdown(wait=False)
+            self.pool = None
+            self.cancel()
+            self.hint_ready.emit(self.fallback)
+            return
+        # Zabezpieczenie: gdy pula nie zdąży, wynik z tego, co już policzono
+        self.deadline_timer.start(int(budget * 2000))
+
+    def deliver(self, generation, future):
+        # Wywoływane w wątku puli - wynik trafia do wątku interfejsu przez kolejkę zdarzeń
+        if not future.cancelled() and future.exception() is None:
+            self.task_finished.emit(generation, future.result())
+
+    def on_task_finished(self, generation, result):
+        if generation != self.generation:
+            return
+        self.results.append(result)
+        if len(self.results) == len(self.pending):
+            self.finish()
+
+    def finish(self):
+        if not self.pending:
+            return
+        if self.results:
+            self.results.sort(key=lambda result: self.order[result[0]])  # Wyniki przychodzą w dowolnej kolejności
+            move = choose_move(self.results)
+            self.cache.put(self.key, move)
+        else:
+            move = self.fallback  # Nic nie zdążyło się policzyć - pierwszy ruch według solvera (bez zapamiętania)
+        self.cancel()
+        self.hint_ready.emit(move)
+
+    def cancel(self):
+        """Unieważnia trwające zlecenie (np. po ruchu gracza)"""
+        self.generation += 1
+        self.deadline_timer.stop()
+        for future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def shutdown(self):
+        self.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
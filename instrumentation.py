@@ -0,0 +1,238 @@
+import json
+import os
+import time
+from collections import deque
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt
+
+PROFILE_ENV = 'PASJANS_PROFILE'  # 1 - pomiar z zapisem do DEFAULT_OUTPUT, inna wartość - ścieżka pliku JSON
+DEFAULT_OUTPUT = 'pasjans_profile.json'
+WINDOW = 500  # Liczba ostatnich pomiarów, z których liczone są percentyle
+PHASES = ('logic', 'render', 'total')
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+
+def bucket(ms):
+    """Przedział histogramu: górna granica z szeregu 0.125, 0.25, 0.5, 1, 2, ... ms"""
+    upper = 0.125
+    while ms > upper:
+        upper *= 2
+    return upper
+
+
+# Pomiar jednej akcji gracza: logika (GameLogic) i odświeżenie widżetów
+class ActionTimer:
+    __slots__ = ('profiler', 'name', 'start', 'logic_end', 'created', 'deleted', 'renders', 'deferred')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.created = self.profiler.widgets_created
+        self.deleted = self.profiler.widgets_deleted
+        self.renders = self.profiler.renders
+        self.logic_end = None
+        self.deferred = False
+        self.start = time.perf_counter()
+        return self
+
+    def logic_done(self):
+        """Koniec części logicznej - dalej liczony jest czas odświeżania planszy"""
+        self.logic_end = time.perf_counter()
+
+    def defer(self):
+        """Plansza zostanie odświeżona później (zbiorczo) - pomiar zamknie dopiero finish()"""
+        self.deferred = True
+
+    def __exit__(self, *exc):
+        if not self.deferred:
+            self.finish()
+
+    def finish(self):
+        end = time.perf_counter()
+        logic_end = self.logic_end if self.logic_end is not None else end
+        self.profiler.record(self.name, (logic_end - self.start) * 1000, (end - logic_end) * 1000,
+                             self.profiler.widgets_created - self.created,
+                             self.profiler.widgets_deleted - self.deleted,
+                             self.profiler.renders - self.renders)
+
+
+# Pusty pomiar, gdy instrumentacja jest wyłączona - jeden wspólny obiekt, bez żadnej pracy
+class NullTimer:
+    def __enter__(self):
+        return self
+
+    def logic_done(self):
+        pass
+
+    def defer(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_TIMER = NullTimer()
+
+
+# Statystyki jednego rodzaju akcji
+class ActionStats:
+    def __init__(self):
+        self.count = 0
+        self.samples = {phase: deque(maxlen=WINDOW) for phase in PHASES}
+        self.histogram = {}  # Górna granica przedziału [ms] -> liczba akcji (czas całkowity)
+        self.widgets_created = 0
+        self.widgets_deleted = 0
+        self.renders = 0  # Odświeżenia planszy, które przypadły na te akcje (wspólne odświeżenie liczy się każdej)
+
+    def add(self, logic_ms, render_ms, created, deleted, renders):
+        total = logic_ms + render_ms
+        self.count += 1
+        self.samples['logic'].append(logic_ms)
+        self.samples['render'].append(render_ms)
+        self.samples['total'].append(total)
+        upper = bucket(total)
+        self.histogram[upper] = self.histogram.get(upper, 0) + 1
+        self.widgets_created += created
+        self.widgets_deleted += deleted
+        self.renders += renders
+
+    def summary(self):
+        result = {'count': self.count, 'widgets_created': self.widgets_created,
+                  'widgets_deleted': self.widgets_deleted, 'renders': self.renders}
+        for phase, values in self.samples.items():
+            ordered = sorted(values)
+            result[f'{phase}_ms'] = {'p50': percentile(ordered, 0.50), 'p95': percentile(ordered, 0.95),
+                                     'p99': percentile(ordered, 0.99), 'max': ordered[-1] if ordered else 0.0}
+        result['histogram_ms'] = {str(upper): n for upper, n in sorted(self.histogram.items())}
+        return result
+
+
+# Opcjonalna instrumentacja akcji gracza (włączana zmienną środowiskową lub flagą --profile)
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.output = None
+        self.actions = {}
+        self.widgets_created = 0
+        self.widgets_deleted = 0
+        self.renders = 0  # Liczba zbiorczych odświeżeń planszy
+        self.listeners = []  # Funkcje wywoływane po każdym pomiarze (np. nakładka w oknie)
+        self.sources = {}  # Nazwa -> (tytuł w nakładce, funkcja zwracająca słownik liczników, np. pamięci tekstur)
+
+    def add_source(self, name, title, stats):
+        """Dodatkowe liczniki w nakładce i w zapisie JSON (odczytywane przy każdym odświeżeniu)"""
+        self.sources[name] = (title, stats)
+
+    def enable(self, output=DEFAULT_OUTPUT):
+        self.enabled = True
+        self.output = output
+
+    def action(self, name):
+        """Kontekst pomiaru akcji: with profiler.action('draw') as timer: ... timer.logic_done() ..."""
+        if not self.enabled:
+            return NULL_TIMER
+        return ActionTimer(self, name)
+
+    def record(self, name, logic_ms, render_ms, created=0, deleted=0, renders=0):
+        stats = self.actions.get(name)
+        if stats is None:
+            stats = self.actions[name] = ActionStats()
+        stats.add(logic_ms, render_ms, created, deleted, renders)
+        for listener in self.listeners:
+            listener()
+
+    # Liczniki widżetów (wywoływane z konstruktorów widżetów kart i pól)
+    def widget_created(self, widget):
+        if self.enabled:
+            self.widgets_created += 1
+            widget.destroyed.connect(self.widget_destroyed)
+
+    def widget_destroyed(self, *args):
+        self.widgets_deleted += 1
+
+    def board_rendered(self):
+        """Wywoływane przez okno po każdym zbiorczym odświeżeniu planszy"""
+        if self.enabled:
+            self.renders += 1
+
+    def summary(self):
+        return {
+            'actions': {name: stats.summary() for name, stats in self.actions.items()},
+            'widgets': {'created': self.widgets_created, 'deleted': self.widgets_deleted,
+                        'alive': self.widgets_created - self.widgets_deleted},
+            'renders': self.renders,
+            **{name: stats() for name, (_, stats) in self.sources.items()},
+        }
+
+    def dump(self, path=None):
+        """Zapis statystyk do pliku JSON (przy zamykaniu aplikacji)"""
+        path = path or self.output
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+
+# Pomiar czasu uruchomienia aplikacji (flaga --startup-timing)
+class StartupTimer:
+    MILESTONES = ('first_paint', 'interactive', 'game_ui')  # Pierwsza klatka, gotowość do gry, zbudowany widok gry
+
+    def __init__(self, started_at, report_and_exit=False):
+        self.started_at = started_at
+        self.report_and_exit = report_and_exit  # Tryb pomiaru: wypisz wyniki i zamknij okno
+        self.marks = {}
+
+    def mark(self, name):
+        """Zapisuje czas pierwszego wystąpienia zdarzenia [ms od startu procesu]"""
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.started_at) * 1000
+        return self.marks[name]
+
+    def complete(self):
+        return all(name in self.marks for name in self.MILESTONES)
+
+    def report(self):
+        return json.dumps({f'{name}_ms': round(self.marks[name], 1) for name in self.MILESTONES if name in self.marks})
+
+
+# Nakładka w rogu okna z percentylami czasów akcji
+class ProfilerOverlay(QLabel):
+    def __init__(self, profiler, parent=None):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.setObjectName("ProfilerOverlay")  # Wygląd z arkusza stylów aplikacji
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        profiler.listeners.append(self.refresh)
+        self.refresh()
+
+    def refresh(self):
+        lines = ["akcja          n   logika p50/p95/p99   render p50/p95/p99 [ms]  odśw."]
+        for name, stats in self.profiler.actions.items():
+            row = stats.summary()
+            logic, render = row['logic_ms'], row['render_ms']
+            lines.append(f"{name:<12}{row['count']:>4}   {logic['p50']:5.1f} {logic['p95']:5.1f} {logic['p99']:5.1f}"
+                         f"    {render['p50']:5.1f} {render['p95']:5.1f} {render['p99']:5.1f}   {row['renders']:>4}")
+        lines.append(f"widżety: utworzone {self.profiler.widgets_created}, usunięte {self.profiler.widgets_deleted}, "
+                     f"odświeżenia planszy: {self.profiler.renders}")
+        for title, stats in self.profiler.sources.values():
+            lines.append(f"{title}: " + ", ".join(f"{key} {value}" for key, value in stats().items()))
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        if self.parentWidget() is not None:
+            self.move(self.parentWidget().width() - self.width() - 10, 30)
+        self.raise_()
+
+
+profiler = Profiler()  # Wspólny obiekt instrumentacji
+if os.environ.get(PROFILE_ENV):
+    value = os.environ[PROFILE_ENV]
+    profiler.enable(DEFAULT_OUTPUT if value == '1' else value)
@@ -1,9 +1,27 @@
+import time
+started_at = time.perf_counter()  # Początek pomiaru czasu do gotowości gry
+
+import argparse
 import sys
-from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
+    # Importy interfejsu wewnątrz warunku - procesy robocze podpowiedzi (spawn) wczytują ten plik ponownie
+    from PyQt5.QtWidgets import QApplication
+    from instrumentation import profiler, DEFAULT_OUTPUT
+    from main_window import MainWindow, BOARD_VIEWS
+
+    parser = argparse.ArgumentParser(description="Pasjans Klondike")
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_OUTPUT, metavar='PLIK.json',
+                        help="pomiar czasów akcji (nakładka w oknie, zapis JSON przy zamknięciu)")
+    parser.add_argument('--startup-timing', action='store_true',
+                        help="pomiar startu: czas do pierwszej klatki i do gotowości gry, potem zamknięcie")
+    parser.add_argument('--board', choices=BOARD_VIEWS, default='widgets',
+                        help="rysowanie planszy: osobne widżety kart albo jedna scena QGraphicsScene")
+    args, qt_args = parser.parse_known_args()  # Pozostałe argumenty trafiają do Qt
+    if args.profile:
+        profiler.enable(args.profile)
+    app = QApplication(sys.argv[:1] + qt_args)
+    app.setApplicationName("Pasjans Klondike")  # Katalog danych aplikacji (autozapis)
+    window = MainWindow(started_at, startup_timing=args.startup_timing, board_view=args.board)
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,42 +1,128 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QAction, QMessageBox, QApplication, QLabel
-from PyQt5.QtCore import QTimer, QTime, Qt
+import os
+import struct
+import time
+from collections import Counter
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, QAction, QActionGroup, QMessageBox, QLabel, QProgressBar
+from PyQt5.QtCore import QTimer, QTime, Qt, QStandardPaths, QRect, QPoint
 from PyQt5.QtGui import QFont
-from card_widgets import CardWidget, DropPlaceholder, CardColumnWidget
-from game_logic import GameLogic
+from card_widgets import (CardWidget, DropPlaceholder, CardColumnWidget, BackgroundWidget, HighlightFrame, card_metrics,
+                          card_size_for_window)
+from textures import texture_cache, AssetLoader, CARD_BACK
+from game_logic import GameLogic, STOCK, WASTE, FOUNDATION_PILES, TABLEAU_PILES
+from rules import VARIANTS, KLONDIKE
+from instrumentation import profiler, ProfilerOverlay, StartupTimer
+from savefile import save_game, load_game
+from animation import Animator, MOVE_MS, FLIP_MS, CHAIN_STAGGER_MS
+from stats_store import StatsStore, GameResult, WON, LOST, ALL_RULES
+
+BASE_WINDOW_SIZE = (1200, 850)  # Okno, dla którego karta ma 100 x 145 pikseli
+MIN_WINDOW_SIZE = (720, 510)  # Najmniejsze karty (60 pikseli szerokości) jeszcze się mieszczą
+RESIZE_DEBOUNCE_MS = 100  # Układ przeliczany dopiero, gdy rozmiar okna przestanie się zmieniać
+ALL_PILES = (STOCK, WASTE, *FOUNDATION_PILES, *TABLEAU_PILES)
+# Pozycje menu trudności: poziom jak w deal_index (EASY, MEDIUM, HARD) - moduł importowany dopiero przy losowaniu
+DIFFICULTY_MENU = [(None, "Dowolne rozdanie"), (0, "Łatwe"), (1, "Średnie"), (2, "Trudne")]
+STYLE_SHEET_PATH = "styles.qss"
+BOARD_VIEWS = ('widgets', 'scene')  # Plansza z osobnych widżetów albo jedna scena QGraphicsScene (scene_board)
+
+
+def install_style_sheet():
+    """Jeden arkusz stylów dla całej aplikacji - parsowany raz, a nie osobno dla każdego widżetu"""
+    app = QApplication.instance()
+    if app.styleSheet() or not os.path.exists(STYLE_SHEET_PATH):
+        return
+    with open(STYLE_SHEET_PATH, encoding='utf-8') as f:
+        app.setStyleSheet(f.read())
 
 
 class MainWindow(QMainWindow):
     """Główne okno aplikacji pasjansa Klondike"""
-    def __init__(self):
+    def __init__(self, started_at=None, startup_timing=False, board_view='widgets'):
         super().__init__()
+        self.board_view = board_view  # Sposób rysowania planszy (BOARD_VIEWS)
+        self.started_at = started_at if started_at is not None else time.perf_counter()  # Start procesu
+        self.startup = StartupTimer(self.started_at, report_and_exit=startup_timing)
         # Inicjalizacja podstawowych komponentów gry
         self.game = GameLogic()  # Logika gry
         self.foundation_symbols = ['♠', '♥', '♦', '♣']  # Symbole dla stosów docelowych
         
+        install_style_sheet()
         self.setup_window_properties()  # Konfiguracja właściwości okna
+        self.apply_layout()  # Rozmiar kart dla początkowego okna - tekstury wczytywane od razu w tym rozmiarze
         
-        # Przygotowanie obu widoków: ekranu startowego i widoku gry
+        # Przed pierwszą klatką powstaje tylko ekran startowy - widok gry buduje ensure_game_ui()
         self.setup_splash_screen()
-        self.setup_game_ui()
-        
         self.init_menu()  # Inicjalizacja menu
-        self.connect_signals()  # Podłączenie sygnałów
         
-        # Na starcie pokaż ekran powitalny
+        # Nakładka z czasami akcji i licznikami pamięci tekstur (tylko z włączoną instrumentacją)
+        if profiler.enabled:
+            profiler.add_source('textures', "tekstury", texture_cache.stats)
+        self.profiler_overlay = ProfilerOverlay(profiler, self) if profiler.enabled else None
+
+        # Na starcie pokaż ekran powitalny i wczytuj grafiki w tle
         self.setCentralWidget(self.splash_widget)
+        self.start_asset_loading()
 
     def setup_window_properties(self):
         """Konfiguracja podstawowych właściwości okna głównego"""
         self.setWindowTitle("Pasjans Klondike")
-        self.setGeometry(100, 100, 1200, 850)
+        self.setGeometry(self.initial_geometry())
         self.timer = QTimer(self)  # Timer do pomiaru czasu gry
         self.seconds_played = 0  # Licznik sekund gry
+        self.card_widgets = {}  # Trwałe widżety kart (kod karty -> CardWidget)
+        self.pile_cards = {}  # Stos -> kody kart widocznych na nim po ostatnim odświeżeniu
+        # Planista odświeżania: zmiany logiki tylko oznaczają stosy i liczniki, rysowanie raz na iterację pętli zdarzeń
+        self.dirty_piles = set()
+        self.stats_dirty = False
+        self.time_dirty = False
+        self.waiting_timers = []  # Pomiary akcji czekające na odświeżenie planszy
+        # Animacje ruchów: jeden wspólny harmonogram dla lotów i odwracania wszystkich kart
+        self.animator = Animator(self)
+        self.animator.finished.connect(self.on_animations_finished)
+        self.animate_pending = False  # Najbliższe odświeżenie pokaże ruch animacją (a nie przeskokiem)
+        self.animating = False  # Trwa odświeżenie z animacjami
+        self.flight_delays = {}  # Kod karty -> opóźnienie startu [ms] (łańcuch automatycznego kończenia gry)
+        self.stale_cards = set()  # Karty do ukrycia po wylądowaniu wszystkich lecących kart
+        self.win_pending = False  # Komunikat o wygranej czeka na koniec animacji
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(0)
+        self.render_timer.timeout.connect(self.render)
+        self.screen_signal_connected = False
+        self.resize_timer = QTimer(self)  # Opóźnione przeliczenie układu po zmianie rozmiaru okna
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self.resize_timer.timeout.connect(self.apply_layout)
+        self.main_game_widget = None  # Widok gry - tworzony leniwie (ensure_game_ui)
+        self.scene_board = None  # Plansza na scenie (tylko board_view == 'scene')
+        self.stuck_detector = None  # Wykrywanie martwych pozycji w tle (razem z widokiem gry)
+        self.stuck_reported = False  # Komunikat o braku ruchów pokazywany raz na pozycję bez postępu
+        self.hint_service = None  # Podpowiedzi Monte Carlo w puli procesów (razem z widokiem gry)
+        self.hint_frames = (HighlightFrame('#ffd700', self), HighlightFrame('#7CFC00', self))  # Źródło i cel podpowiedzi
+        self.rules = KLONDIKE  # Wariant zasad dla kolejnych rozdań
+        self.auto_complete_enabled = True  # Samoczynne dokończenie rozstrzygniętej partii
+        self.difficulty = None  # Trudność kolejnych rozdań (deal_index.EASY...), None - dowolne rozdanie
+        self.deal_indexes = {}  # Nazwa wariantu zasad -> otwarty indeks rozdań (lub None, gdy go nie ma)
+        self.missing_deals_reported = set()  # (wariant, trudność) - informacja o braku rozdań pokazana raz
+        self.autosave_path = self.default_autosave_path()  # Zapis bieżącej gry (ziarno + log ruchów)
+        self.saved_key = None  # Stan gry w autozapisie (save_key) - odświeżenia bez ruchu nie zapisują pliku
+        self.stats_store = None  # Historia partii i statystyki narastające (open_stats_store - po pierwszej klatce)
+        self.game_recorded = False  # Wynik bieżącej partii jest już w statystykach
+
+    @staticmethod
+    def initial_geometry():
+        """Okno 1200 x 850 przeskalowane do dostępnej części ekranu (od małych laptopów po 4K), wyśrodkowane"""
+        available = QApplication.primaryScreen().availableGeometry()
+        base_width, base_height = BASE_WINDOW_SIZE
+        scale = min(available.width() * 0.9 / base_width, available.height() * 0.9 / base_height, 2.0)
+        width, height = round(base_width * scale), round(base_height * scale)
+        return QRect(available.x() + (available.width() - width) // 2,
+                     available.y() + (available.height() - height) // 2, width, height)
 
     def setup_splash_screen(self):
         """Budowa ekranu startowego"""
-        self.splash_widget = QWidget()
-        self.splash_widget.setObjectName("mainWidget") # Używamy tej samej nazwy, by odziedziczyć tło
-        self.set_style_sheet(self.splash_widget) # Aplikujemy ten sam arkusz stylów
+        self.splash_widget = BackgroundWidget()
+        self.splash_widget.setObjectName("mainWidget") # Ta sama nazwa co widok gry - wspólne style przycisków
+        self.splash_widget.first_painted.connect(self.on_first_paint)
 
         layout = QVBoxLayout(self.splash_widget)
         layout.addStretch()
@@ -45,12 +131,7 @@ class MainWindow(QMainWindow):
         title_label = QLabel("Pasjans Klondike")
         title_font = QFont("Arial", 60, QFont.Bold)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("""
-            color: white; 
-            background: rgba(0, 0, 0, 0.4); 
-            padding: 20px; 
-            border-radius: 15px;
-        """)
+        title_label.setObjectName("TitleLabel")
         title_label.setAlignment(Qt.AlignCenter)
         
         layout.addWidget(title_label)
@@ -59,26 +140,94 @@ class MainWindow(QMainWindow):
         # Przyciski na ekranie startowym
         splash_buttons_layout = QHBoxLayout()
         splash_new_game_btn = QPushButton("🚀 Rozpocznij Grę")
+        splash_new_game_btn.setEnabled(False)  # Aktywny po wczytaniu grafik
+        self.splash_new_game_btn = splash_new_game_btn
+        splash_resume_btn = QPushButton("⏯ Wznów grę")
+        splash_resume_btn.setEnabled(False)
+        splash_resume_btn.setVisible(os.path.exists(self.autosave_path))  # Tylko gdy jest przerwana gra
+        self.splash_resume_btn = splash_resume_btn
         splash_exit_btn = QPushButton("❌ Wyjście")
         
         splash_buttons_layout.addStretch()
         splash_buttons_layout.addWidget(splash_new_game_btn)
         splash_buttons_layout.addSpacing(20)
+        splash_buttons_layout.addWidget(splash_resume_btn)
+        splash_buttons_layout.addSpacing(20)
         splash_buttons_layout.addWidget(splash_exit_btn)
         splash_buttons_layout.addStretch()
         
         layout.addLayout(splash_buttons_layout)
+        layout.addSpacing(20)
+
+        # Postęp wczytywania grafik
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setFormat("Wczytywanie kart... %p%")
+        self.loading_bar.setAlignment(Qt.AlignCenter)
+        self.loading_bar.setFixedWidth(400)
+        layout.addWidget(self.loading_bar, alignment=Qt.AlignCenter)
         layout.addStretch()
         
         # Podłączenie sygnałów dla przycisków na ekranie startowym
         splash_new_game_btn.clicked.connect(self.show_game_and_start)
+        splash_resume_btn.clicked.connect(self.resume_saved_game)
         splash_exit_btn.clicked.connect(self.close)
 
+    def start_asset_loading(self):
+        """Dekodowanie tła i tekstur kart w wątku roboczym podczas ekranu startowego"""
+        self.asset_loader = AssetLoader(texture_cache, self)
+        self.asset_loader.progress.connect(self.on_asset_progress)
+        self.asset_loader.assets_loaded.connect(self.on_assets_loaded)
+        self.asset_loader.start()
+
+    def on_asset_progress(self, done, total):
+        self.loading_bar.setMaximum(total)
+        self.loading_bar.setValue(done)
+
+    def on_assets_loaded(self, images):
+        """Grafiki gotowe - pierwsze rozdanie nie wymaga już odczytu z dysku"""
+        self.asset_loader.install(images)
+        self.splash_widget.update()
+        self.loading_bar.hide()
+        self.splash_new_game_btn.setEnabled(True)
+        self.splash_resume_btn.setEnabled(True)
+        ready_ms = self.startup.mark('interactive')
+        if profiler.enabled:  # Poza trybem pomiaru gra nie pisze na standardowe wyjście (--startup-timing ma własny raport)
+            print(f"Gotowe do gry po {ready_ms:.0f} ms")
+        self.check_startup_complete()
+
+    def on_first_paint(self):
+        """Ekran startowy już widoczny - widok gry powstaje w najbliższej wolnej chwili pętli zdarzeń"""
+        self.startup.mark('first_paint')
+        QTimer.singleShot(0, self.ensure_game_ui)
+        self.check_startup_complete()
+
+    def check_startup_complete(self):
+        """Tryb pomiaru startu (--startup-timing): wypisanie czasów i zamknięcie okna"""
+        if self.startup.report_and_exit and self.startup.complete():
+            print(self.startup.report())
+            QTimer.singleShot(0, self.close)
+
+    def ensure_game_ui(self):
+        """Budowa widoku gry przy pierwszej potrzebie - kolejne wywołania nic nie robią"""
+        if self.main_game_widget is not None:
+            return
+        # Moduły z pulami wątków i procesów importowane dopiero tutaj - nie opóźniają pierwszej klatki
+        from stuck_detector import StuckDetector
+        from hint_service import HintService
+        self.stuck_detector = StuckDetector(self)
+        self.hint_service = HintService(parent=self)
+        self.open_stats_store()
+        self.setup_game_ui()
+        self.connect_signals()
+        self.startup.mark('game_ui')
+        self.check_startup_complete()
+
     def setup_game_ui(self):
         """Budowa głównego interfejsu użytkownika gry""" 
-        self.main_game_widget = QWidget()
+        self.main_game_widget = BackgroundWidget()
         self.main_game_widget.setObjectName("mainWidget")
-        self.set_style_sheet(self.main_game_widget)
+        # Okno można zmniejszyć poniżej układu dla bieżących kart - karty zmniejszą się po chwili (apply_layout)
+        self.main_game_widget.setMinimumSize(*MIN_WINDOW_SIZE)
         
         # Główne layouty
         main_layout = QVBoxLayout(self.main_game_widget)
@@ -88,53 +237,31 @@ class MainWindow(QMainWindow):
         button_row = QHBoxLayout()  # Wiersz przycisków
 
         # Inicjalizacja i konfiguracja widgetów
-        self.init_stock_and_waste(top_row)
-        self.init_foundations(top_row)
-        self.init_tableau(tableau_row)
+        if self.board_view == 'scene':
+            self.init_scene_board()
+        else:
+            self.init_stock_and_waste(top_row)
+            self.init_foundations(top_row)
+            self.init_tableau(tableau_row)
         self.init_stats(stats_row)
         self.init_buttons(button_row)
 
         # Składanie layoutów
-        main_layout.addLayout(top_row)
-        main_layout.addSpacing(20)
-        main_layout.addLayout(tableau_row)
-        main_layout.addStretch()
+        if self.scene_board is not None:
+            main_layout.addWidget(self.scene_board, 1)
+        else:
+            main_layout.addLayout(top_row)
+            main_layout.addSpacing(20)
+            main_layout.addLayout(tableau_row)
+            main_layout.addStretch()
         main_layout.addLayout(stats_row)
         main_layout.addLayout(button_row)
 
-    def set_style_sheet(self, widget):
-        """Ustawienie stylów CSS dla aplikacji"""
-        # Dodajemy import czcionki na górze pliku
-        from PyQt5.QtCore import Qt
-        widget.setStyleSheet("""
-            QWidget#mainWidget { 
-                border-image: url(resources/background.png) 0 0 0 0 stretch stretch;
-            }
-            QPushButton { 
-                background-color: white; 
-                border: 1px solid #888; 
-                padding: 10px 15px; /* Lekko powiększone dla lepszego wyglądu */
-                border-radius: 5px; 
-                min-width: 120px; /* Lekko poszerzone */
-                font-size: 14px; /* Dodano dla spójności */
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #f0f0f0; }
-            QPushButton:disabled { background-color: #d0d0d0; color: #888888; }
-            QLabel#StatsLabel {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                background: rgba(0, 0, 0, 0.5);
-                padding: 5px;
-                border-radius: 4px;
-            }           
-        """)
-
     def init_stock_and_waste(self, layout):
         """Inicjalizacja widgetów talii i stosu odrzuconych"""
         self.stock_placeholder = DropPlaceholder()
         self.waste_placeholder = DropPlaceholder()
+        self.stock_widget = None  # Jedna zakryta karta reprezentuje całą talię (tworzona przy pierwszym rozdaniu)
         layout.addWidget(self.stock_placeholder)
         layout.addWidget(self.waste_placeholder)
         layout.addStretch()
@@ -143,8 +270,11 @@ class MainWindow(QMainWindow):
         """Inicjalizacja widgetów stosów docelowych"""
         self.foundations_placeholders = []
         for i in range(4):
-            f = DropPlaceholder(label="") 
+            f = DropPlaceholder(label=self.foundation_symbols[i])
             f.setObjectName(f"foundation_{i}")
+            f.label.setObjectName("FoundationLabel")  # Duży symbol koloru (styles.qss)
+            f.pile = ('foundation', i)
+            f.validator = self.is_legal_drop
             layout.addWidget(f)
             self.foundations_placeholders.append(f)
 
@@ -154,9 +284,18 @@ class MainWindow(QMainWindow):
         for i in range(7):
             col = CardColumnWidget()
             col.setObjectName(f"tableau_{i}")
+            col.pile = ('tableau', i)
+            col.validator = self.is_legal_drop
             layout.addWidget(col)
             self.tableau_columns.append(col)
 
+    def init_scene_board(self):
+        """Inicjalizacja planszy na scenie - karty to elementy sceny ze wspólnymi teksturami, a nie widżety"""
+        from scene_board import SceneBoard
+        self.scene_board = SceneBoard(self.foundation_symbols, self.is_legal_drop, self.animator)
+        self.card_widgets = self.scene_board.cards  # render() ukrywa elementy kart tak samo jak widżety
+        self.hint_frames = self.scene_board.hint_frames
+
     def init_stats(self, layout):
         """Inicjalizacja widgetów statystyk"""
         self.time_label = QLabel("Czas: 00:00")
@@ -182,28 +321,70 @@ class MainWindow(QMainWindow):
         """Inicjalizacja przycisków sterujących"""
         self.new_game_btn = QPushButton("🎲 Nowa gra")
         self.undo_btn = QPushButton("⏪ Cofnij")
+        self.hint_btn = QPushButton("💡 Podpowiedź")
         self.exit_btn = QPushButton("❌ Wyjście")
         layout.addWidget(self.new_game_btn)
         layout.addWidget(self.undo_btn)
+        layout.addWidget(self.hint_btn)
         layout.addStretch()
         layout.addWidget(self.exit_btn)
 
     def init_menu(self):
         """Inicjalizacja menu głównego"""
         menu = self.menuBar()
-        menu.setStyleSheet("color: black; background-color: white;")
         help_menu = menu.addMenu("⚙️ Ustawienia")
         help_action = QAction("❓ Pomoc", self)
         help_action.triggered.connect(self.show_help)
         help_menu.addAction(help_action)
+        stats_action = QAction("📊 Statystyki", self)
+        stats_action.triggered.connect(self.show_statistics)
+        help_menu.addAction(stats_action)
+        auto_complete_action = QAction("🏁 Automatyczne kończenie gry", self, checkable=True)
+        auto_complete_action.setChecked(self.auto_complete_enabled)
+        auto_complete_action.toggled.connect(self.set_auto_complete)
+        help_menu.addAction(auto_complete_action)
+        animations_action = QAction("🎞 Animacje ruchów", self, checkable=True)
+        animations_action.setChecked(self.animator.enabled)
+        animations_action.toggled.connect(self.set_animations)
+        help_menu.addAction(animations_action)
+
+        # Wybór wariantu zasad (obowiązuje od następnego rozdania)
+        rules_menu = menu.addMenu("🃏 Zasady")
+        rules_group = QActionGroup(self)
+        self.rules_actions = {}
+        for rules in VARIANTS:
+            action = QAction(rules.title, self, checkable=True)
+            action.setChecked(rules is self.rules)
+            action.triggered.connect(lambda checked, rules=rules: self.select_rules(rules))
+            rules_group.addAction(action)
+            rules_menu.addAction(action)
+            self.rules_actions[rules.name] = action
+
+        # Trudność rozdań z indeksu zbudowanego przez deal_index.py (obowiązuje od następnego rozdania)
+        difficulty_menu = menu.addMenu("🎚 Trudność")
+        difficulty_group = QActionGroup(self)
+        for difficulty, title in DIFFICULTY_MENU:
+            action = QAction(title, self, checkable=True)
+            action.setChecked(difficulty == self.difficulty)
+            action.triggered.connect(lambda checked, difficulty=difficulty: self.select_difficulty(difficulty))
+            difficulty_group.addAction(action)
+            difficulty_menu.addAction(action)
 
     def connect_signals(self):
         """Podłączenie sygnałów do slotów"""
         # Sygnały dla przycisków w grze
         self.new_game_btn.clicked.connect(self.start_new_game)
         self.undo_btn.clicked.connect(self.undo_move)
+        self.hint_btn.clicked.connect(self.request_hint)
+        self.hint_service.hint_ready.connect(self.show_hint)
         self.exit_btn.clicked.connect(self.close)
         self.timer.timeout.connect(self.timer_tick)
+        self.stuck_detector.position_dead.connect(self.show_stuck_message)
+        if self.scene_board is not None:
+            self.scene_board.stock_clicked.connect(self.handle_stock_click)
+            self.scene_board.card_dropped.connect(self.handle_drop)
+            self.scene_board.card_double_clicked.connect(self.handle_card_double_click)
+            return
         self.stock_placeholder.clicked.connect(self.handle_stock_click)
         
         for col in self.tableau_columns:
@@ -212,146 +393,475 @@ class MainWindow(QMainWindow):
         for f in self.foundations_placeholders:
             f.card_dropped.connect(self.handle_drop_on_foundation)
 
-    def clear_all_cards(self):
-        """Usuwa wszystkie karty z interfejsu"""
-        for placeholder in [self.stock_placeholder, self.waste_placeholder] + self.foundations_placeholders:
-            for child in placeholder.findChildren(CardWidget):
-                child.deleteLater()
-                
-        for column in self.tableau_columns:
-            column.cards.clear()
-            for child in column.findChildren(CardWidget):
-                child.deleteLater()
-
-    def update_board_from_logic(self):
-        """Aktualizuje interfejs na podstawie stanu logiki gry"""
-        self.clear_all_cards()
-        QApplication.processEvents()
-        
-        # Aktualizacja talii i stosu odrzuconych
-        if self.game.stock:
-            CardWidget(('tył_karty', ''), parent=self.stock_placeholder, draggable=False).show()
-            
-        if self.game.waste:
-            top_card = self.game.waste[-1]
-            card_data = (top_card['suit'], top_card['rank'])
-            widget = CardWidget(card_data, parent=self.waste_placeholder, source=('waste', 0))
+    def card_widget(self, card):
+        """Zwraca trwały widżet karty (tworzony tylko przy pierwszym użyciu)"""
+        widget = self.card_widgets.get(card.code)
+        if widget is None:
+            widget = CardWidget(CARD_BACK, parent=self.stock_placeholder, draggable=False)
             widget.card_double_clicked.connect(self.handle_card_double_click)
+            widget.hide()
+            widget.slot = None  # (rodzic, x, y) ostatniego położenia
+            self.card_widgets[card.code] = widget
+        return widget
+
+    def place_card(self, card, parent, x, y, source, restack=False, origin=None):
+        """Ustawia widżet karty w danym miejscu - zmienia tylko to, co się zmieniło.
+
+        Zwraca True, jeśli karta została przeniesiona na wierzch (kolejne karty w kolumnie też muszą).
+        Karta bez źródła (source=None) jest tylko widoczna - nie da się jej przeciągnąć.
+        Przy animowanym odświeżeniu karta przylatuje ze swojego miejsca (niewidoczna - z origin, np. z talii).
+        """
+        widget = self.card_widget(card)
+        self.animator.finish(('flip', widget))
+        card_data = card.card_data if card.face_up else CARD_BACK
+        draggable = card.face_up and source is not None
+        slot = (parent, x, y)
+        if self.animating and widget.slot == slot and widget.card_data == CARD_BACK and card_data != CARD_BACK:
+            widget.update_card(CARD_BACK, source, draggable)
+            self.flip_card(widget, card_data)  # Odkryta karta obraca się w miejscu
+        else:
+            widget.update_card(card_data, source, draggable)
+        if widget.slot != slot:
+            start = widget if widget.isVisible() else origin
+            if self.animating and start is not None:
+                self.fly_card(widget, start, parent, x, y, self.flight_delays.get(card.code, 0))
+            else:
+                if widget.parentWidget() is not parent:
+                    widget.setParent(parent)
+                widget.move(x, y)
+            widget.slot = slot
+            restack = True
+        if restack:
+            widget.raise_()
+        if widget.isHidden():
             widget.show()
+        return restack
 
-        # Aktualizacja stosów docelowych
-        for i, pile in enumerate(self.game.foundations):
+    def update_pile(self, pile):
+        """Aktualizuje widżety jednego stosu; zwraca widoczne na nim karty"""
+        pile_type, i = pile
+        cards = self.game.pile(pile_type, i)
+        shown = self.shown_cards(pile, cards)
+        if self.scene_board is not None:
+            self.scene_board.update_pile(pile, cards, shown, self.animating, self.flight_delays)
+            return shown
+        if pile_type == 'stock':
+            if self.stock_widget is None:
+                self.stock_widget = CardWidget(CARD_BACK, parent=self.stock_placeholder, draggable=False)
+            self.stock_widget.setVisible(bool(cards))
+            return shown
+        if pile_type == 'waste':
+            restack = False
+            for j, card in enumerate(shown):
+                source = ('waste', 0) if j == len(shown) - 1 else None
+                restack = self.place_card(card, self.waste_placeholder, j * card_metrics.fan_offset, 0, source, restack,
+                                          origin=self.stock_placeholder)
+            return shown
+        if pile_type == 'foundation':
             placeholder = self.foundations_placeholders[i]
-            if not pile:
-                symbol = self.foundation_symbols[i]
-                placeholder.label.setText(symbol)
-                placeholder.label.setStyleSheet("""
-                    background-color: rgba(255, 255, 255, 0.4); 
-                    border: 2px dashed rgba(0, 0, 0, 0.4); 
-                    border-radius: 8px;
-                    color: rgba(0,0,0,0.5); 
-                    font-size: 70px; 
-                    font-family: 'Times New Roman';
-                """)
-                placeholder.label.show()
-            else:
-                placeholder.label.hide()
-                top_card = pile[-1]
-                card_data = (top_card['suit'], top_card['rank'])
-                CardWidget(card_data, parent=placeholder, source=('foundation', i)).show()
-
-        # Aktualizacja kolumn roboczych
-        for i, pile in enumerate(self.game.tableau):
-            column_widget = self.tableau_columns[i]
-            if not pile:
-                column_widget.placeholder.show()
-            else:
-                column_widget.placeholder.hide()
-                
-            for j, card_info in enumerate(pile):
-                card_data = (card_info['suit'], card_info['rank'])
-                is_draggable = card_info['face_up']
-                display_data = card_data if is_draggable else ('tył_karty', '')
-                source_id = ('tableau', i, j)
-                widget = CardWidget(display_data, parent=column_widget, source=source_id, draggable=is_draggable)
-                widget.card_double_clicked.connect(self.handle_card_double_click)
-                y_offset = 10 + j * 30
-                widget.move(10, y_offset)
+            placeholder.label.setVisible(not cards)
+            restack = False
+            for card in shown:
+                source = ('foundation', i) if card is cards[-1] else None
+                restack = self.place_card(card, placeholder, 0, 0, source, restack)
+            return shown
+        column_widget = self.tableau_columns[i]
+        column_widget.placeholder.setVisible(not cards)
+        restack = False
+        for j, card in enumerate(cards):
+            rect = card_metrics.card_rect(j)
+            restack = self.place_card(card, column_widget, rect.x(), rect.y(), ('tableau', i, j), restack)
+        column_widget.cards = [self.card_widgets[card.code] for card in cards]
+        return cards
+
+    def shown_cards(self, pile, cards):
+        """Karty stosu, które mają widżety na planszy"""
+        pile_type = pile[0]
+        if pile_type == 'stock':
+            return []  # Talię reprezentuje jedna zakryta karta
+        if pile_type == 'waste':
+            # Przy dobieraniu po 3 widać rozłożone 3 wierzchnie karty, ale tylko ostatnią można przenieść
+            return cards[-self.game.rules.draw_count:]
+        if pile_type == 'foundation':
+            # Wierzchnia karta i - przy animacji - wszystkie, które dopiero przylatują (łańcuch automatycznego kończenia)
+            count = 1
+            if self.animating:
+                previous = self.pile_cards.get(pile, ())
+                while count < len(cards) and self.is_flying_in(cards[-1 - count], previous):
+                    count += 1
+            return cards[-count:]
+        return cards
+
+    # Metody animacji
+    def is_flying_in(self, card, previous):
+        """Czy karta trafia na stos z innego, widocznego miejsca planszy (a więc przeleci)"""
+        widget = self.card_widgets.get(card.code)
+        return card.code not in previous and widget is not None and widget.isVisible()
+
+    def fly_card(self, widget, start_widget, parent, x, y, delay=0):
+        """Lot karty nad planszą (dziecko widoku gry) - do docelowego rodzica trafia dopiero po wylądowaniu"""
+        layer = self.main_game_widget
+        start = start_widget.mapTo(layer, QPoint(0, 0))
+        end = parent.mapTo(layer, QPoint(x, y))
+        if widget.parentWidget() is not layer:
+            widget.setParent(layer)
+        widget.move(start)
+
+        def step(t):
+            widget.move(start + (end - start) * t)
+
+        def land():
+            hidden = widget.isHidden()
+            widget.setParent(parent)  # Nowe dziecko leży na wierzchu rodzica
+            widget.move(x, y)
+            if not hidden:
                 widget.show()
-                column_widget.cards.append(widget)
-                
-        self.update_stats_display()
-        QApplication.processEvents()
+
+        self.animator.add(widget, MOVE_MS, step, land, delay)
+
+    def flip_card(self, widget, card_data):
+        """Odwrócenie karty w miejscu: rewers zwęża się do krawędzi, a z niej rozszerza się awers"""
+        rect = widget.geometry()
+
+        def step(t):
+            if t >= 0.5 and widget.card_data != card_data:
+                widget.update_card(card_data, widget.source, widget.is_draggable)
+            width = max(1, round(rect.width() * abs(1 - 2 * t)))
+            widget.setFixedWidth(width)
+            widget.move(rect.x() + (rect.width() - width) // 2, rect.y())
+
+        def done():
+            widget.setFixedSize(rect.size())
+            widget.move(rect.topLeft())
+
+        self.animator.add(('flip', widget), FLIP_MS, step, done)
+
+    def on_animations_finished(self):
+        """Wszystkie karty wylądowały - ukrycie kart, które zniknęły z planszy w czasie lotu"""
+        visible = set().union(*self.pile_cards.values())
+        for code in self.stale_cards - visible:
+            self.card_widgets[code].hide()
+        self.stale_cards.clear()
+        covered = [pile for pile in FOUNDATION_PILES if len(self.pile_cards.get(pile, ())) > 1]
+        if covered:
+            self.request_render(*covered)  # Karty łańcucha leżą już pod wierzchnią kartą stosu docelowego
+        if self.win_pending:
+            self.show_win_message()
+
+    # Planista odświeżania planszy
+    def request_render(self, *piles, timer=None, animate=False):
+        """Oznacza stosy i liczniki jako zmienione - plansza zostanie odświeżona raz, w najbliższej iteracji pętli zdarzeń.
+
+        animate=True - karty przeniesione ruchem gracza przelecą na nowe miejsca (gdy animacje są włączone).
+        """
+        self.dirty_piles.update(piles)
+        self.animate_pending |= animate
+        self.stats_dirty = True
+        if timer is not None:
+            timer.defer()  # Pomiar akcji obejmie też odświeżenie
+            self.waiting_timers.append(timer)
+        self.schedule_render()
+
+    def schedule_render(self):
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def render(self):
+        """Zbiorcze odświeżenie: tylko stosy i liczniki oznaczone od poprzedniego odświeżenia"""
+        self.render_timer.stop()
+        piles, self.dirty_piles = self.dirty_piles, set()
+        self.animating = self.animate_pending and self.animator.enabled
+        self.animate_pending = False
+        if piles:
+            self.clear_hint()  # Podpowiedź dotyczyła poprzedniej pozycji
+            # Karta przenoszona między stosami jest w obu zbiorach - ukrywane są tylko te, które zniknęły z widoku
+            previously_visible = set()
+            visible = set()
+            for pile in piles:
+                previously_visible |= self.pile_cards.get(pile, set())
+                codes = {card.code for card in self.update_pile(pile)}
+                self.pile_cards[pile] = codes
+                visible |= codes
+            if self.animator.busy():
+                self.stale_cards |= previously_visible - visible  # Zakryte przez lecącą kartę - ukrywane po wylądowaniu
+            else:
+                for code in previously_visible - visible:
+                    self.card_widgets[code].hide()
+        self.animating = False
+        self.flight_delays.clear()
+
+        if self.stats_dirty:
+            self.update_stats_display()
+        elif self.time_dirty:
+            self.update_time_display()
+        self.stats_dirty = self.time_dirty = False
+
+        if piles:
+            profiler.board_rendered()
+            self.stuck_detector.check(self.game)
+            if self.save_key() != self.saved_key:  # Zmiana rozmiaru, podpowiedź itp. nie zmieniają gry
+                self.autosave()
+        timers, self.waiting_timers = self.waiting_timers, []
+        for timer in timers:
+            timer.finish()
+
+    def update_board_from_logic(self):
+        """Natychmiastowe odświeżenie całej planszy (z pominięciem planisty, np. w pomiarach)"""
+        self.dirty_piles.update(ALL_PILES)
+        self.stats_dirty = True
+        self.render()
+
+    def apply_layout(self):
+        """Rozmiar kart dopasowany do okna i gęstości pikseli ekranu - widżety przeliczane tylko przy zmianie kubełka rozmiaru"""
+        size = card_size_for_window(self.width(), self.height())
+        if not texture_cache.configure(size=size, device_pixel_ratio=self.devicePixelRatioF()):
+            return False
+        with profiler.action('resize') as timer:
+            self.animator.finish_all()  # Lądowiska liczone dla poprzedniego rozmiaru kart
+            card_metrics.resize(size)
+            if self.scene_board is not None:
+                self.scene_board.apply_metrics()
+            elif self.main_game_widget is not None:
+                for widget in list(self.card_widgets.values()) + [self.stock_widget]:
+                    if widget is not None:
+                        widget.apply_metrics()
+                for placeholder in [self.stock_placeholder] + self.foundations_placeholders:
+                    placeholder.apply_metrics()
+                for column in self.tableau_columns:
+                    column.apply_metrics()
+            if self.main_game_widget is not None:
+                self.update_waste_layout()
+                timer.logic_done()
+                self.request_render(*ALL_PILES, timer=timer)  # Nowe położenia kart
+        return True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.screen_signal_connected and self.windowHandle():
+            self.windowHandle().screenChanged.connect(lambda screen: self.apply_layout())
+            self.screen_signal_connected = True
+
+    def closeEvent(self, event):
+        self.asset_loader.wait()  # Wątek wczytujący nie może przeżyć okna
+        self.win_pending = False  # Koniec animacji przy zamykaniu nie może otworzyć komunikatu o wygranej
+        self.animator.finish_all()
+        if self.centralWidget() is self.main_game_widget:
+            self.autosave()  # Zapis z aktualnym czasem gry
+        if self.main_game_widget is not None:
+            self.stuck_detector.shutdown()
+            self.hint_service.shutdown()
+        if self.stats_store is not None:
+            self.stats_store.shutdown()  # Czeka na zapis wyników zakończonych partii
+        for index in self.deal_indexes.values():
+            if index is not None:
+                index.close()
+        if profiler.enabled:
+            print(f"Zapisano pomiary: {profiler.dump()}")
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_timer.start()  # Kolejne zdarzenia w trakcie przeciągania krawędzi okna tylko przesuwają termin
+        if self.profiler_overlay is not None:
+            self.profiler_overlay.refresh()
 
     def update_stats_display(self):
         """Aktualizuje wyświetlane statystyki gry"""
-        time_str = QTime(0, 0).addSecs(self.seconds_played).toString("mm:ss")
-        self.time_label.setText(f"Czas: {time_str}")
+        self.update_time_display()
         self.score_label.setText(f"Punkty: {self.game.score}")
         self.moves_label.setText(f"Ruchy: {self.game.moves}")
         self.undo_label.setText(f"Cofnięć: {self.game.undo_count}/3")
         self.undo_btn.setEnabled(self.game.undo_count > 0 and bool(self.game.history))
 
+    def update_time_display(self):
+        time_str = QTime(0, 0).addSecs(self.seconds_played).toString("mm:ss")
+        self.time_label.setText(f"Czas: {time_str}")
+
+    # Metody podpowiedzi
+    def request_hint(self):
+        """Zlecenie podpowiedzi - wynik przychodzi po upływie budżetu czasu"""
+        self.hint_btn.setEnabled(False)
+        self.hint_service.request(self.game)
+
+    def show_hint(self, move):
+        """Zaznaczenie ramkami źródła i celu podpowiedzianego ruchu"""
+        self.hint_btn.setEnabled(True)
+        if move is None:
+            QMessageBox.information(self, "Podpowiedź", "Brak ruchów do podpowiedzenia.")
+            return
+        source, destination, count = move
+        source_frame, target_frame = self.hint_frames
+        if source[0] == 'tableau':
+            # Cały przenoszony ciąg kart (odstęp kart w kolumnie według card_metrics)
+            start = len(self.game.tableau[source[1]]) - count
+            source_frame.show_on(self.pile_widget(source), card_metrics.card_rect(start, count))
+        else:
+            source_frame.show_on(self.pile_widget(source))
+        if destination[0] == 'tableau':
+            size = len(self.game.tableau[destination[1]])
+            target_frame.show_on(self.pile_widget(destination), card_metrics.card_rect(max(size - 1, 0)))
+        else:
+            target_frame.show_on(self.pile_widget(destination))
+
+    def pile_widget(self, pile):
+        """Widżet stosu (na planszy ze sceny - element sceny PileItem)"""
+        if self.scene_board is not None: return self.scene_board.piles[pile]
+        if pile[0] == 'tableau': return self.tableau_columns[pile[1]]
+        if pile[0] == 'stock': return self.stock_placeholder
+        if pile[0] == 'waste': return self.waste_placeholder
+        return self.foundations_placeholders[pile[1]]
+
+    def clear_hint(self):
+        self.hint_service.cancel()
+        self.hint_btn.setEnabled(True)
+        for frame in self.hint_frames:
+            frame.hide()
+
+    # Metody zapisu gry
+    @staticmethod
+    def default_autosave_path():
+        directory = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        return os.path.join(directory, 'autosave.psj')
+
+    def save_key(self):
+        """Skrót stanu gry zapisywanego w autozapisie (rozdanie, pozycja, log ruchów, cofnięcia) - liczony w O(1)"""
+        game = self.game
+        return game.seed, game.position_hash(), len(game.move_log), game.undo_count
+
+    def autosave(self):
+        """Zapis bieżącej gry - kilkaset bajtów, podmieniany atomowo"""
+        if self.game.check_win_condition():
+            return
+        try:
+            os.makedirs(os.path.dirname(self.autosave_path), exist_ok=True)
+            save_game(self.autosave_path, self.game, self.seconds_played)
+            self.saved_key = self.save_key()
+        except OSError as e:
+            print(f"Nie udało się zapisać gry: {e}")
+
+    def remove_autosave(self):
+        self.saved_key = None
+        try:
+            os.remove(self.autosave_path)
+        except FileNotFoundError:
+            pass
+
+    # Metody statystyk
+    @staticmethod
+    def default_stats_path():
+        directory = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        return os.path.join(directory, 'stats.sqlite')
+
+    def open_stats_store(self):
+        """Wątek zapisu i baza statystyk powstają razem z widokiem gry albo przy pierwszym otwarciu statystyk"""
+        if self.stats_store is None:
+            self.stats_store = StatsStore(self.default_stats_path(), self)
+        return self.stats_store
+
+    def record_game(self, outcome):
+        """Wynik zakończonej partii do statystyk - zapis w wątku roboczym, raz na partię"""
+        if self.game_recorded:
+            return
+        self.game_recorded = True
+        self.open_stats_store().record(GameResult.from_game(self.game, outcome, self.seconds_played))
+
     # Metody obsługi zdarzeń
     def timer_tick(self):
         """Aktualizacja czasu gry"""
         self.seconds_played += 1
-        self.update_stats_display()
+        self.time_dirty = True
+        self.schedule_render()
 
     def handle_stock_click(self):
         """Obsługa kliknięcia na stosie kart"""
-        if self.game.draw_from_stock():
-            self.update_board_from_logic()
+        with profiler.action('draw') as timer:
+            if self.game.draw_from_stock():
+                timer.logic_done()
+                self.request_render(STOCK, WASTE, timer=timer, animate=True)
 
     def handle_card_double_click(self, source_info):
         """Obsługa podwójnego kliknięcia na karcie"""
-        moved = False
-        card_to_move = None
-        source_type, source_idx, *rest = source_info
-        
-        if source_type == 'tableau':
-            card_idx = rest[0]
-            if card_idx == len(self.game.tableau[source_idx]) - 1:
-                card_to_move = self.game.tableau[source_idx][card_idx]
-        elif source_type == 'waste' and self.game.waste:
-            card_to_move = self.game.waste[-1]
-            
-        if card_to_move:
-            self.game.save_state()
-            for i in range(4):
-                if self.game.is_valid_for_foundation(card_to_move, i):
-                    self.game.perform_move([card_to_move], (source_type, source_idx), ('foundation', i))
-                    moved = True
-                    break
-                    
-            if not moved:
-                self.game.history.pop()
-                
-        if moved:
-            self.update_board_from_logic()
-            if self.game.check_win_condition(): 
-                self.show_win_message()
+        with profiler.action('double_click') as timer:
+            moved = False
+            card_to_move = None
+            source_type, source_idx, *rest = source_info
+
+            if source_type == 'tableau':
+                card_idx = rest[0]
+                if card_idx == len(self.game.tableau[source_idx]) - 1:
+                    card_to_move = self.game.tableau[source_idx][card_idx]
+            elif source_type == 'waste' and self.game.waste:
+                card_to_move = self.game.waste[-1]
+
+            if card_to_move:
+                for i in range(4):
+                    if self.game.is_valid_for_foundation(card_to_move, i):
+                        destination = ('foundation', i)
+                        self.game.perform_move([card_to_move], (source_type, source_idx), destination)
+                        moved = True
+                        break
+
+            if moved:
+                piles = ALL_PILES if self.auto_complete() else ((source_type, source_idx), destination)
+                timer.logic_done()
+                self.request_render(*piles, timer=timer, animate=True)
+
+        if moved and self.game.check_win_condition():
+            self.show_win_message()
 
     def handle_drop(self, source_info, destination_info):
         """Obsługa upuszczenia karty"""
-        card_stack_to_move = []
+        with profiler.action('drop') as timer:
+            source_type, source_idx = source_info[:2]
+            card_stack_to_move = self.drag_stack(source_info)
+            moved = bool(card_stack_to_move) and self.game.attempt_move(
+                card_stack_to_move, (source_type, source_idx), destination_info)
+            if moved:
+                piles = ALL_PILES if self.auto_complete() else ((source_type, source_idx), destination_info)
+                timer.logic_done()
+                self.request_render(*piles, timer=timer, animate=True)
+
+        if moved and self.game.check_win_condition():
+            self.show_win_message()
+
+    def auto_complete(self):
+        """Dokończenie rozstrzygniętej partii w logice gry - planszę odświeża potem jedno zbiorcze odświeżenie.
+
+        Zwraca listę wykonanych ruchów.
+        """
+        if not self.auto_complete_enabled:
+            return []
+        moves = self.game.auto_complete()
+        # Karty łańcucha startują po kolei, w kolejności ruchów (każdy ruch to jedna karta na stos docelowy)
+        landed = Counter(destination for _, destination, _ in moves)
+        placed = Counter()
+        for n, (_, destination, _) in enumerate(moves):
+            pile = self.game.foundations[destination[1]]
+            card = pile[len(pile) - landed[destination] + placed[destination]]
+            placed[destination] += 1
+            self.flight_delays[card.code] = n * CHAIN_STAGGER_MS
+        return moves
+
+    def set_auto_complete(self, enabled):
+        self.auto_complete_enabled = enabled
+
+    def set_animations(self, enabled):
+        self.animator.enabled = enabled
+        if not enabled:
+            self.animator.finish_all()
+
+    def drag_stack(self, source_info):
+        """Karty przenoszone z podanego źródła: ciąg od wskazanej karty kolumny lub wierzchnia karta stosu"""
         source_type, source_idx, *rest = source_info
-        
         if source_type == 'tableau':
-            card_idx_in_stack = rest[0]
-            card_stack_to_move = self.game.tableau[source_idx][card_idx_in_stack:]
-        elif source_type == 'waste' and self.game.waste:
-            card_stack_to_move = [self.game.waste[-1]]
-        elif source_type == 'foundation' and self.game.foundations[source_idx]:
-            card_stack_to_move = [self.game.foundations[source_idx][-1]]
-            
-        if not card_stack_to_move: 
-            return
-            
-        if self.game.attempt_move(card_stack_to_move, (source_type, source_idx), destination_info):
-            self.update_board_from_logic()
-            if self.game.check_win_condition(): 
-                self.show_win_message()
+            return self.game.tableau[source_idx][rest[0]:]
+        pile = self.game.pile(source_type, source_idx)
+        return pile[-1:] if source_type in ('waste', 'foundation') else []
+
+    def is_legal_drop(self, source_info, destination):
+        """Walidacja upuszczenia przy wejściu przeciąganej karty nad cel (bez wykonywania ruchu)"""
+        card_stack = self.drag_stack(source_info)
+        return bool(card_stack) and self.game.is_valid_move(card_stack, destination)
 
     def handle_drop_on_tableau(self, source, dest_widget):
         """Obsługa upuszczenia na kolumnę roboczą"""
@@ -365,20 +875,95 @@ class MainWindow(QMainWindow):
 
     def show_game_and_start(self):
         """Zamienia widget na widok gry i rozpoczyna nową grę."""
+        self.ensure_game_ui()
+        self.takeCentralWidget()  # Ekran startowy nie jest usuwany - wątek wczytujący może go jeszcze aktualizować
         self.setCentralWidget(self.main_game_widget)
         self.start_new_game()
         
+    def resume_saved_game(self):
+        """Wznowienie gry z autozapisu (odtworzenie rozdania i ruchów)"""
+        try:
+            saved = load_game(self.autosave_path)
+        except (OSError, ValueError, IndexError, KeyError, struct.error) as e:
+            print(f"Nie udało się wczytać zapisu gry: {e}")
+            saved = None
+        if saved is None:
+            self.splash_resume_btn.hide()
+            return
+        self.ensure_game_ui()
+        self.win_pending = False
+        self.animator.finish_all()
+        self.game, self.seconds_played = saved
+        self.game_recorded = False
+        self.rules = self.game.rules
+        self.rules_actions[self.rules.name].setChecked(True)
+        self.update_waste_layout()
+        self.takeCentralWidget()
+        self.setCentralWidget(self.main_game_widget)
+        self.stuck_reported = False
+        self.timer.start(1000)
+        self.request_render(*ALL_PILES)
+
     def start_new_game(self):
         """Rozpoczęcie nowej gry"""
-        self.game.new_game()
-        self.seconds_played = 0
-        self.timer.start(1000)
-        self.update_board_from_logic()
+        with profiler.action('new_game') as timer:
+            self.win_pending = False
+            self.animator.finish_all()
+            if self.game.moves:
+                self.record_game(LOST)  # Porzucona partia (wygrana jest już zapisana)
+            self.game_recorded = False
+            self.game.new_game(self.pick_seed(), rules=self.rules)
+            timer.logic_done()
+            self.update_waste_layout()
+            self.seconds_played = 0
+            self.stuck_reported = False
+            self.timer.start(1000)
+            self.request_render(*ALL_PILES, timer=timer)
+
+    def select_difficulty(self, difficulty):
+        """Zmiana trudności - od razu, jeśli w bieżącej grze nie wykonano jeszcze ruchu"""
+        self.difficulty = difficulty
+        if self.centralWidget() is self.main_game_widget and self.game.moves == 0:
+            self.start_new_game()
+
+    def pick_seed(self):
+        """Ziarno rozdania wybranej trudności z indeksu (O(1)); None - losowe rozdanie"""
+        if self.difficulty is None:
+            return None
+        if self.rules.name not in self.deal_indexes:
+            from deal_index import open_index  # Moduł z pulą procesów potrzebny dopiero przy wyborze trudności
+            self.deal_indexes[self.rules.name] = open_index(self.rules)
+        index = self.deal_indexes[self.rules.name]
+        seed = index.pick(self.difficulty) if index is not None else None
+        key = (self.rules.name, self.difficulty)
+        if seed is None and key not in self.missing_deals_reported:
+            self.missing_deals_reported.add(key)
+            QTimer.singleShot(0, self.show_missing_deals_message)  # Komunikat po rozdaniu, poza pomiarem akcji
+        return seed
+
+    def show_missing_deals_message(self):
+        QMessageBox.information(self, "Trudność",
+                                f"Brak ocenionych rozdań wybranej trudności dla zasad „{self.rules.title}”.\n"
+                                "Rozdania tego wariantu są losowe.")
+
+    def select_rules(self, rules):
+        """Zmiana wariantu zasad - od razu, jeśli w bieżącej grze nie wykonano jeszcze ruchu"""
+        self.rules = rules
+        if self.centralWidget() is self.main_game_widget and self.game.moves == 0:
+            self.start_new_game()
+
+    def update_waste_layout(self):
+        """Szerokość stosu odrzuconych dopasowana do liczby rozłożonych kart"""
+        self.pile_widget(WASTE).apply_metrics(fan=self.game.rules.draw_count)
 
     def undo_move(self):
         """Cofnięcie ostatniego ruchu"""
-        if self.game.undo():
-            self.update_board_from_logic()
+        with profiler.action('undo') as timer:
+            piles = self.game.history[-1][:2] if self.game.history else ()  # Źródło i cel cofanego ruchu
+            if self.game.undo():
+                timer.logic_done()
+                self.stuck_reported = False
+                self.request_render(*piles, timer=timer, animate=True)
 
     def show_help(self):
         """Wyświetlenie okna pomocy"""
@@ -390,19 +975,68 @@ class MainWindow(QMainWindow):
     - W kolumnach roboczych układaj karty malejąco, naprzemiennie kolorami.<br>
     - Możesz przenosić pojedyncze karty lub całe, poprawnie ułożone stosy kart.<br>
     - Kliknięcie na stos po lewej dobiera kartę.<br>
-    - Podwójne kliknięcie na karcie przeniesie ją na fundament, jeśli to możliwe.</p>
+    - Podwójne kliknięcie na karcie przeniesie ją na fundament, jeśli to możliwe.<br>
+    - Gdy talia jest pusta, a wszystkie karty odkryte, gra sama dokończy układanie fundamentów (można to wyłączyć w Ustawieniach).<br>
+    - Ruchy kart są animowane; animacje można wyłączyć w Ustawieniach.<br>
+    - Wyniki partii (także porzuconych po wykonaniu ruchu) są zapisywane - zestawienie w Ustawienia → Statystyki.<br>
+    - W menu Trudność można wybrać rozdania łatwe, średnie lub trudne (ocenione wcześniej przez solver).<br>
+    - Przycisk Podpowiedź zaznacza żółtą ramką karty do przeniesienia, a zieloną miejsce docelowe.</p>
 
     <p style='margin-top:10px; margin-bottom:10px;'><b>💰 Punktacja:</b><br>
     - Przeniesienie karty na fundament: <b>+10 pkt</b><br>
     - Przeniesienie karty ze stosu odrzuconych do kolumny: <b>+5 pkt</b><br>
     - Odkrycie nowej karty w kolumnie roboczej: <b>+5 pkt</b><br>
-    - Przeniesienie karty z fundamentu do kolumny: <b>-15 pkt</b></p>
+    - Przeniesienie karty z fundamentu do kolumny: <b>-15 pkt</b><br>
+    - Vegas: start od <b>-52 pkt</b>, <b>+5 pkt</b> za każdą kartę na fundamencie, ograniczona liczba przejść przez talię.</p>
     """
         QMessageBox.information(self, "Pomoc", help_text)
 
+    def show_statistics(self):
+        """Okno statystyk: zestawienia narastające (bez przeglądania historii partii)"""
+        store = self.open_stats_store()
+        store.wait_loaded()  # Okno otwarte z ekranu startowego może wyprzedzić wczytanie bazy
+        columns = [(ALL_RULES, "Wszystkie")] + [(rules.name, rules.title) for rules in VARIANTS
+                                                 if store.get(rules.name).played]
+        stats = [store.get(key) for key, _ in columns]
+
+        def duration(seconds):
+            return QTime(0, 0).addSecs(round(seconds)).toString("mm:ss") if seconds is not None else "-"
+
+        rows = [("Rozegrane", [str(s.played) for s in stats]),
+                ("Wygrane", [str(s.won) for s in stats]),
+                ("Procent wygranych", [f"{s.win_rate:.0%}" for s in stats]),
+                ("Najlepszy czas", [duration(s.best_seconds) for s in stats]),
+                ("Średni czas wygranej", [duration(s.average_seconds) for s in stats]),
+                ("Najlepszy wynik", [str(s.best_score) if s.best_score is not None else "-" for s in stats]),
+                ("Seria wygranych", [str(s.current_streak) for s in stats]),
+                ("Najdłuższa seria", [str(s.best_streak) for s in stats])]
+        cell = "<td style='padding: 2px 10px;'>{}</td>"
+        html = "<table><tr><td></td>" + "".join(cell.format(f"<b>{title}</b>") for _, title in columns) + "</tr>"
+        for label, values in rows:
+            html += "<tr>" + cell.format(label) + "".join(cell.format(value) for value in values) + "</tr>"
+        QMessageBox.information(self, "Statystyki", html + "</table>")
+
+    def show_stuck_message(self):
+        """Informacja, że w tej pozycji nie da się już zrobić postępu"""
+        if self.stuck_reported or self.centralWidget() is not self.main_game_widget:
+            return
+        self.stuck_reported = True
+        answer = QMessageBox.question(
+            self, "Brak ruchów",
+            "Nie ma już ruchów, które pozwolą ułożyć pasjansa.\n\nCzy chcesz rozpocząć nową grę?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if answer == QMessageBox.Yes:
+            self.start_new_game()
+
     def show_win_message(self):
         """Wyświetlenie komunikatu o wygranej"""
+        self.record_game(WON)
+        self.render()  # Plansza z ostatnim ruchem widoczna już pod komunikatem
+        self.win_pending = self.animator.busy()  # Komunikat dopiero po wylądowaniu ostatniej karty
+        if self.win_pending:
+            return
         self.timer.stop()
+        self.remove_autosave()  # Wygranej gry nie ma czego wznawiać
         final_score = self.game.score
         final_time = QTime(0, 0).addSecs(self.seconds_played).toString("mm:ss")
         final_moves = self.game.moves
@@ -0,0 +1,47 @@
+# Warianty zasad - wybierane przy rozdaniu; GameLogic przepisuje wartości do swoich pól raz, w apply_rules()
+UNLIMITED = float('inf')  # Brak limitu przejść przez talię (inf - 1 == inf, więc bez osobnego warunku)
+NO_MINIMUM = float('-inf')  # Punktacja bez dolnego ograniczenia (Vegas)
+
+
+# Punkty za poszczególne zdarzenia w grze
+class Scoring:
+    def __init__(self, name, start, to_foundation, from_foundation, waste_to_tableau, flip, minimum):
+        self.name = name
+        self.start = start  # Punkty na początku gry
+        self.to_foundation = to_foundation  # Karta na stos docelowy
+        self.from_foundation = from_foundation  # Karta ze stosu docelowego do kolumny
+        self.waste_to_tableau = waste_to_tableau  # Karta ze stosu odrzuconych do kolumny
+        self.flip = flip  # Odkrycie karty w kolumnie
+        self.minimum = minimum  # Dolne ograniczenie wyniku
+
+
+STANDARD_SCORING = Scoring('standard', 0, 10, -15, 5, 5, 0)
+VEGAS_SCORING = Scoring('vegas', -52, 5, -5, 0, 0, NO_MINIMUM)  # Wpisowe 52, po 5 za każdą kartę na stosie docelowym
+
+
+# Zestaw zasad jednego wariantu gry
+class Rules:
+    def __init__(self, name, title, draw_count=1, max_passes=UNLIMITED, scoring=STANDARD_SCORING):
+        self.name = name
+        self.title = title  # Nazwa wyświetlana w menu
+        self.draw_count = draw_count  # Liczba kart dobieranych naraz (1 lub 3)
+        self.max_passes = max_passes  # Liczba przejść przez talię (pierwsze rozdanie + odtworzenia)
+        self.scoring = scoring
+
+    @property
+    def recycles(self):
+        """Liczba dozwolonych odtworzeń talii ze stosu odrzuconych"""
+        return self.max_passes - 1
+
+    def __repr__(self):
+        return f"Rules({self.name!r})"
+
+
+KLONDIKE = Rules('klondike', "Klondike (dobieranie 1)")
+KLONDIKE_DRAW3 = Rules('klondike3', "Klondike (dobieranie 3)", draw_count=3)
+VEGAS = Rules('vegas', "Vegas (dobieranie 1, jedno przejście)", max_passes=1, scoring=VEGAS_SCORING)
+VEGAS_DRAW3 = Rules('vegas3', "Vegas (dobieranie 3, trzy przejścia)", draw_count=3, max_passes=3,
+                    scoring=VEGAS_SCORING)
+
+VARIANTS = [KLONDIKE, KLONDIKE_DRAW3, VEGAS, VEGAS_DRAW3]  # Indeks wariantu jest zapisywany w pliku gry
+RULES = {rules.name: rules for rules in VARIANTS}
@@ -0,0 +1,169 @@
+import mmap
+import os
+import struct
+from collections import deque
+
+from game_logic import GameLogic, STOCK, WASTE, FOUNDATION_PILES, TABLEAU_PILES
+from rules import VARIANTS, UNLIMITED
+
+MAGIC = b'PSJ1'  # Nagłówek pliku archiwum
+REPLAY, SNAPSHOT = 1, 2  # Rodzaje rekordów (młodsze 4 bity bajtu rodzaju; starsze - indeks wariantu zasad)
+# Nagłówek rekordu: rodzaj, ziarno, sekundy gry, pozostałe cofnięcia, długość danych w bajtach
+RECORD_HEADER = struct.Struct('<BqIBH')
+SNAPSHOT_STATS = struct.Struct('<iHB')  # Punkty, liczba ruchów, pozostałe odtworzenia talii
+UNLIMITED_PASSES = 255  # Zapis braku limitu odtworzeń talii
+PILES = [STOCK, WASTE] + FOUNDATION_PILES + TABLEAU_PILES  # Numer stosu w zapisie -> opis stosu
+PILE_IDS = {pile: n for n, pile in enumerate(PILES)}
+FACE_UP_BIT = 0x40  # Bajt karty w migawce: kod karty (6 bitów) + bit odkrycia
+
+
+# Kodowanie ruchu na dwóch bajtach: (źródło << 4 | cel, liczba kart)
+def encode_moves(move_log):
+    data = bytearray()
+    for source, destination, count in move_log:
+        data.append(PILE_IDS[tuple(source)] << 4 | PILE_IDS[tuple(destination)])
+        data.append(count)
+    return bytes(data)
+
+
+def decode_moves(data):
+    return [(PILES[data[i] >> 4], PILES[data[i] & 0x0F], data[i + 1]) for i in range(0, len(data), 2)]
+
+
+def record_kind(kind, game):
+    return kind | VARIANTS.index(game.rules) << 4
+
+
+def encode_replay(game, seconds=0):
+    """Rekord odtworzeniowy: ziarno rozdania + log ruchów (2 bajty na ruch)"""
+    payload = encode_moves(game.move_log)
+    return RECORD_HEADER.pack(record_kind(REPLAY, game), game.seed, seconds, game.undo_count, len(payload)) + payload
+
+
+def encode_snapshot(game, seconds=0):
+    """Migawka: długości 13 stosów i po jednym bajcie na kartę (bez logu ruchów)"""
+    piles = [game.stock, game.waste] + game.foundations + game.tableau
+    passes = UNLIMITED_PASSES if game.passes_left == UNLIMITED else game.passes_left
+    payload = bytearray(SNAPSHOT_STATS.pack(game.score, game.moves, passes))
+    payload.extend(len(pile) for pile in piles)
+    for pile in piles:
+        payload.extend(card.code | (FACE_UP_BIT if card.face_up else 0) for card in pile)
+    return RECORD_HEADER.pack(record_kind(SNAPSHOT, game), game.seed, seconds, game.undo_count,
+                              len(payload)) + bytes(payload)
+
+
+def restore_replay(seed, undo_count, payload, rules=VARIANTS[0]):
+    """Odtwarza grę: rozdanie z ziarna i ponowne wykonanie zapisanych ruchów"""
+    game = GameLogic(seed, rules)
+    for move in decode_moves(payload):
+        game.apply_move(move)
+    game.undo_count = undo_count
+    game.history = deque(game.history, maxlen=undo_count)
+    return game
+
+
+def restore_snapshot(seed, undo_count, payload, rules=VARIANTS[0]):
+    """Odtwarza pozycję z migawki (historia cofnięć i log ruchów nie są zapisywane)"""
+    game = GameLogic(seed, rules)
+    score, moves, passes = SNAPSHOT_STATS.unpack_from(payload)
+    offset = SNAPSHOT_STATS.size
+    lengths = payload[offset:offset + len(PILES)]
+    offset += len(PILES)
+    piles = [game.stock, game.waste] + game.foundations + game.tableau
+    for pile, length in zip(piles, lengths):
+        pile.clear()
+        for byte in payload[offset:offset + length]:
+            card = game.deck[byte & 0x3F]
+            card.face_up = bool(byte & FACE_UP_BIT)
+            pile.append(card)
+        offset += length
+    game.reset_move_index()
+    game.reset_hash()
+    game.score = score
+    game.moves = moves
+    game.passes_left = UNLIMITED if passes == UNLIMITED_PASSES else passes
+    game.undo_count = undo_count
+    game.history = deque(maxlen=undo_count)
+    game.move_log = []
+    return game
+
+
+# Pojedynczy rekord odczytany z archiwum - gra odtwarzana dopiero na żądanie
+class ArchiveRecord:
+    __slots__ = ('kind', 'rules', 'seed', 'seconds', 'undo_count', 'payload')
+
+    def __init__(self, kind, seed, seconds, undo_count, payload):
+        self.kind = kind & 0x0F
+        self.rules = VARIANTS[kind >> 4]
+        self.seed = seed
+        self.seconds = seconds
+        self.undo_count = undo_count
+        self.payload = payload
+
+    @property
+    def move_count(self):
+        return len(self.payload) // 2 if self.kind == REPLAY else None
+
+    def restore(self):
+        """Zwraca obiekt GameLogic w zapisanym stanie"""
+        if self.kind == REPLAY:
+            return restore_replay(self.seed, self.undo_count, self.payload, self.rules)
+        return restore_snapshot(self.seed, self.undo_count, self.payload, self.rules)
+
+
+# Dopisywanie gier do archiwum
+class ArchiveWriter:
+    def __init__(self, path, mode='replay'):
+        self.encode = encode_replay if mode == 'replay' else encode_snapshot
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, 'ab')
+        if new_file:
+            self.file.write(MAGIC)
+
+    def write(self, game, seconds=0):
+        self.file.write(self.encode(game, seconds))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_archive(path):
+    """Strumieniowe czytanie archiwum przez mmap - w pamięci jest tylko bieżący rekord"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path}: to nie jest archiwum gier")
+            offset = len(MAGIC)
+            end = len(data)
+            while offset < end:
+                if offset + RECORD_HEADER.size > end:
+                    raise ValueError(f"{path}: uszkodzony nagłówek rekordu (bajt {offset})")
+                kind, seed, seconds, undo_count, length = RECORD_HEADER.unpack_from(data, offset)
+                offset += RECORD_HEADER.size
+                if offset + length > end:
+                    raise ValueError(f"{path}: rekord dłuższy niż plik (bajt {offset})")
+                yield ArchiveRecord(kind, seed, seconds, undo_count, data[offset:offset + length])
+                offset += length
+
+
+def save_game(path, game, seconds=0):
+    """Zapis pojedynczej gry (np. autozapis) - najpierw do pliku tymczasowego, potem podmiana"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(MAGIC + encode_replay(game, seconds))
+    os.replace(temp_path, path)
+
+
+def load_game(path):
+    """Wczytuje pierwszą grę z pliku; zwraca (GameLogic, sekundy gry) lub None"""
+    for record in iter_archive(path):
+        return record.restore(), record.seconds
+    return None
@@ -0,0 +1,351 @@
+from PyQt5.QtWidgets import QApplication, QFrame, QGraphicsPixmapItem, QGraphicsRectItem, QGraphicsScene, QGraphicsView
+from PyQt5.QtCore import Qt, QMimeData, QByteArray, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QDrag, QFont, QPainter, QPen, QPixmap, QTransform
+from card_widgets import card_metrics, encode_source, decode_source, CARD_MIME_TYPE, LEGAL_DROP_COLOR, ILLEGAL_DROP_COLOR
+from textures import texture_cache, CARD_BACK
+from game_logic import STOCK, WASTE, FOUNDATION_PILES, TABLEAU_PILES
+from animation import MOVE_MS, FLIP_MS
+
+# Wygląd pustych pól jak w styles.qss (elementy sceny nie korzystają z arkusza stylów)
+PLACEHOLDER_BRUSH = QColor(255, 255, 255, 102)
+PLACEHOLDER_PEN = QPen(QColor(0, 0, 0, 102), 2, Qt.DashLine)
+LABEL_COLOR = QColor(0, 0, 0, 128)
+FRAME_Z = 1000  # Ramki podpowiedzi i legalności ruchu nad wszystkimi kartami stosu
+FLIGHT_Z = 100  # Lecące karty nad wszystkimi stosami
+TOP_ROW_SLOTS = {STOCK: 0, WASTE: 1, **{pile: 3 + i for i, pile in enumerate(FOUNDATION_PILES)}}  # Miejsca w górnym wierszu
+FALLBACK_COLORS = {'diament': 'red', 'serce': 'red', 'wino': 'black', 'żołędź': 'black'}
+
+
+def fallback_pixmap(card_data):
+    """Karta narysowana tekstem, gdy nie ma jej obrazka (odpowiednik CardWidget.set_fallback_style)"""
+    card_type, card_value = card_data
+    pixmap = QPixmap(*card_metrics.size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QPen(Qt.black, 1))
+    painter.setBrush(Qt.white)
+    painter.drawRoundedRect(QRectF(pixmap.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+    font = QFont()
+    font.setBold(True)
+    font.setPixelSize(16)
+    painter.setFont(font)
+    painter.setPen(QColor(FALLBACK_COLORS.get(card_type, 'gray')))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, f"{card_value}\n{card_type}")
+    painter.end()
+    return pixmap
+
+
+# Karta na scenie - tekstura to ten sam QPixmap z pamięci podręcznej, współdzielony przez wszystkie elementy
+class CardItem(QGraphicsPixmapItem):
+    def __init__(self, board):
+        super().__init__()
+        self.board = board
+        self.card_data = None
+        self.source = None
+        self.is_draggable = False
+        self.slot = None  # (stos, x, y) ostatniego położenia
+        self.setShapeMode(QGraphicsPixmapItem.BoundingRectShape)  # Trafienie myszą bez liczenia kształtu z przezroczystości
+        self.setAcceptedMouseButtons(Qt.LeftButton)
+
+    # Aktualizacja elementu - tekstura zmieniana tylko przy zmianie karty lub strony
+    def update_card(self, card_data, source, draggable):
+        self.source = source
+        self.is_draggable = draggable
+        if card_data != self.card_data:
+            self.card_data = card_data
+            self.load_texture()
+
+    def load_texture(self):
+        pixmap = texture_cache.get(self.card_data)
+        self.setPixmap(pixmap if pixmap is not None else fallback_pixmap(self.card_data))
+
+    # Nowy rozmiar karty - tekstura z pamięci podręcznej w nowym kubełku rozmiaru
+    def apply_metrics(self):
+        if self.card_data is not None:
+            self.load_texture()
+
+    # Obsługa myszy: kliknięcie w kartę, której nie da się przenieść, trafia do stosu pod nią (np. talii)
+    def mousePressEvent(self, event):
+        if not self.is_draggable:
+            event.ignore()
+
+    def mouseMoveEvent(self, event):
+        distance = (event.screenPos() - event.buttonDownScreenPos(Qt.LeftButton)).manhattanLength()
+        if distance >= QApplication.startDragDistance():
+            self.board.start_drag(self, event)
+
+    def mouseDoubleClickEvent(self, event):
+        if self.is_draggable:
+            self.board.card_double_clicked.emit(self.source)
+
+
+# Ramka podpowiedzi lub legalności ruchu - odpowiednik HighlightFrame dla elementów sceny
+class HighlightItem(QGraphicsRectItem):
+    def __init__(self, color):
+        super().__init__()
+        self.color = QColor(color)
+        self.setZValue(FRAME_Z)
+        self.setAcceptedMouseButtons(Qt.NoButton)
+        self.hide()
+
+    # Pokazanie ramki na podanym stosie (domyślnie na całym jego obszarze)
+    def show_on(self, item, rect=None):
+        if self.parentItem() is not item:
+            self.setParentItem(item)
+        self.setRect(QRectF(rect) if rect is not None else item.rect())
+        self.show()
+        self.update()
+
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.color, 4))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(self.rect().adjusted(2, 2, -2, -2), 8, 8)
+
+
+# Stos na scenie: puste pole, miejsce upuszczania kart (walidacja przy wejściu jak w DropTarget) i rodzic kart
+class PileItem(QGraphicsRectItem):
+    def __init__(self, board, pile, label='', validator=None):
+        super().__init__()
+        self.board = board
+        self.pile = pile  # Opis stosu w GameLogic, np. ('foundation', 2)
+        self.label = label
+        self.validator = validator  # Bez niej stos nie przyjmuje kart (talia, stos odrzuconych)
+        self.count = 0  # Liczba kart widocznych na stosie po ostatnim odświeżeniu
+        self.drag_source = None
+        self.drag_legal = False
+        self.drop_frame = None
+        self.setPen(QPen(Qt.NoPen))
+        self.setAcceptDrops(validator is not None)
+        self.setAcceptedMouseButtons(Qt.LeftButton if pile == STOCK else Qt.NoButton)
+
+    def apply_metrics(self, fan=1):
+        """Rozmiar pola dla bieżącego rozmiaru karty (fan - liczba rozłożonych kart stosu odrzuconych)"""
+        if self.pile[0] != 'tableau':  # Kolumny mają wysokość planszy - ustawia je SceneBoard.layout_piles
+            self.setRect(0, 0, card_metrics.width + (fan - 1) * card_metrics.fan_offset, card_metrics.height)
+        self.update()
+
+    def set_count(self, count):
+        if count != self.count:
+            self.count = count
+            self.update()  # Puste pole rysowane tylko bez kart
+
+    def placeholder_rect(self):
+        if self.pile[0] == 'tableau':
+            return QRectF(card_metrics.card_rect(0))
+        return QRectF(0, 0, card_metrics.width, card_metrics.height)
+
+    def drop_rect(self):
+        """Obszar podświetlany podczas przeciągania - w kolumnie miejsce wierzchniej karty"""
+        if self.pile[0] == 'tableau':
+            return card_metrics.card_rect(max(self.count - 1, 0))
+        return None
+
+    def paint(self, painter, option, widget=None):
+        if self.count:
+            return
+        rect = self.placeholder_rect()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(PLACEHOLDER_PEN)
+        painter.setBrush(PLACEHOLDER_BRUSH)
+        painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 8, 8)
+        if self.label:
+            painter.setFont(self.board.label_font)
+            painter.setPen(LABEL_COLOR)
+            painter.drawText(rect, Qt.AlignCenter, self.label)
+
+    # Kliknięcie talii (karty na niej nie przyjmują kliknięć)
+    def mousePressEvent(self, event):
+        self.board.stock_clicked.emit()
+
+    # Przeciąganie nad stosem - źródło odczytane i ruch sprawdzony raz, przy wejściu
+    def dragEnterEvent(self, event):
+        source = decode_source(event.mimeData())
+        if source is None:
+            event.ignore()
+            return
+        self.drag_source = source
+        self.drag_legal = self.validator(source, self.pile)
+        if self.drop_frame is None:
+            self.drop_frame = HighlightItem(LEGAL_DROP_COLOR)
+        self.drop_frame.color = QColor(LEGAL_DROP_COLOR if self.drag_legal else ILLEGAL_DROP_COLOR)
+        self.drop_frame.show_on(self, self.drop_rect())
+        # Zaakceptowane także przy niedozwolonym ruchu - tylko wtedy przychodzi dragLeaveEvent, który zdejmie ramkę
+        event.acceptProposedAction()
+
+    def dragMoveEvent(self, event):
+        if self.drag_legal:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dragLeaveEvent(self, event):
+        self.drop_frame.hide()
+
+    def dropEvent(self, event):
+        self.drop_frame.hide()
+        if not self.drag_legal:
+            event.ignore()
+            return
+        self.board.card_dropped.emit(self.drag_source, self.pile)
+        event.acceptProposedAction()
+
+
+# Cała plansza w jednym QGraphicsView - zamiast osobnego widżetu dla każdej karty, kolumny i pola (flaga --board scene)
+class SceneBoard(QGraphicsView):
+    card_dropped = pyqtSignal(tuple, tuple)  # (źródło, stos docelowy)
+    card_double_clicked = pyqtSignal(tuple)
+    stock_clicked = pyqtSignal()
+
+    def __init__(self, labels, validator, animator, parent=None):
+        super().__init__(parent)
+        self.animator = animator  # Wspólny harmonogram animacji okna gry
+        self.setObjectName("SceneBoard")  # Przezroczyste tło z arkusza stylów - pod planszą jest BackgroundWidget
+        scene = QGraphicsScene(self)
+        scene.setItemIndexMethod(QGraphicsScene.NoIndex)  # Karty ciągle zmieniają miejsce - indeks BSP tylko by się przebudowywał
+        self.setScene(scene)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing)
+        self.label_font = QFont('Times New Roman')
+
+        self.piles = {STOCK: PileItem(self, STOCK), WASTE: PileItem(self, WASTE)}
+        for pile, label in zip(FOUNDATION_PILES, labels):
+            self.piles[pile] = PileItem(self, pile, label, validator)
+        for pile in TABLEAU_PILES:
+            self.piles[pile] = PileItem(self, pile, validator=validator)
+        for item in self.piles.values():
+            scene.addItem(item)
+        self.cards = {}  # Elementy kart (kod karty -> CardItem), tworzone przy pierwszym użyciu
+        self.stock_card = CardItem(self)  # Jedna zakryta karta reprezentuje całą talię
+        self.stock_card.update_card(CARD_BACK, None, False)
+        self.stock_card.setParentItem(self.piles[STOCK])
+        self.stock_card.hide()
+        self.hint_frames = (HighlightItem('#ffd700'), HighlightItem('#7CFC00'))  # Źródło i cel podpowiedzi
+        self.apply_metrics()
+
+    def card_item(self, card):
+        item = self.cards.get(card.code)
+        if item is None:
+            item = self.cards[card.code] = CardItem(self)
+        return item
+
+    def place_card(self, card, pile_item, x, y, z, source, animate=False, delay=0, origin=None):
+        """Ustawia kartę na stosie; karta bez źródła (source=None) jest tylko widoczna.
+
+        Przy animacji karta przelatuje ze swojego miejsca (niewidoczna - z origin), a odkryta w miejscu - obraca się.
+        """
+        item = self.card_item(card)
+        self.animator.finish(('flip', item))
+        card_data = card.card_data if card.face_up else CARD_BACK
+        draggable = card.face_up and source is not None
+        slot = (pile_item, x, y)
+        if animate and item.slot == slot and item.card_data == CARD_BACK and card_data != CARD_BACK:
+            item.update_card(CARD_BACK, source, draggable)
+            self.flip_card(item, card_data)
+        else:
+            item.update_card(card_data, source, draggable)
+        if item.slot != slot:
+            start = item if item.isVisible() else origin
+            if animate and start is not None:
+                self.fly_card(item, start, pile_item, x, y, z, delay)
+            else:
+                item.setParentItem(pile_item)
+                item.setPos(x, y)
+            item.slot = slot
+        if not self.animator.is_running(item):
+            item.setZValue(z)  # Kolejność kart w stosie bez przestawiania widżetów (raise_)
+        item.show()
+
+    def fly_card(self, item, start_item, pile_item, x, y, z, delay=0):
+        """Lot karty nad stosami (element najwyższego poziomu sceny) - do stosu trafia po wylądowaniu"""
+        start = start_item.scenePos()
+        end = pile_item.mapToScene(x, y)
+        item.setParentItem(None)
+        item.setPos(start)
+        item.setZValue(FLIGHT_Z + z)
+
+        def step(t):
+            item.setPos(start + (end - start) * t)
+
+        def land():
+            item.setParentItem(pile_item)
+            item.setPos(x, y)
+            item.setZValue(z)
+
+        self.animator.add(item, MOVE_MS, step, land, delay)
+
+    def flip_card(self, item, card_data):
+        """Odwrócenie karty w miejscu przekształceniem elementu (bez zmiany rozmiaru tekstury)"""
+        center = card_metrics.width / 2
+
+        def step(t):
+            if t >= 0.5 and item.card_data != card_data:
+                item.update_card(card_data, item.source, item.is_draggable)
+            item.setTransform(QTransform().translate(center, 0).scale(max(abs(1 - 2 * t), 0.01), 1).translate(-center, 0))
+
+        self.animator.add(('flip', item), FLIP_MS, step, item.resetTransform)
+
+    def update_pile(self, pile, cards, shown, animate=False, delays=None):
+        """Aktualizuje elementy jednego stosu (shown - karty widoczne na nim, wybrane przez okno gry)"""
+        pile_type, i = pile
+        pile_item = self.piles[pile]
+        delays = delays or {}
+        if pile_type == 'stock':
+            self.stock_card.setVisible(bool(cards))
+            pile_item.set_count(min(len(cards), 1))
+            return
+        for j, card in enumerate(shown):
+            if pile_type == 'waste':
+                source = ('waste', 0) if j == len(shown) - 1 else None
+                x, y = j * card_metrics.fan_offset, 0
+            elif pile_type == 'foundation':
+                source = ('foundation', i) if card is cards[-1] else None
+                x, y = 0, 0
+            else:
+                source = ('tableau', i, j)
+                rect = card_metrics.card_rect(j)
+                x, y = rect.x(), rect.y()
+            origin = self.piles[STOCK] if pile_type == 'waste' else None  # Dobierane karty wylatują z talii
+            self.place_card(card, pile_item, x, y, j, source, animate, delays.get(card.code, 0), origin)
+        pile_item.set_count(len(shown))
+
+    def start_drag(self, card_item, event):
+        """Przeciąganie karty z tym samym typowanym opisem źródła co w widokach z widżetów"""
+        drag = QDrag(event.widget())
+        mime_data = QMimeData()
+        mime_data.setData(CARD_MIME_TYPE, QByteArray(encode_source(card_item.source)))
+        drag.setMimeData(mime_data)
+        drag.setPixmap(card_item.pixmap())  # Ta sama tekstura z pamięci podręcznej
+        drag.setHotSpot(event.buttonDownPos(Qt.LeftButton).toPoint())
+        drag.exec_(Qt.MoveAction)
+
+    # Układ planszy: górny wiersz (talia, odrzucone, stosy docelowe) i siedem kolumn na szerokość widoku
+    def layout_piles(self):
+        width = max(self.viewport().width(), 7 * card_metrics.column_width)
+        slot = width / 7
+        for pile, n in TOP_ROW_SLOTS.items():
+            self.piles[pile].setPos(n * slot + card_metrics.margin, card_metrics.margin)
+        tableau_top = card_metrics.height + 2 * card_metrics.margin + round(20 * card_metrics.width / 100)
+        height = max(self.viewport().height() - tableau_top, card_metrics.column_height)
+        for i, pile in enumerate(TABLEAU_PILES):
+            item = self.piles[pile]
+            item.setPos(i * slot, tableau_top)
+            item.setRect(0, 0, slot, height)
+        self.setSceneRect(0, 0, self.viewport().width(), self.viewport().height())
+
+    def apply_metrics(self):
+        """Nowy rozmiar karty: pola, tekstury i układ planszy"""
+        self.label_font.setPixelSize(round(70 * card_metrics.width / 100))
+        for item in self.piles.values():
+            item.apply_metrics()
+        for item in list(self.cards.values()) + [self.stock_card]:
+            item.apply_metrics()
+        self.layout_piles()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.layout_piles()
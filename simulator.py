@@ -0,0 +1,168 @@
+import argparse
+import csv
+import json
+import os
+import time
+from multiprocessing import Pool
+
+from game_logic import GameLogic
+from rules import RULES
+from solver import KlondikeSolver
+
+RESULT_FIELDS = ['seed', 'won', 'status', 'moves', 'score', 'nodes', 'elapsed']
+
+
+def greedy_playout(game, max_moves=2000):
+    """Gra zachłanna: zawsze pierwszy ruch z listy solvera, który prowadzi do nowej pozycji"""
+    solver = KlondikeSolver()
+    seen = {game.canonical_hash()}
+    while game.moves < max_moves and not game.check_win_condition():
+        for move in solver.candidate_moves(game):
+            game.apply_move(move)
+            key = game.canonical_hash()
+            if key not in seen:
+                seen.add(key)
+                break
+            game.revert(game.history.pop())
+        else:  # Każdy ruch prowadzi do znanej pozycji - gra utknęła
+            break
+    return game.check_win_condition()
+
+
+def play_seed(seed, mode='solve', max_nodes=100000, rules='klondike'):
+    """Rozgrywa jedno rozdanie o podanym ziarnie (i wariancie zasad) i zwraca wiersz wyników"""
+    start = time.perf_counter()
+    game = GameLogic(seed, RULES[rules])
+    nodes = 0
+    if mode == 'solve':
+        result = KlondikeSolver(max_nodes=max_nodes).solve(game)
+        nodes = result.nodes
+        status = result.status
+        for move in result.moves:  # Odtworzenie rozwiązania, by policzyć punkty
+            game.apply_move(move)
+    else:
+        status = 'won' if greedy_playout(game) else 'lost'
+    return {
+        'seed': seed,
+        'won': status == 'won',
+        'status': status,
+        'moves': game.moves,
+        'score': game.score,
+        'nodes': nodes,
+        'elapsed': round(time.perf_counter() - start, 6),
+    }
+
+
+# Zbiorcze statystyki - częściowe wyniki z procesów są łączone przez merge()
+class BatchStats:
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.unknown = 0
+        self.win_moves = 0
+        self.win_score = 0
+        self.nodes = 0
+        self.cpu_time = 0.0
+
+    def add(self, row):
+        self.games += 1
+        self.nodes += row['nodes']
+        self.cpu_time += row['elapsed']
+        if row['won']:
+            self.wins += 1
+            self.win_moves += row['moves']
+            self.win_score += row['score']
+        elif row['status'] == 'unknown':
+            self.unknown += 1
+
+    def merge(self, other):
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+        return self
+
+    def summary(self):
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'unknown': self.unknown,
+            'win_rate': self.wins / self.games if self.games else 0.0,
+            'avg_win_moves': self.win_moves / self.wins if self.wins else 0.0,
+            'avg_win_score': self.win_score / self.wins if self.wins else 0.0,
+            'nodes': self.nodes,
+            'cpu_time': round(self.cpu_time, 3),
+        }
+
+
+def play_chunk(args):
+    """Zadanie dla procesu roboczego: zakres ziaren -> (wiersze, częściowe statystyki)"""
+    seeds, mode, max_nodes, rules = args
+    stats = BatchStats()
+    rows = []
+    for seed in seeds:
+        row = play_seed(seed, mode, max_nodes, rules)
+        stats.add(row)
+        rows.append(row)
+    return rows, stats
+
+
+# Zapis wyników strumieniowo - wiersz po wierszu, bez trzymania wszystkiego w pamięci
+class ResultWriter:
+    def __init__(self, path):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.csv = None
+        if path.endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+def run_batch(seeds, output, mode='solve', workers=None, chunk_size=16, max_nodes=100000, rules='klondike'):
+    """Rozgrywa wszystkie ziarna w puli procesów; zwraca połączone statystyki"""
+    seeds = list(seeds)
+    chunks = [(seeds[i:i + chunk_size], mode, max_nodes, rules) for i in range(0, len(seeds), chunk_size)]
+    stats = BatchStats()
+    writer = ResultWriter(output)
+    try:
+        with Pool(workers or os.cpu_count()) as pool:
+            for rows, partial in pool.imap_unordered(play_chunk, chunks):
+                for row in rows:
+                    writer.write(row)
+                stats.merge(partial)
+    finally:
+        writer.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Symulacja wielu rozdań o kolejnych ziarnach na wszystkich rdzeniach")
+    parser.add_argument('--start', type=int, default=0, help="pierwsze ziarno")
+    parser.add_argument('--count', type=int, default=100, help="liczba rozdań")
+    parser.add_argument('--mode', choices=['solve', 'greedy'], default='solve')
+    parser.add_argument('--rules', choices=list(RULES), default='klondike', help="wariant zasad")
+    parser.add_argument('--workers', type=int, default=None, help="liczba procesów (domyślnie wszystkie rdzenie)")
+    parser.add_argument('--chunk-size', type=int, default=16)
+    parser.add_argument('--max-nodes', type=int, default=100000, help="limit węzłów solvera na rozdanie")
+    parser.add_argument('--output', default='results.jsonl', help="plik wyników .jsonl lub .csv")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = run_batch(range(args.start, args.start + args.count), args.output, args.mode,
+                      args.workers, args.chunk_size, args.max_nodes, args.rules)
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    summary['wall_time'] = round(elapsed, 3)
+    summary['games_per_second'] = round(stats.games / elapsed, 2) if elapsed else 0.0
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import argparse
+import time
+from collections import deque
+
+from game_logic import GameLogic, KING, SUIT_COLORS
+
+# Indeksy stosów docelowych w przeciwnym kolorze dla każdego koloru karty
+OPPOSITE_SUITS = [[j for j, color in enumerate(SUIT_COLORS) if color != SUIT_COLORS[i]] for i in range(4)]
+
+
+# Wynik przeszukiwania
+class SolveResult:
+    def __init__(self, status, moves, nodes, elapsed):
+        self.status = status  # 'won', 'lost' (przestrzeń przeszukana) lub 'unknown' (przekroczony budżet)
+        self.moves = moves  # Zwycięska sekwencja ruchów (źródło, cel, liczba kart)
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+    @property
+    def won(self):
+        return self.status == 'won'
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return f"SolveResult({self.status!r}, moves={len(self.moves)}, nodes={self.nodes}, elapsed={self.elapsed:.3f}s)"
+
+
+# Przeszukiwanie w głąb z tablicą transpozycji i automatycznymi ruchami na stosy docelowe
+class KlondikeSolver:
+    """Solver pasjansa oparty na regułach GameLogic.
+
+    Nie rozważa ruchów ze stosów docelowych z powrotem do kolumn, więc wynik 'lost'
+    oznacza brak rozwiązania w przeszukiwanej przestrzeni ruchów.
+    """
+
+    def __init__(self, max_nodes=200000, max_seconds=None):
+        self.max_nodes = max_nodes  # Limit odwiedzonych węzłów (None - bez limitu)
+        self.max_seconds = max_seconds  # Limit czasu w sekundach (None - bez limitu)
+
+    def solve(self, game):
+        """Szuka zwycięskiej sekwencji ruchów; nie modyfikuje przekazanego obiektu gry"""
+        game = game.clone()
+        game.history = deque()  # Solver sam zdejmuje wpisy dziennika, więc bez limitu cofnięć
+        start = time.perf_counter()
+        deadline = start + self.max_seconds if self.max_seconds is not None else None
+        path, deltas = [], []
+        nodes = 0
+
+        entered = self._auto_moves(game, path, deltas)
+        if self._is_won(game):
+            return SolveResult('won', path, nodes, time.perf_counter() - start)
+        seen = {game.canonical_hash()}  # Tablica transpozycji: hasze kanoniczne pozycji (z pozostałymi przejściami przez talię)
+        stack = [[self.candidate_moves(game), 0, entered]]
+
+        while stack:
+            frame = stack[-1]
+            moves, index, applied = frame
+            if index >= len(moves):  # Wszystkie ruchy z tego węzła sprawdzone - wycofanie
+                stack.pop()
+                for _ in range(applied):
+                    self._undo(game, path, deltas)
+                continue
+            frame[1] += 1
+
+            self._apply(game, moves[index], path, deltas)
+            nodes += 1
+            if self.max_nodes is not None and nodes >= self.max_nodes:
+                return SolveResult('unknown', [], nodes, time.perf_counter() - start)
+            if deadline is not None and nodes & 1023 == 0 and time.perf_counter() > deadline:
+                return SolveResult('unknown', [], nodes, time.perf_counter() - start)
+
+            applied = 1 + self._auto_moves(game, path, deltas)
+            if self._is_won(game):
+                return SolveResult('won', path, nodes, time.perf_counter() - start)
+            key = game.canonical_hash()
+            if key in seen:
+                for _ in range(applied):
+                    self._undo(game, path, deltas)
+                continue
+            seen.add(key)
+            stack.append([self.candidate_moves(game), 0, applied])
+
+        return SolveResult('lost', [], nodes, time.perf_counter() - start)
+
+    # Wykonywanie i cofanie ruchów na kopii gry
+    def _apply(self, game, move, path, deltas):
+        game.apply_move(move)
+        path.append(move)
+        deltas.append(game.history.pop())
+
+    def _undo(self, game, path, deltas):
+        path.pop()
+        game.revert(deltas.pop())
+
+    def _is_won(self, game):
+        return all(len(pile) == KING for pile in game.foundations)
+
+    def _auto_moves(self, game, path, deltas):
+        """Wykonuje ruchy na stosy docelowe, które nigdy nie pogarszają pozycji; zwraca ich liczbę"""
+        applied = 0
+        while True:
+            move = self._safe_foundation_move(game)
+            if move is None:
+                return applied
+            self._apply(game, move, path, deltas)
+            applied += 1
+
+    def _safe_foundation_move(self, game):
+        foundations = game.foundations
+        # Gdy wszystko jest odkryte, a talia pusta, każdy ruch na stos docelowy jest bezpieczny
+        all_open = not game.stock and not game.waste and all(
+            not pile or pile[0].face_up for pile in game.tableau)
+        candidates = [(('waste', 0), game.waste)] if game.waste else []
+        candidates += [(('tableau', i), pile) for i, pile in enumerate(game.tableau) if pile]
+        for source, pile in candidates:
+            card = pile[-1]
+            if not game.is_valid_for_foundation(card, card.suit_idx):
+                continue
+            if all_open or card.value <= 2 or all(
+                    len(foundations[j]) >= card.value - 1 for j in OPPOSITE_SUITS[card.suit_idx]):
+                return (source, ('foundation', card.suit_idx), 1)
+        return None
+
+    def candidate_moves(self, game):
+        """Ruchy z GameLogic.legal_moves() warte sprawdzenia, od najbardziej obiecujących"""
+        to_foundation, revealing, to_tableau, other, draw = [], [], [], [], []
+        tableau = game.tableau
+        first_empty = next((i for i, pile in enumerate(tableau) if not pile), None)
+
+        for move in game.legal_moves():
+            source, destination, count = move
+            source_type = source[0]
+            if source_type == 'stock':
+                draw.append(move)
+                continue
+            if destination[0] == 'foundation':
+                to_foundation.append(move)
+                continue
+            if source_type == 'foundation':  # Ruchy ze stosów docelowych nie są rozważane
+                continue
+            dest_idx = destination[1]
+            if not tableau[dest_idx] and dest_idx != first_empty:  # Puste kolumny są równoważne
+                continue
+            if source_type == 'waste':
+                to_tableau.append(move)
+                continue
+
+            source_idx = source[1]
+            pile = tableau[source_idx]
+            j = len(pile) - count
+            if j == game.hidden[source_idx]:
+                # Cały odkryty ciąg: warto, jeśli odsłania kartę albo opróżnia kolumnę (nie król na pustą)
+                if j == 0 and not tableau[dest_idx]:
+                    continue
+                (revealing if j > 0 else other).append((j, move))
+            else:
+                # Część ciągu: tylko gdy odsłonięta karta może od razu trafić na stos docelowy
+                below = pile[j - 1]
+                if game.is_valid_for_foundation(below, below.suit_idx):
+                    other.append((j, move))
+
+        revealing.sort(key=lambda item: -item[0])  # Najpierw kolumny z największą liczbą zakrytych kart
+        return to_foundation + [move for _, move in revealing] + to_tableau + [move for _, move in other] + draw
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rozwiązywanie losowych rozdań pasjansa bez interfejsu")
+    parser.add_argument('--games', type=int, default=10, help="liczba rozdań")
+    parser.add_argument('--max-nodes', type=int, default=200000, help="limit węzłów na rozdanie")
+    parser.add_argument('--max-seconds', type=float, default=None, help="limit czasu na rozdanie")
+    parser.add_argument('--show-moves', action='store_true', help="wypisz zwycięskie sekwencje ruchów")
+    args = parser.parse_args()
+
+    solver = KlondikeSolver(max_nodes=args.max_nodes, max_seconds=args.max_seconds)
+    game = GameLogic()
+    total_nodes = solved = 0
+    start = time.perf_counter()
+    for n in range(args.games):
+        game.new_game()
+        result = solver.solve(game)
+        total_nodes += result.nodes
+        solved += result.won
+        print(f"Rozdanie {n + 1}: {result.status}, ruchy: {len(result.moves)}, węzły: {result.nodes}, "
+              f"{result.elapsed:.3f} s ({result.nodes_per_second:,.0f} węzłów/s)")
+        if args.show_moves:
+            for move in result.moves:
+                print("   ", move)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nRozwiązane: {solved}/{args.games}")
+    print(f"Rozwiązania/s: {solved / elapsed:.2f}, węzły/s: {total_nodes / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from game_logic import UNDO_LIMIT
+
+WON, LOST = 'won', 'lost'  # Wynik partii (przegrana - porzucona partia z co najmniej jednym ruchem)
+ALL_RULES = '*'  # Klucz zestawienia wszystkich wariantów zasad
+AGGREGATE_FIELDS = ('played', 'won', 'won_seconds', 'best_seconds', 'best_score', 'current_streak', 'best_streak')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    rules TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    seconds_played INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    moves INTEGER NOT NULL,
+    undos_used INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    rules TEXT PRIMARY KEY,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    won_seconds INTEGER NOT NULL,
+    best_seconds INTEGER,
+    best_score INTEGER,
+    current_streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL
+);
+"""
+
+
+# Wynik jednej zakończonej partii (wiersz tabeli games)
+class GameResult:
+    __slots__ = ('finished_at', 'rules', 'seed', 'outcome', 'seconds_played', 'score', 'moves', 'undos_used')
+
+    def __init__(self, rules, seed, outcome, seconds_played, score, moves, undos_used, finished_at=None):
+        self.finished_at = finished_at if finished_at is not None else time.time()
+        self.rules = rules
+        self.seed = seed
+        self.outcome = outcome
+        self.seconds_played = seconds_played
+        self.score = score
+        self.moves = moves
+        self.undos_used = undos_used
+
+    @classmethod
+    def from_game(cls, game, outcome, seconds_played):
+        return cls(game.rules.name, game.seed, outcome, seconds_played, game.score, game.moves,
+                   UNDO_LIMIT - game.undo_count)
+
+    def row(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+# Statystyki narastające - każda partia aktualizuje je w O(1), bez przeglądania historii gier
+class Aggregates:
+    __slots__ = AGGREGATE_FIELDS
+
+    def __init__(self, played=0, won=0, won_seconds=0, best_seconds=None, best_score=None, current_streak=0,
+                 best_streak=0):
+        self.played = played
+        self.won = won
+        self.won_seconds = won_seconds  # Suma czasów wygranych partii (do średniej)
+        self.best_seconds = best_seconds  # Najkrótsza wygrana
+        self.best_score = best_score  # Najlepszy wynik punktowy (także partii przegranych - Vegas)
+        self.current_streak = current_streak  # Wygrane z rzędu do ostatniej partii włącznie
+        self.best_streak = best_streak
+
+    def add(self, result):
+        self.played += 1
+        if self.best_score is None or result.score > self.best_score:
+            self.best_score = result.score
+        if result.outcome != WON:
+            self.current_streak = 0
+            return
+        self.won += 1
+        self.won_seconds += result.seconds_played
+        if self.best_seconds is None or result.seconds_played < self.best_seconds:
+            self.best_seconds = result.seconds_played
+        self.current_streak += 1
+        self.best_streak = max(self.best_streak, self.current_streak)
+
+    @property
+    def win_rate(self):
+        return self.won / self.played if self.played else 0.0
+
+    @property
+    def average_seconds(self):
+        return self.won_seconds / self.won if self.won else None
+
+    def copy(self):
+        return Aggregates(*(getattr(self, name) for name in AGGREGATE_FIELDS))
+
+    def row(self):
+        return tuple(getattr(self, name) for name in AGGREGATE_FIELDS)
+
+
+def open_database(path):
+    """Baza statystyk w trybie WAL - zapis partii nie blokuje odczytu, a fsync tylko przy punktach kontrolnych"""
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def load_aggregates(connection):
+    """Wariant zasad (lub ALL_RULES) -> Aggregates; kilka wierszy niezależnie od liczby rozegranych partii"""
+    rows = connection.execute(f"SELECT rules, {', '.join(AGGREGATE_FIELDS)} FROM aggregates")
+    return {rules: Aggregates(*values) for rules, *values in rows}
+
+
+def write_result(connection, aggregates, result):
+    """Dopisuje partię i jej zestawienia w jednej transakcji; zwraca zaktualizowane kopie zestawień"""
+    updated = {}
+    for key in (ALL_RULES, result.rules):
+        entry = aggregates[key].copy() if key in aggregates else Aggregates()
+        entry.add(result)
+        updated[key] = entry
+    with connection:
+        connection.execute(f"INSERT INTO games ({', '.join(GameResult.__slots__)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                           result.row())
+        connection.executemany(f"INSERT OR REPLACE INTO aggregates (rules, {', '.join(AGGREGATE_FIELDS)}) "
+                               f"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               [(key, *entry.row()) for key, entry in updated.items()])
+    return updated
+
+
+# Zapis statystyk w wątku roboczym - jeden wątek, więc partie trafiają do bazy w kolejności zakończenia
+class StatsStore(QObject):
+    updated = pyqtSignal(object)  # Kopie zestawień po wczytaniu bazy i po każdym zapisie
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.aggregates = {}  # Zestawienia dla wątku interfejsu (odczyt w O(1), bez zapytań do bazy)
+        self.worker_aggregates = None  # Zestawienia wątku zapisu (None - baza jeszcze niewczytana)
+        self.connection = None  # Połączenie używane wyłącznie w wątku zapisu
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.closed = False
+        self.updated.connect(self.on_updated)
+        self.executor.submit(self.load)
+
+    def record(self, result):
+        """Zleca zapis zakończonej partii (wywoływane w wątku interfejsu - nie czeka na dysk)"""
+        self.executor.submit(self.write, result)
+
+    def wait_loaded(self):
+        """Czeka na zleconą pracę wątku zapisu i przejmuje jego zestawienia bez czekania na sygnał"""
+        if self.closed:
+            return
+        self.executor.submit(self.load).result()  # Jeden wątek - wcześniejsze wczytanie i zapisy są już wykonane
+        if self.worker_aggregates is not None:
+            self.aggregates = {key: entry.copy() for key, entry in self.worker_aggregates.items()}
+
+    def get(self, rules=ALL_RULES):
+        return self.aggregates.get(rules) or Aggregates()
+
+    def open_connection(self):
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self.connection = open_database(self.path)
+        return self.connection
+
+    def load(self):
+        try:
+            if self.worker_aggregates is None:
+                self.worker_aggregates = load_aggregates(self.open_connection())
+        except (sqlite3.Error, OSError) as e:
+            print(f"Nie udało się otworzyć statystyk: {e}")
+            return
+        self.publish()
+
+    def write(self, result):
+        try:
+            if self.worker_aggregates is None:  # Bez wczytanych zestawień zapis nadpisałby je od zera
+                self.worker_aggregates = load_aggregates(self.open_connection())
+            self.worker_aggregates.update(write_result(self.open_connection(), self.worker_aggregates, result))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Nie udało się zapisać statystyk: {e}")
+            return
+        self.publish()
+
+    def publish(self):
+        # Wywoływane w wątku roboczym - sygnał trafi do wątku interfejsu przez kolejkę zdarzeń
+        self.updated.emit({key: entry.copy() for key, entry in self.worker_aggregates.items()})
+
+    def on_updated(self, aggregates):
+        self.aggregates = aggregates
+
+    def close_connection(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def shutdown(self):
+        """Dokończenie zleconych zapisów i zamknięcie bazy (przy zamykaniu okna)"""
+        if self.closed:
+            return
+        self.closed = True
+        self.executor.submit(self.close_connection)
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,114 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from game_logic import KING
+from zobrist import PositionCache
+
+
+def is_progress_move(game, move):
+    """Czy ruch posuwa grę do przodu (a nie tylko przekłada karty lub przewija talię)"""
+    source, destination, count = move
+    source_type = source[0]
+    if source_type in ('stock', 'foundation'):
+        return False
+    if destination[0] == 'foundation' or source_type == 'waste':
+        return True
+    pile = game.tableau[source[1]]
+    j = len(pile) - count
+    if j == game.hidden[source[1]]:
+        # Odsłonięcie zakrytej karty albo opróżnienie kolumny dla czekającego króla
+        return j > 0 or (bool(game.tableau[destination[1]]) and king_waiting(game))
+    below = pile[j - 1]  # Rozdzielenie ciągu ma sens tylko, gdy odsłonięta karta trafi na stos docelowy
+    return game.is_valid_for_foundation(below, below.suit_idx)
+
+
+def king_waiting(game):
+    """Czy jakiś król (w talii, na stosie odrzuconych lub w środku kolumny) potrzebuje pustej kolumny"""
+    if any(card.value == KING for card in game.stock) or any(card.value == KING for card in game.waste):
+        return True
+    return any(card.face_up and card.value == KING for pile in game.tableau for card in pile[1:])
+
+
+def has_progress_move(game):
+    """Szuka ruchu dającego postęp, także po zdjęciu jednej karty ze stosu docelowego"""
+    moves = game.legal_moves()
+    if any(is_progress_move(game, move) for move in moves):
+        return True
+    for move in moves:
+        if move[0][0] != 'foundation':
+            continue
+        game.apply_move(move)
+        # Bez ruchów na stosy docelowe - inaczej zdjęta karta po prostu by wróciła
+        found = any(is_progress_move(game, after) for after in game.legal_moves()
+                    if after[0][0] != 'foundation' and after[1][0] != 'foundation')
+        game.revert(game.history.pop())
+        if found:
+            return True
+    return False
+
+
+def is_dead_position(game):
+    """Sprawdza, czy w całym cyklu talii nie ma już żadnego ruchu dającego postęp.
+
+    Działa na własnej kopii gry, więc można ją wywołać w wątku roboczym.
+    """
+    if game.check_win_condition():
+        return False
+    game = game.clone()
+    game.history = deque()
+    # Pełny obieg talii: każda karta z talii i stosu odrzuconych trafia kiedyś na wierzch
+    for _ in range(len(game.stock) + len(game.waste) + 1):
+        if has_progress_move(game):
+            return False
+        if not game.draw_from_stock():
+            break
+    return True
+
+
+# Sprawdzanie pozycji w tle - nowsze zlecenie zastępuje starsze, interfejs nigdy nie czeka
+class StuckDetector(QObject):
+    position_dead = pyqtSignal()
+    check_finished = pyqtSignal(int, object, bool)  # (numer zlecenia, hasz pozycji, czy pozycja martwa)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.generation = 0
+        self.pending = None
+        self.results = PositionCache(1024)  # Wyniki dla powtarzających się pozycji (cofanie, przewijanie talii)
+        self.check_finished.connect(self.on_check_finished)
+
+    def check(self, game):
+        """Zleca sprawdzenie bieżącej pozycji (kopia gry powstaje w wątku interfejsu)"""
+        self.cancel()
+        generation = self.generation
+        key = game.canonical_hash()
+        dead = self.results.get(key)
+        if dead is not None:
+            self.on_check_finished(generation, key, dead)
+            return
+        snapshot = game.clone()
+        self.pending = self.executor.submit(is_dead_position, snapshot)
+        self.pending.add_done_callback(lambda future: self.deliver(generation, key, future))
+
+    def cancel(self):
+        """Unieważnia zlecone sprawdzenie (np. po kolejnym ruchu lub nowej grze)"""
+        self.generation += 1
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+    def deliver(self, generation, key, future):
+        # Wywoływane w wątku roboczym - sygnał trafi do wątku interfejsu przez kolejkę zdarzeń
+        if not future.cancelled() and future.exception() is None:
+            self.check_finished.emit(generation, key, future.result())
+
+    def on_check_finished(self, generation, key, dead):
+        self.results.put(key, dead)
+        if generation == self.generation and dead:
+            self.position_dead.emit()
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,145 @@
+import random
+
+import pytest
+
+from game_logic import GameLogic, DRAW_MOVE, UNDO_LIMIT
+from rules import VARIANTS, RULES
+from savefile import save_game, load_game
+
+SEEDS = range(12)
+
+
+def play(game, moves, rng):
+    """Losowe dozwolone ruchy (bez zapisu w dzienniku cofnięć - jak w solverze)"""
+    for _ in range(moves):
+        legal = game.legal_moves()
+        if not legal:
+            break
+        game.apply_move(rng.choice(legal))
+    return game
+
+
+def state(game):
+    """Pełny stan widoczny dla gracza: stosy z odkryciem kart, punkty, ruchy, odtworzenia talii"""
+    piles = [game.stock, game.waste] + game.foundations + game.tableau
+    return (tuple(tuple((card.code, card.face_up) for card in pile) for pile in piles),
+            game.score, game.moves, game.passes_left)
+
+
+def brute_force_moves(game):
+    """Dozwolone ruchy wyznaczone wprost z is_valid_move - wzorzec dla indeksu ruchów"""
+    moves = set()
+    if game.stock or (game.waste and game.passes_left > 0):
+        moves.add(DRAW_MOVE)
+    sources = [(('waste', 0), game.waste[-1:])]
+    sources += [(('foundation', f), pile[-1:]) for f, pile in enumerate(game.foundations)]
+    for i, pile in enumerate(game.tableau):
+        sources += [(('tableau', i), pile[j:]) for j in range(len(pile)) if pile[j].face_up]
+    for source, stack in sources:
+        if not stack:
+            continue
+        if source[0] != 'foundation':
+            for f in range(4):
+                if game.is_valid_move(stack, ('foundation', f)):
+                    moves.add((source, ('foundation', f), 1))
+        for d in range(7):
+            if source != ('tableau', d) and game.is_valid_move(stack, ('tableau', d)):
+                moves.add((source, ('tableau', d), len(stack)))
+    return moves
+
+
+@pytest.mark.parametrize('rules', VARIANTS, ids=lambda rules: rules.name)
+def test_revert_restores_state_hashes_and_move_index(rules):
+    """Ruch i odwrócenie wpisu dziennika przywracają stan, hasze i indeks ruchów"""
+    for seed in SEEDS:
+        game = GameLogic(seed, rules)
+        rng = random.Random(seed)
+        for _ in range(40):
+            before = state(game), game.position_hash(), game.canonical_hash(), sorted(game.legal_moves())
+            for move in game.legal_moves():
+                game.apply_move(move)
+                game.revert(game.history.pop())
+                after = state(game), game.position_hash(), game.canonical_hash(), sorted(game.legal_moves())
+                assert after == before, (seed, move)
+            play(game, 1, rng)
+
+
+@pytest.mark.parametrize('rules', VARIANTS, ids=lambda rules: rules.name)
+def test_move_index_matches_brute_force(rules):
+    for seed in SEEDS:
+        game = GameLogic(seed, rules)
+        rng = random.Random(seed)
+        for _ in range(60):
+            assert set(game.legal_moves()) == brute_force_moves(game), seed
+            assert game.hidden == [sum(not card.face_up for card in pile) for pile in game.tableau]
+            play(game, 1, rng)
+
+
+def test_incremental_hash_matches_recomputation():
+    for seed in SEEDS:
+        game = play(GameLogic(seed), 80, random.Random(seed))
+        fresh = game.clone()
+        fresh.reset_hash()
+        assert (fresh.position_hash(), fresh.canonical_hash()) == (game.position_hash(), game.canonical_hash())
+
+
+def test_canonical_hash_ignores_column_order():
+    game = play(GameLogic(3), 30, random.Random(3))
+    swapped = game.clone()
+    swapped.tableau[0], swapped.tableau[6] = swapped.tableau[6], swapped.tableau[0]
+    swapped.hidden[0], swapped.hidden[6] = swapped.hidden[6], swapped.hidden[0]
+    swapped.reset_hash()
+    assert swapped.canonical_hash() == game.canonical_hash()
+    assert swapped.canonical_state() == game.canonical_state()
+    assert swapped.position_hash() != game.position_hash()
+
+
+def test_hash_depends_on_passes_left():
+    """Ta sama pozycja z mniejszą liczbą odtworzeń talii to inna pozycja (tablice transpozycji solvera)"""
+    game = GameLogic(30, RULES['vegas3'])
+    weaker = game.clone()
+    weaker.passes_left -= 1
+    assert weaker.canonical_hash() != game.canonical_hash()
+    assert weaker.position_hash() != game.position_hash()
+    unlimited = GameLogic(30)
+    other = unlimited.clone()
+    other.passes_left -= 1  # Bez limitu (inf) liczba odtworzeń nie zmienia haszu
+    assert other.canonical_hash() == unlimited.canonical_hash()
+
+
+def test_undo_limit_and_restored_state():
+    game = GameLogic(7)
+    rng = random.Random(7)
+    states = []
+    for _ in range(UNDO_LIMIT + 2):
+        states.append(state(game))
+        legal = game.legal_moves()
+        game.apply_move(rng.choice(legal))
+    for undone in range(UNDO_LIMIT):
+        assert game.undo()
+        assert state(game) == states[-1 - undone]
+    assert not game.undo()
+    assert game.undo_count == 0
+
+
+def test_save_round_trip_and_truncated_file(tmp_path):
+    game = play(GameLogic(11, RULES['klondike3']), 50, random.Random(11))
+    path = str(tmp_path / 'autosave.psj')
+    save_game(path, game, 95)
+    restored, seconds = load_game(path)
+    assert seconds == 95
+    assert state(restored) == state(game)
+    assert restored.position_hash() == game.position_hash()
+    data = open(path, 'rb').read()
+    for size in (6, 10, 19, len(data) - 1):
+        with open(path, 'wb') as f:
+            f.write(data[:size])
+        with pytest.raises(ValueError):
+            load_game(path)
+
+
+@pytest.mark.parametrize('policy', ['greedy', 'random'])
+def test_batch_engine_matches_game_logic(policy):
+    pytest.importorskip('numpy')
+    from batch_engine import verify
+    assert verify(range(40), policy, 300) == []
@@ -0,0 +1,150 @@
+import os
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+from game_logic import SUITS, RANKS
+
+CARDS_DIR = "resources/cards"
+BACKGROUND_PATH = "resources/background.png"
+CARD_BACK = ('tył_karty', '')  # Dane wyświetlane dla zakrytej karty
+BACKGROUND = ('background', '')  # Klucz obrazka tła
+CARD_SIZE = (100, 145)  # Rozmiar karty w pikselach logicznych przy skali 1 (okno 1200 x 850)
+CARD_ASPECT = CARD_SIZE[1] / CARD_SIZE[0]
+SIZE_STEP = 10  # Szerokość karty zmienia się skokowo - drobna zmiana rozmiaru okna nie skaluje tekstur
+MIN_CARD_WIDTH = 60
+MAX_CARD_WIDTH = 200  # Szerokość obrazków źródłowych trzymanych w pamięci (każdy mniejszy rozmiar to szybkie skalowanie)
+ALL_FACES = [(suit, rank) for suit in SUITS for rank in RANKS] + [CARD_BACK]  # 52 karty + rewers
+
+
+def card_size_bucket(width):
+    """Szerokość karty zaokrąglona w dół do kubełka rozmiaru -> (szerokość, wysokość)"""
+    width = max(MIN_CARD_WIDTH, min(MAX_CARD_WIDTH, int(width) // SIZE_STEP * SIZE_STEP))
+    return width, round(width * CARD_ASPECT)
+
+
+def texture_path(card_data):
+    """Ścieżka do pliku z obrazkiem karty"""
+    card_type, card_value = card_data
+    if card_data == BACKGROUND:
+        return BACKGROUND_PATH
+    if card_type == CARD_BACK[0]:
+        return os.path.join(CARDS_DIR, "tył_karty.png")
+    return os.path.join(CARDS_DIR, f"{card_type}_{card_value}.png")
+
+
+# Wspólna dla całego procesu pamięć podręczna przeskalowanych tekstur kart
+class TextureCache:
+    def __init__(self):
+        # (card_data, rozmiar, gęstość pikseli) -> QPixmap (None, gdy brak pliku); tylko bieżący kubełek rozmiaru
+        self.pixmaps = {}
+        # card_data -> QImage w największym rozmiarze; z nich powstają tekstury po zmianie kubełka (bez odczytu z dysku)
+        self.masters = {}
+        self.background = None  # Obrazek tła (QPixmap) po wczytaniu
+        self.size = CARD_SIZE
+        self.device_pixel_ratio = 1.0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, card_data):
+        """Zwraca teksturę karty w bieżącym rozmiarze lub None, jeśli nie ma obrazka"""
+        key = (card_data, self.size, self.device_pixel_ratio)
+        try:
+            pixmap = self.pixmaps[key]
+            self.hits += 1
+            return pixmap
+        except KeyError:
+            self.misses += 1
+        pixmap = self.load(card_data)
+        self.pixmaps[key] = pixmap
+        return pixmap
+
+    def load(self, card_data):
+        """Skaluje teksturę z obrazka źródłowego (wczytywanego z dysku tylko za pierwszym razem)"""
+        if card_data not in self.masters:
+            self.masters[card_data] = self.decode_master(card_data, self.device_pixel_ratio)
+        master = self.masters[card_data]
+        if master is None:
+            return None
+        return QPixmap.fromImage(self.scale(master, self.size, self.device_pixel_ratio))
+
+    @staticmethod
+    def decode_master(card_data, device_pixel_ratio):
+        """Dekoduje obrazek i zmniejsza go do największego rozmiaru karty - bezpieczne również poza wątkiem interfejsu"""
+        path = texture_path(card_data)
+        if not os.path.exists(path):
+            return None
+        image = QImage(path)
+        if image.isNull():
+            return None
+        if card_data == BACKGROUND:  # Tło jest rozciągane przy rysowaniu, więc bez skalowania
+            return image
+        width, height = card_size_bucket(MAX_CARD_WIDTH)
+        return image.scaled(round(width * device_pixel_ratio), round(height * device_pixel_ratio),
+                            Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    @staticmethod
+    def scale(image, size, device_pixel_ratio):
+        width, height = size
+        scaled = image.scaled(round(width * device_pixel_ratio), round(height * device_pixel_ratio),
+                              Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        scaled.setDevicePixelRatio(device_pixel_ratio)
+        return scaled
+
+    def install(self, images, size, device_pixel_ratio):
+        """Zamienia obrazki wczytane w tle (obrazek źródłowy, tekstura) na QPixmap (tylko w wątku interfejsu)"""
+        master, image = images.pop(BACKGROUND, (None, None))
+        self.background = QPixmap.fromImage(image) if image is not None else None
+        if device_pixel_ratio != self.device_pixel_ratio:
+            return  # Obrazki w innej gęstości pikseli są bezużyteczne
+        for card_data, (master, image) in images.items():
+            self.masters[card_data] = master
+            if size == self.size:  # Tekstury w starym kubełku rozmiaru od razu by wypadły
+                self.pixmaps[(card_data, size, device_pixel_ratio)] = QPixmap.fromImage(image) if image is not None else None
+
+    def configure(self, size=None, device_pixel_ratio=None):
+        """Zmienia kubełek rozmiaru lub gęstość pikseli; zwraca True, jeśli tekstury zostały unieważnione"""
+        size = size or self.size
+        device_pixel_ratio = device_pixel_ratio or self.device_pixel_ratio
+        if size == self.size and device_pixel_ratio == self.device_pixel_ratio:
+            return False
+        if device_pixel_ratio != self.device_pixel_ratio:
+            self.masters.clear()  # Obrazki źródłowe muszą mieć rozdzielczość nowego ekranu
+        self.size = size
+        self.device_pixel_ratio = device_pixel_ratio
+        self.pixmaps.clear()  # Tekstury poprzedniego kubełka - nowe powstają leniwie, przy pierwszym get()
+        return True
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'cached': len(self.pixmaps), 'masters': len(self.masters),
+                'size': self.size, 'device_pixel_ratio': self.device_pixel_ratio}
+
+
+# Wczytywanie tła i tekstur kart w wątku roboczym (np. podczas ekranu startowego)
+class AssetLoader(QThread):
+    progress = pyqtSignal(int, int)  # (wczytane, wszystkie)
+    assets_loaded = pyqtSignal(dict)  # card_data -> (obrazek źródłowy, tekstura) jako QImage
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.size = cache.size
+        self.device_pixel_ratio = cache.device_pixel_ratio
+
+    def run(self):
+        jobs = [BACKGROUND] + ALL_FACES
+        images = {}
+        for done, card_data in enumerate(jobs, 1):
+            master = self.cache.decode_master(card_data, self.device_pixel_ratio)
+            image = master
+            if master is not None and card_data != BACKGROUND:
+                image = self.cache.scale(master, self.size, self.device_pixel_ratio)
+            images[card_data] = (master, image)
+            self.progress.emit(done, len(jobs))
+        self.assets_loaded.emit(images)
+
+    def install(self, images):
+        """Przekazuje wczytane obrazki do pamięci podręcznej (wywoływane w wątku interfejsu)"""
+        self.cache.install(images, self.size, self.device_pixel_ratio)
+
+
+texture_cache = TextureCache()
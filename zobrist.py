@@ -0,0 +1,57 @@
+import random
+from collections import OrderedDict
+
+MASK64 = (1 << 64) - 1
+MAX_COLUMN = 20  # Najdłuższa możliwa kolumna: 6 zakrytych kart + 13 odkrytych
+
+# Stałe losowe klucze (stałe ziarno - hasz tej samej pozycji jest taki sam w każdym procesie)
+_rng = random.Random(0x5EED)
+STOCK_KEYS = [[_rng.getrandbits(64) for _ in range(52)] for _ in range(52)]  # [pozycja][kod karty]
+WASTE_KEYS = [[_rng.getrandbits(64) for _ in range(52)] for _ in range(52)]  # [pozycja][kod karty]
+FOUNDATION_KEYS = [_rng.getrandbits(64) for _ in range(52)]  # [kod karty] - pozycja wynika z wartości
+TABLEAU_KEYS = [[_rng.getrandbits(64) for _ in range(104)] for _ in range(MAX_COLUMN)]  # [pozycja][kod * 2 + odkryta]
+COLUMN_SALTS = [_rng.getrandbits(64) for _ in range(7)]  # Rozróżnienie kolumn w dokładnym haszu
+MAX_PASSES = 16  # Limit odtworzeń talii rozróżniany w haszu (warianty mają co najwyżej kilka)
+PASSES_KEYS = [_rng.getrandbits(64) for _ in range(MAX_PASSES)]  # [pozostałe odtworzenia talii]
+del _rng
+
+
+def mix64(value):
+    """Mieszanie 64-bitowe (splitmix64) - haszy kolumn nie można łączyć samym XOR"""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+# Ograniczona pamięć podręczna LRU ocen pozycji (klucz: hasz pozycji z GameLogic)
+class PositionCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)  # Usunięcie najdawniej używanej pozycji
+
+    def clear(self):
+        self.entries.clear()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)